@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Macro Fetch Concurrency Check - Run MacroAnalyzer fetches against a local stub server.
+
+Every HTTP request made through MacroAnalyzer's shared session is redirected to
+a stub server on localhost that answers slowly (one host very slowly), so the
+check runs offline and shows:
+- concurrent fetching takes about one slow response instead of the sum of them
+- an indicator exceeding its deadline is reported as a timed-out error
+"""
+
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from requests.adapters import HTTPAdapter
+
+from src.investment_optimization.macro_analyzer import MacroAnalyzer
+
+STUB_DELAY = 0.5      # Seconds per stub response
+HANG_DELAY = 5.0      # Response time of the "hanging" endpoint
+HANG_HOST = 'api.alternative.me'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every request with 503 after STUB_DELAY (HANG_DELAY for the hanging host)."""
+
+    def do_GET(self):
+        time.sleep(HANG_DELAY if self.headers.get('X-Original-Host') == HANG_HOST else STUB_DELAY)
+        body = b'{"error": "stub"}'
+        self.send_response(503)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubRedirectAdapter(HTTPAdapter):
+    """Sends every request to the stub server, keeping the original host in a header."""
+
+    def __init__(self, stub_netloc: str, **kwargs):
+        self.stub_netloc = stub_netloc
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.headers['X-Original-Host'] = parts.hostname or ''
+        request.url = urlunsplit(('http', self.stub_netloc, parts.path or '/', parts.query, ''))
+        return super().send(request, **kwargs)
+
+
+def _analyzer(stub_netloc: str) -> MacroAnalyzer:
+    analyzer = MacroAnalyzer(cache_path='/tmp/macro_stub_cache.json',
+                             manual_inputs_path='/tmp/macro_stub_manual_inputs.json')
+    analyzer.fred_api_key = 'stub'
+    adapter = StubRedirectAdapter(stub_netloc, pool_maxsize=analyzer.MAX_FETCH_WORKERS)
+    analyzer.http.mount('http://', adapter)
+    analyzer.http.mount('https://', adapter)
+    return analyzer
+
+
+def run_check() -> bool:
+    """Compare sequential and concurrent fetch times against the stub server."""
+    print("\n" + "=" * 70)
+    print("  MACRO FETCH CONCURRENCY CHECK (local stub server)")
+    print("=" * 70 + "\n")
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub_netloc = f"127.0.0.1:{server.server_address[1]}"
+    analyzer = _analyzer(stub_netloc)
+
+    tasks = {
+        'shiller_pe': analyzer._fetch_shiller_pe,
+        'fear_greed': analyzer._fetch_fear_greed,
+        'vix': analyzer._fetch_vix,
+        'gvz': analyzer._fetch_gvz,
+        'btc_volatility': analyzer._fetch_btc_volatility,
+        'btc_dominance': analyzer._fetch_btc_dominance,
+    }
+    ok = True
+
+    print("📊 Step 1: Sequential vs concurrent fetch...")
+    start = time.perf_counter()
+    sequential = {key: fetch() for key, fetch in tasks.items()}
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arrivals = []
+    concurrent = analyzer._fetch_concurrently(tasks, on_result=lambda key, result: arrivals.append(key))
+    concurrent_time = time.perf_counter() - start
+
+    same_status = all(sequential[key]['status'] == concurrent[key]['status'] for key in tasks)
+    print(f"   sequential {sequential_time:.2f}s, concurrent {concurrent_time:.2f}s "
+          f"({len(arrivals)} results streamed, statuses match: {same_status})")
+    ok &= same_status and concurrent_time < sequential_time
+
+    print("\n📊 Step 2: Per-indicator deadline...")
+    start = time.perf_counter()
+    results = analyzer._fetch_concurrently(
+        {'crypto_fear_greed': analyzer._fetch_crypto_fear_greed, 'vix': analyzer._fetch_vix},
+        deadlines={'crypto_fear_greed': 1.0}
+    )
+    elapsed = time.perf_counter() - start
+    timed_out = results['crypto_fear_greed']['error_message'] == 'Timed out after 1.0s'
+    print(f"   hanging indicator: {results['crypto_fear_greed']['error_message']!r}, "
+          f"other: {results['vix']['status']}, returned after {elapsed:.2f}s")
+    ok &= timed_out and elapsed < HANG_DELAY
+
+    server.shutdown()
+    print("\n" + ("✅ CHECK OK" if ok else "❌ CHECK FAILED"))
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_check() else 1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Monetary Cleaning Parity Test - Compare vectorized vs scalar monetary parsing.
+
+This script validates that cleaners.clean_monetary_series produces exactly the
+same floats as Series.apply(clean_monetary_value), on generated edge cases and
+on every object/string column of the configured Excel sources, and that it is
+no slower than the scalar path on numeric-string columns.
+"""
+
+import sys
+import os
+import time
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager.cleaners import clean_monetary_value, clean_monetary_series
+
+EDGE_CASES = [
+    '¥1,234.56', '(984.72)', '¥(1,000)', ' 12 ', '-', '', '  ', '(', '()', '(-)', '-5', '+5',
+    '1e5', '1E-3', '.5', '5.', 'nan', 'NaN', 'inf', '-Infinity', '1_000', '１２３', '１,２３４',
+    '$100', 'N/A', 'abc', '( 5 )', '0', '-0', '(0)', '12.345.6', '1,2,3', '¥',
+    None, np.nan, pd.NaT, pd.NA, 0, 7, -3, True, False, 1.5, float('inf'), np.float64(2.5),
+    np.int64(9), pd.Timestamp('2024-01-31'),
+]
+
+
+def _same(expected: pd.Series, actual: pd.Series) -> bool:
+    """Bitwise comparison that treats NaN == NaN."""
+    exp = expected.to_numpy(dtype=float)
+    act = actual.to_numpy(dtype=float)
+    return bool(np.array_equal(exp, act, equal_nan=True)) and expected.index.equals(actual.index)
+
+
+def _check(label: str, values: pd.Series) -> bool:
+    start = time.perf_counter()
+    expected = values.apply(clean_monetary_value).astype(float)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = clean_monetary_series(values)
+    vector_time = time.perf_counter() - start
+
+    if _same(expected, actual):
+        print(f"   ✅ {label}: {len(values)} values match "
+              f"(scalar {scalar_time * 1000:.1f} ms, vectorized {vector_time * 1000:.1f} ms)")
+        return True
+
+    mismatch = ~np.isclose(expected.to_numpy(dtype=float), actual.to_numpy(dtype=float), equal_nan=True, rtol=0, atol=0)
+    print(f"   ❌ {label}: {int(mismatch.sum())} mismatches")
+    for raw, exp, act in list(zip(values[mismatch], expected[mismatch], actual[mismatch]))[:10]:
+        print(f"      {raw!r}: scalar={exp!r} vectorized={act!r}")
+    return False
+
+
+def _generated_column(rng: np.random.Generator, size: int) -> pd.Series:
+    """Mixed column resembling hand-maintained Excel sheets."""
+    amounts = rng.standard_normal(size) * 10.0 ** rng.integers(-2, 8, size)
+    formats = rng.integers(0, 7, size)
+    values = []
+    for amount, fmt in zip(amounts, formats):
+        if fmt == 0:
+            values.append(float(amount))
+        elif fmt == 1:
+            values.append(f"¥{amount:,.2f}")
+        elif fmt == 2:
+            values.append(f"({abs(amount):,.2f})")
+        elif fmt == 3:
+            values.append(repr(float(amount)))
+        elif fmt == 4:
+            values.append(np.nan)
+        elif fmt == 5:
+            values.append(int(amount))
+        else:
+            values.append(EDGE_CASES[int(abs(amount)) % len(EDGE_CASES)])
+    return pd.Series(values, dtype=object)
+
+
+def _benchmark(label: str, values: pd.Series, repeat: int = 3) -> bool:
+    """Best-of-`repeat` timings: the vectorized path must not be slower than apply."""
+    if not _check(label, values):
+        return False
+
+    def best(func) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    scalar_time = best(lambda: values.apply(clean_monetary_value))
+    vector_time = best(lambda: clean_monetary_series(values))
+    ok = vector_time <= scalar_time
+    print(f"   {'✅' if ok else '❌'} {label} benchmark: scalar {scalar_time * 1000:.1f} ms, "
+          f"vectorized {vector_time * 1000:.1f} ms ({scalar_time / vector_time:.1f}x)")
+    return ok
+
+
+def run_parity_test() -> bool:
+    """Compare vectorized and scalar monetary cleaning."""
+    print("\n" + "=" * 70)
+    print("  MONETARY CLEANING PARITY TEST: clean_monetary_series vs apply")
+    print("=" * 70 + "\n")
+
+    results = []
+
+    print("📊 Step 1: Edge cases and generated columns...")
+    edge = pd.Series(EDGE_CASES, dtype=object)
+    results.append(_check("edge cases", edge))
+    results.append(_check("edge cases (string dtype)", pd.Series([v for v in EDGE_CASES if isinstance(v, str)], dtype='string')))
+    results.append(_check("float column", pd.Series([1.0, np.nan, -2.5])))
+    results.append(_check("int column", pd.Series([1, 2, -3])))
+    rng = np.random.default_rng(42)
+    results.append(_check("generated mixed column", _generated_column(rng, 200_000)))
+
+    print("\n📊 Step 2: Benchmarks on numeric-string columns...")
+    amounts = rng.standard_normal(200_000) * 10.0 ** rng.integers(-2, 8, 200_000)
+    results.append(_benchmark("plain numeric strings", pd.Series([repr(float(a)) for a in amounts], dtype=object)))
+    results.append(_benchmark("formatted amounts", pd.Series([f"¥{a:,.2f}" for a in amounts], dtype=object)))
+    results.append(_benchmark("generated mixed column", _generated_column(rng, 200_000)))
+
+    print("\n📊 Step 3: Columns of the configured Excel sources...")
+    try:
+        from src.data_manager import readers
+        settings = readers.load_settings(os.path.join(project_root, 'config', 'settings.yaml'))
+        raw = readers.read_sources(settings, list(readers.SOURCE_READERS))
+        for source, frames in raw.items():
+            for sheet, df in (frames or {}).items():
+                if df is None:
+                    continue
+                for col in df.columns:
+                    if pd.api.types.is_object_dtype(df[col].dtype) or pd.api.types.is_string_dtype(df[col].dtype):
+                        results.append(_check(f"{source}/{sheet}/{col}", df[col]))
+    except Exception as e:
+        print(f"   ⚠️  Skipped source files: {e}")
+
+    passed = all(results)
+    print("\n" + ("✅ PARITY OK" if passed else "❌ PARITY FAILED") + f" ({sum(results)}/{len(results)} checks)")
+    return passed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_parity_test() else 1)
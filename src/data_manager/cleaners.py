@@ -354,6 +354,73 @@ def clean_monetary_value(value: Any) -> Optional[float]:
     return 0.0
 
 
+# A plain decimal number once ¥, separators and parentheses are gone (ASCII digits only)
+_PLAIN_NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+
+
+def clean_monetary_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized clean_monetary_value for a whole column.
+
+    Returns exactly values.apply(clean_monetary_value): ¥ and thousands separators
+    are stripped with Series.str operations, '(x)' becomes -x, blanks and '-'
+    become 0.0, and plain decimal numbers are converted with float() semantics.
+    Only the rest (e.g. full-width digits, text, 'nan') goes through
+    clean_monetary_value itself.
+
+    Args:
+        values: Raw column (object, string or numeric dtype)
+
+    Returns:
+        float64 Series with the same index
+    """
+    if pd.api.types.is_bool_dtype(values.dtype) or (
+        pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_complex_dtype(values.dtype)
+    ):
+        return values.astype(float).fillna(0.0)
+    if not (pd.api.types.is_object_dtype(values.dtype) or pd.api.types.is_string_dtype(values.dtype)):
+        # Dates, categoricals etc.: rare here, keep the scalar path
+        return values.apply(clean_monetary_value).astype(float)
+
+    result = np.full(len(values), np.nan)
+    missing = values.isna().to_numpy()
+    result[missing] = 0.0
+
+    # .str methods would also call replace()/strip() on other objects (e.g. Timestamp)
+    if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+        is_string = ~missing
+    else:
+        is_string = np.fromiter((type(value) is str for value in values.to_numpy(dtype=object)),
+                                dtype=bool, count=len(values))
+
+    if is_string.any():
+        strings = values[is_string].astype('string[pyarrow]')
+        cleaned = strings.str.replace('¥', '', regex=False).str.replace(',', '', regex=False).str.strip()
+        negative = (cleaned.str.startswith('(') & cleaned.str.endswith(')')).to_numpy(dtype=bool)
+        body = cleaned.mask(negative, cleaned.str.slice(1, -1))
+        # pd.to_numeric is not correctly rounded, so plain numbers are cast from str
+        # (float() semantics) and everything else is left to the scalar path
+        plain = body.str.fullmatch(_PLAIN_NUMBER).to_numpy(dtype=bool)
+        parsed = np.full(len(body), np.nan)
+        parsed[plain] = body[plain].to_numpy(dtype=object).astype(float)
+        parsed[cleaned.isin(['', '-']).to_numpy()] = 0.0
+        result[is_string] = np.where(negative, -parsed, parsed)
+
+    # ints/floats (incl. NumPy scalars and bools) pass through as float
+    other = ~is_string & ~missing
+    if other.any():
+        others = values[other]
+        if pd.api.types.infer_dtype(others, skipna=False) in ('integer', 'floating', 'mixed-integer-float', 'boolean'):
+            result[other] = others.to_numpy(dtype=float)
+
+    # Whatever is still unresolved (other strings and types) takes the scalar path
+    unresolved = np.isnan(result)
+    if unresolved.any():
+        result[unresolved] = values[unresolved].map(clean_monetary_value).to_numpy(dtype=float)
+
+    return pd.Series(result, index=values.index, name=values.name)
+
+
 
 def standardize_date_index(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     """
@@ -559,7 +626,7 @@ def clean_dataframe_core(
 
                 # Object type - clean and convert to numeric
                 elif pd.api.types.is_object_dtype(df.dtypes[col]):
-                    cleaned_col = df[col].apply(clean_monetary_value)
+                    cleaned_col = clean_monetary_series(df[col])
                     numeric_col = pd.to_numeric(cleaned_col, errors='coerce')
 
                     # Only convert if majority of values are valid numbers
@@ -1014,7 +1081,7 @@ def transform_insurance_premiums(df_raw: pd.DataFrame, config: Dict[str, Any]) -
     df_long = df_long.rename(columns={date_col: 'Transaction_Date'})
 
     # Clean the amount
-    df_long['Amount_Gross'] = df_long['Source_Amount'].apply(clean_monetary_value)
+    df_long['Amount_Gross'] = clean_monetary_series(df_long['Source_Amount'])
 
     # Filter out zero amount records
     original_rows = len(df_long)
@@ -1139,7 +1206,7 @@ def process_raw_holdings(raw_df: pd.DataFrame) -> Optional[pd.DataFrame]:
             if col in df.columns:
                 try:
                     # Handle various formats and clean monetary values
-                    df[col] = df[col].apply(lambda x: clean_monetary_value(x) if pd.notna(x) else 0.0)
+                    df[col] = clean_monetary_series(df[col])
                     invalid_count = (df[col] == 0.0).sum()
                     if invalid_count > 0:
                         # Use INFO for Commission_Fee since zero fees are normal
@@ -1299,7 +1366,7 @@ def process_raw_transactions(raw_df: pd.DataFrame) -> Optional[pd.DataFrame]:
             if col in df.columns:
                 try:
                     # Handle various formats and clean monetary values
-                    df[col] = df[col].apply(lambda x: clean_monetary_value(x) if pd.notna(x) else 0.0)
+                    df[col] = clean_monetary_series(df[col])
                     invalid_count = (df[col] == 0.0).sum()
                     if invalid_count > 0:
                         # Use INFO for Commission_Fee since zero fees are normal
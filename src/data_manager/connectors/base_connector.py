@@ -17,6 +17,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from .utils import RateLimiter
+
 
 class ConnectorType(Enum):
     """Types of data source connectors."""
@@ -186,6 +188,8 @@ class BaseConnector(ABC):
         self.config = config
         self._authenticated = False
         self._last_request_time: Optional[datetime] = None
+        # Waited on before every API request (subclasses create their own; None = unlimited)
+        self.rate_limiter: Optional[RateLimiter] = None
 
     @property
     def is_authenticated(self) -> bool:
@@ -304,6 +308,27 @@ class BaseConnector(ABC):
         self._authenticated = False
         return True
 
+    def set_rate_limit(self, calls_per_minute: Optional[float]) -> None:
+        """
+        Replace the connector's request rate limit (None disables it).
+
+        Used by ImportOrchestrator to apply the configured per-source rate. The
+        per-second spacing of an existing limiter is kept.
+        """
+        if calls_per_minute is None:
+            self.rate_limiter = None
+            return
+        if self.rate_limiter is not None:
+            calls_per_second = self.rate_limiter.calls_per_second
+        else:
+            calls_per_second = max(1.0, calls_per_minute / 60.0)
+        self.rate_limiter = RateLimiter(calls_per_minute=calls_per_minute, calls_per_second=calls_per_second)
+
+    def _throttle(self) -> None:
+        """Wait for the connector's rate limiter (if any) before an API request."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+
     def _validate_config(self, required_keys: List[str]) -> None:
         """
         Helper to validate required config keys are present.
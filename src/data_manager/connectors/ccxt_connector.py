@@ -152,7 +152,9 @@ class CCXTConnector(BaseConnector):
 
         self.exchanges: Dict[str, Any] = {}  # exchange_id -> ccxt.Exchange
         self.cache = ResponseCache(ttl_seconds=config.get('cache_ttl', 300))
+        # One limiter per exchange; the per-minute rate is shared (see set_rate_limit)
         self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._calls_per_minute: Optional[float] = self.metadata.rate_limit_per_minute
 
     def authenticate(self) -> Tuple[bool, str]:
         """
@@ -238,19 +240,20 @@ class CCXTConnector(BaseConnector):
         # Instantiate exchange
         exchange = exchange_class(config)
 
+        # Create rate limiter for this exchange
+        rate_limit = self.EXCHANGE_CONFIGS.get(exchange_id, {}).get('rateLimit', 1000)
+        calls_per_second = 1000 / rate_limit if rate_limit > 0 else 1
+        self._rate_limiters[exchange_id] = RateLimiter(
+            calls_per_minute=self._calls_per_minute or self.metadata.rate_limit_per_minute,
+            calls_per_second=calls_per_second
+        )
+
         # Test connection by fetching balance
         try:
+            self._throttle(exchange_id)
             balance = exchange.fetch_balance()
             self.exchanges[exchange_id] = exchange
 
-            # Create rate limiter for this exchange
-            rate_limit = self.EXCHANGE_CONFIGS.get(exchange_id, {}).get('rateLimit', 1000)
-            calls_per_second = 1000 / rate_limit if rate_limit > 0 else 1
-            self._rate_limiters[exchange_id] = RateLimiter(
-                calls_per_minute=60,
-                calls_per_second=calls_per_second
-            )
-
             logger.info(f"Successfully authenticated with {exchange_id}")
             return True, "OK"
 
@@ -307,12 +310,9 @@ class CCXTConnector(BaseConnector):
         if cached is not None:
             return cached
 
-        # Apply rate limiting
-        if exchange_id in self._rate_limiters:
-            self._rate_limiters[exchange_id].wait()
-
         # Fetch balance
         try:
+            self._throttle(exchange_id)
             balance = exchange.fetch_balance()
         except ccxt.RateLimitExceeded as e:
             raise RateLimitError(f"Rate limit exceeded: {e}", retry_after=60)
@@ -359,6 +359,7 @@ class CCXTConnector(BaseConnector):
             for quote in ['USDT', 'USD', 'BUSD', 'USDC']:
                 pair = f"{symbol}/{quote}"
                 if pair in exchange.markets:
+                    self._throttle(exchange.id)
                     ticker = exchange.fetch_ticker(pair)
                     return ticker.get('last') or ticker.get('close')
 
@@ -431,13 +432,10 @@ class CCXTConnector(BaseConnector):
         exchange = self.exchanges[exchange_id]
         transactions = []
 
-        # Apply rate limiting
-        if exchange_id in self._rate_limiters:
-            self._rate_limiters[exchange_id].wait()
-
         try:
             # Fetch trades
             if exchange.has.get('fetchMyTrades'):
+                self._throttle(exchange_id)
                 trades = exchange.fetch_my_trades(since=since_ts, limit=1000)
                 for trade in trades:
                     symbol = trade['symbol'].split('/')[0] if trade.get('symbol') else 'UNKNOWN'
@@ -458,6 +456,7 @@ class CCXTConnector(BaseConnector):
             # Fetch deposits
             if exchange.has.get('fetchDeposits'):
                 try:
+                    self._throttle(exchange_id)
                     deposits = exchange.fetch_deposits(since=since_ts, limit=500)
                     for deposit in deposits:
                         if deposit.get('status') == 'ok':
@@ -481,6 +480,7 @@ class CCXTConnector(BaseConnector):
             # Fetch withdrawals
             if exchange.has.get('fetchWithdrawals'):
                 try:
+                    self._throttle(exchange_id)
                     withdrawals = exchange.fetch_withdrawals(since=since_ts, limit=500)
                     for withdrawal in withdrawals:
                         if withdrawal.get('status') == 'ok':
@@ -531,6 +531,27 @@ class CCXTConnector(BaseConnector):
 
         return accounts
 
+    def set_rate_limit(self, calls_per_minute: Optional[float]) -> None:
+        """
+        Apply a per-minute rate to every exchange (None disables limiting).
+
+        Each exchange keeps its own limiter and per-second spacing.
+        """
+        self._calls_per_minute = calls_per_minute
+        if calls_per_minute is None:
+            return
+        for exchange_id, limiter in list(self._rate_limiters.items()):
+            self._rate_limiters[exchange_id] = RateLimiter(
+                calls_per_minute=calls_per_minute,
+                calls_per_second=limiter.calls_per_second
+            )
+
+    def _throttle(self, exchange_id: Optional[str] = None) -> None:
+        """Wait for the exchange's rate limiter (if any) before an API request."""
+        limiter = self._rate_limiters.get(exchange_id)
+        if limiter is not None and self._calls_per_minute is not None:
+            limiter.wait()
+
     def health_check(self) -> Tuple[bool, str]:
         """Check if all exchanges are accessible."""
         if not self.exchanges:
@@ -137,6 +137,7 @@ class IBKRConnector(BaseConnector):
         # Test connection and get accounts
         try:
             # First, check if gateway is accessible
+            self._throttle()
             response = self._session.get(
                 urljoin(self.gateway_url, '/v1/api/iserver/auth/status'),
                 verify=self.verify_ssl,
@@ -151,6 +152,7 @@ class IBKRConnector(BaseConnector):
                 return False, "Gateway not authenticated. Please login via IB Gateway first."
 
             # Get linked accounts
+            self._throttle()
             accounts_response = self._session.get(
                 urljoin(self.gateway_url, '/v1/api/portfolio/accounts'),
                 verify=self.verify_ssl,
@@ -214,9 +216,8 @@ class IBKRConnector(BaseConnector):
         if cached is not None:
             return cached
 
-        self.rate_limiter.wait()
-
         try:
+            self._throttle()
             response = self._session.get(
                 urljoin(self.gateway_url, f'/v1/api/portfolio/{account_id}/positions/0'),
                 verify=self.verify_ssl,
@@ -296,8 +297,6 @@ class IBKRConnector(BaseConnector):
         until_date: Optional[datetime] = None
     ) -> Optional[pd.DataFrame]:
         """Fetch transactions for a single account."""
-        self.rate_limiter.wait()
-
         # Default date range
         if until_date is None:
             until_date = datetime.now()
@@ -307,6 +306,7 @@ class IBKRConnector(BaseConnector):
         try:
             # IBKR uses flex queries for historical data
             # For real-time, we use the orders endpoint
+            self._throttle()
             response = self._session.get(
                 urljoin(self.gateway_url, f'/v1/api/iserver/account/trades'),
                 params={
@@ -358,6 +358,7 @@ class IBKRConnector(BaseConnector):
         accounts_info = {}
         for account_id in self.accounts:
             try:
+                self._throttle()
                 response = self._session.get(
                     urljoin(self.gateway_url, f'/v1/api/portfolio/{account_id}/meta'),
                     verify=self.verify_ssl,
@@ -383,6 +384,7 @@ class IBKRConnector(BaseConnector):
             return False, "Not authenticated"
 
         try:
+            self._throttle()
             response = self._session.get(
                 urljoin(self.gateway_url, '/v1/api/iserver/auth/status'),
                 verify=self.verify_ssl,
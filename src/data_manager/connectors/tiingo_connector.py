@@ -112,6 +112,7 @@ class TiingoConnector(BaseConnector):
 
         # Test API key with a simple request
         try:
+            self._throttle()
             response = self._session.get(
                 f"{self.BASE_URL}/api/test",
                 timeout=10
@@ -157,9 +158,6 @@ class TiingoConnector(BaseConnector):
         if cached is not None:
             return cached
 
-        # Apply rate limiting
-        self.rate_limiter.wait()
-
         # Determine if crypto or stock
         if self._is_crypto(symbol):
             price = self._get_crypto_price(symbol)
@@ -177,6 +175,7 @@ class TiingoConnector(BaseConnector):
             raise DataFetchError("Not authenticated")
 
         try:
+            self._throttle()
             response = self._session.get(
                 f"{self.IEX_URL}/{symbol}",
                 timeout=10
@@ -208,6 +207,7 @@ class TiingoConnector(BaseConnector):
             normalized = f"{normalized}usd"
 
         try:
+            self._throttle()
             response = self._session.get(
                 f"{self.CRYPTO_URL}/prices",
                 params={'tickers': normalized},
@@ -258,9 +258,6 @@ class TiingoConnector(BaseConnector):
         if start_date is None:
             start_date = end_date - timedelta(days=365)
 
-        # Apply rate limiting
-        self.rate_limiter.wait()
-
         try:
             if self._is_crypto(symbol):
                 return self._get_crypto_history(symbol, start_date, end_date)
@@ -279,6 +276,7 @@ class TiingoConnector(BaseConnector):
         frequency: str
     ) -> Optional[pd.DataFrame]:
         """Get historical stock prices."""
+        self._throttle()
         response = self._session.get(
             f"{self.BASE_URL}/tiingo/daily/{symbol}/prices",
             params={
@@ -311,6 +309,7 @@ class TiingoConnector(BaseConnector):
         if not normalized.endswith('usd'):
             normalized = f"{normalized}usd"
 
+        self._throttle()
         response = self._session.get(
             f"{self.CRYPTO_URL}/prices",
             params={
@@ -349,9 +348,8 @@ class TiingoConnector(BaseConnector):
         if not self._session:
             return []
 
-        self.rate_limiter.wait()
-
         try:
+            self._throttle()
             response = self._session.get(
                 f"{self.BASE_URL}/tiingo/utilities/search/{query}",
                 params={'limit': limit},
@@ -380,9 +378,8 @@ class TiingoConnector(BaseConnector):
         if not self._session:
             return None
 
-        self.rate_limiter.wait()
-
         try:
+            self._throttle()
             response = self._session.get(
                 f"{self.BASE_URL}/tiingo/fundamentals/{symbol}/daily",
                 timeout=10
@@ -414,6 +411,7 @@ class TiingoConnector(BaseConnector):
             return False, "Not authenticated"
 
         try:
+            self._throttle()
             response = self._session.get(f"{self.BASE_URL}/api/test", timeout=5)
             if response.status_code == 200:
                 return True, "Tiingo API healthy"
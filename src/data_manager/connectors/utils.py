@@ -11,6 +11,7 @@ API interactions and respect provider rate limits.
 import hashlib
 import json
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
 from functools import wraps
@@ -24,7 +25,8 @@ class RateLimiter:
     Rate limiter for API calls.
 
     Tracks call frequency and blocks when limits are exceeded to prevent
-    API rate limit errors.
+    API rate limit errors. Safe to share between threads: concurrent callers
+    queue for their slots.
 
     Example:
         limiter = RateLimiter(calls_per_minute=60, calls_per_second=1.0)
@@ -53,9 +55,11 @@ class RateLimiter:
             calls_per_second: Minimum seconds between calls (default 1.0)
         """
         self.calls_per_minute = calls_per_minute
+        self.calls_per_second = calls_per_second
         self.min_interval = max(1.0 / calls_per_second, 60.0 / calls_per_minute)
         self.last_call_time: Optional[float] = None
         self.call_times: list = []
+        self._lock = threading.Lock()
 
     def wait(self) -> float:
         """
@@ -64,39 +68,42 @@ class RateLimiter:
         Returns:
             Actual wait time in seconds (0 if no wait needed)
         """
-        now = time.time()
-        total_wait = 0.0
-
-        # Clean old call times (older than 1 minute)
-        self.call_times = [t for t in self.call_times if now - t < 60]
-
-        # Check per-minute limit
-        if len(self.call_times) >= self.calls_per_minute:
-            sleep_time = 60 - (now - self.call_times[0])
-            if sleep_time > 0:
-                logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s (minute limit)")
-                time.sleep(sleep_time)
-                total_wait += sleep_time
-                now = time.time()
-
-        # Check per-call interval
-        if self.last_call_time:
-            elapsed = now - self.last_call_time
-            if elapsed < self.min_interval:
-                sleep_time = self.min_interval - elapsed
-                logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s (interval)")
-                time.sleep(sleep_time)
-                total_wait += sleep_time
-
-        self.last_call_time = time.time()
-        self.call_times.append(self.last_call_time)
-
-        return total_wait
+        # Held while sleeping, so concurrent callers take consecutive slots
+        with self._lock:
+            now = time.time()
+            total_wait = 0.0
+
+            # Clean old call times (older than 1 minute)
+            self.call_times = [t for t in self.call_times if now - t < 60]
+
+            # Check per-minute limit
+            if len(self.call_times) >= self.calls_per_minute:
+                sleep_time = 60 - (now - self.call_times[0])
+                if sleep_time > 0:
+                    logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s (minute limit)")
+                    time.sleep(sleep_time)
+                    total_wait += sleep_time
+                    now = time.time()
+
+            # Check per-call interval
+            if self.last_call_time:
+                elapsed = now - self.last_call_time
+                if elapsed < self.min_interval:
+                    sleep_time = self.min_interval - elapsed
+                    logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s (interval)")
+                    time.sleep(sleep_time)
+                    total_wait += sleep_time
+
+            self.last_call_time = time.time()
+            self.call_times.append(self.last_call_time)
+
+            return total_wait
 
     def reset(self) -> None:
         """Reset rate limiter state."""
-        self.last_call_time = None
-        self.call_times = []
+        with self._lock:
+            self.last_call_time = None
+            self.call_times = []
 
 
 class ResponseCache:
@@ -8,6 +8,7 @@ Author: Ray's Personal Investment System
 Date: November 5, 2025
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional, Tuple, Any
 import logging
@@ -441,7 +442,165 @@ class CurrencyConverterService:
         converted = amount * rate
         logger.debug(f"Converted {amount} {from_currency} to {converted:.2f} {to_currency} (rate: {rate})")
         return converted
-    
+
+    def convert_series(self, amounts, currencies, dates, target: str = 'CNY') -> pd.Series:
+        """
+        Convert many amounts at once, each at its own currency and date.
+
+        Rates are resolved with get_historical_rates (same sources and precedence
+        as get_historical_rate, one lookup per distinct currency/date).
+
+        Args:
+            amounts: Amounts to convert (Series keeps its index and name)
+            currencies: Source currency per amount, or one currency code for all
+            dates: Conversion date per amount
+            target: Target currency code
+
+        Returns:
+            Series of converted amounts; zero amounts stay 0.0 and amounts without
+            an available rate are NaN
+        """
+        amounts = amounts if isinstance(amounts, pd.Series) else pd.Series(amounts)
+        values = pd.to_numeric(amounts, errors='coerce').to_numpy(dtype=float)
+        rates = self.get_historical_rates(currencies, dates, target, size=len(values))
+
+        converted = values * rates
+        converted[values == 0] = 0.0
+        return pd.Series(converted, index=amounts.index, name=amounts.name)
+
+    def get_historical_rates(self, from_currencies, dates, to_currency: str, size: Optional[int] = None) -> np.ndarray:
+        """
+        Vectorized get_historical_rate for arrays of currencies and dates.
+
+        Excel rates for historical dates (or with prefer_excel) are matched in one
+        merge_asof over the sorted rate table (nearest date within ±30 days). Recent
+        dates, which may use Google Finance, go through get_historical_rate.
+        Resolved rates are stored in the same cache as single lookups.
+
+        Args:
+            from_currencies: Source currency per row, or one code for all rows
+            dates: Date per row
+            to_currency: Target currency code
+            size: Number of rows (only needed to broadcast scalar inputs)
+
+        Returns:
+            Array of rates, NaN where no rate is available
+        """
+        if isinstance(dates, (str, pd.Timestamp)) or not hasattr(dates, '__len__'):
+            dates = [dates] * (size if size is not None else 1)
+        dates = pd.DatetimeIndex(pd.to_datetime(np.asarray(dates), errors='coerce'))
+        n = len(dates)
+        if isinstance(from_currencies, str) or not hasattr(from_currencies, '__len__'):
+            currencies = np.full(n, from_currencies, dtype=object)
+        else:
+            currencies = np.asarray(from_currencies, dtype=object)
+
+        rates = np.full(n, np.nan)
+        rates[currencies == to_currency] = 1.0
+
+        for currency in pd.unique(currencies):
+            if currency == to_currency or not isinstance(currency, str):
+                continue
+            rows = np.flatnonzero((currencies == currency) & ~dates.isna())
+            if rows.size == 0:
+                continue
+            codes, unique_dates = pd.factorize(dates[rows])
+            resolved = self._resolve_rates(currency, to_currency, pd.DatetimeIndex(unique_dates))
+            rates[rows] = resolved[codes]
+
+        return rates
+
+    def _resolve_rates(self, from_currency: str, to_currency: str, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Rates for distinct dates of one currency pair (NaN if unavailable)."""
+        rates = np.full(len(dates), np.nan)
+        date_strs = dates.strftime('%Y-%m-%d')
+
+        pending = []
+        for i, date_str in enumerate(date_strs):
+            cached = self.cache.get((from_currency, to_currency, date_str))
+            if cached is not None:
+                rates[i] = cached
+            else:
+                pending.append(i)
+        if not pending:
+            return rates
+        pending = np.asarray(pending)
+
+        # Same routing as get_historical_rate: Excel first for historical dates
+        # (or prefer_excel); anything recent keeps the single-lookup path
+        days_old = (pd.Timestamp.now() - dates[pending]).days.to_numpy()
+        excel_first = (days_old >= 7) | self.prefer_excel
+
+        for i in pending[~excel_first]:
+            rate = self.get_historical_rate(from_currency, to_currency, dates[i])
+            if rate is not None:
+                rates[i] = rate
+
+        excel_rows = pending[excel_first]
+        if excel_rows.size:
+            excel = self._get_excel_fallback_rates(from_currency, to_currency, dates[excel_rows])
+            found = ~np.isnan(excel)
+            rates[excel_rows[found]] = excel[found]
+            for i in excel_rows[found]:
+                self.cache[(from_currency, to_currency, date_strs[i])] = float(rates[i])
+
+            # Not in Excel: forex API (if enabled), then hardcoded rates
+            for i in excel_rows[~found]:
+                rate = None
+                if FOREX_AVAILABLE and self.currency_rates and self.enable_forex_api:
+                    try:
+                        rate = self._fetch_rate_from_api_with_timeout(from_currency, to_currency, dates[i])
+                        if rate is None:
+                            rate = self._try_alternative_dates(from_currency, to_currency, dates[i])
+                    except Exception as e:
+                        logger.warning(f"API call failed for {from_currency}/{to_currency} on {date_strs[i]}: {e}")
+                        rate = None
+                if rate is None:
+                    rate = self._get_fallback_rate(from_currency, to_currency)
+                if rate is not None:
+                    rates[i] = rate
+                    self.cache[(from_currency, to_currency, date_strs[i])] = rate
+
+        return rates
+
+    def _get_excel_fallback_rates(self, from_currency: str, to_currency: str, dates: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Vectorized _get_excel_fallback_rate: nearest Excel rate within 30 days.
+
+        Returns:
+            Array of rates, NaN where Excel has no valid rate
+        """
+        rates = np.full(len(dates), np.nan)
+        if not self.use_excel_fallback or self.excel_rates is None or self.excel_rates.empty:
+            return rates
+        if not ((from_currency == 'USD' and to_currency == 'CNY') or
+                (from_currency == 'CNY' and to_currency == 'USD')):
+            return rates
+
+        try:
+            table = pd.DataFrame({
+                'Date': pd.DatetimeIndex(self.excel_rates.index),
+                'Rate': pd.to_numeric(self.excel_rates, errors='coerce').to_numpy(dtype=float),
+            })
+            table = table.dropna(subset=['Date']).drop_duplicates('Date').sort_values('Date', kind='stable')
+
+            lookup = pd.DataFrame({'Date': dates.astype(table['Date'].dtype), 'Row': np.arange(len(dates))})
+            lookup = lookup.sort_values('Date', kind='stable')
+            # Ties between an earlier and a later date resolve to the earlier one, like argmin
+            matched = pd.merge_asof(lookup, table, on='Date', direction='nearest',
+                                    tolerance=pd.Timedelta(days=30))
+
+            found = matched['Rate'].to_numpy()
+            valid = ~np.isnan(found) & (found > 0)
+            rates[matched['Row'].to_numpy()[valid]] = found[valid]
+            if from_currency == 'CNY' and to_currency == 'USD':
+                rates = 1.0 / rates
+            self.excel_fallback_count += int(valid.sum())
+        except Exception as e:
+            logger.debug(f"Error retrieving Excel fallback rates: {e}")
+
+        return rates
+
     def clear_cache(self):
         """Clear the exchange rate cache."""
         self.cache.clear()
@@ -477,6 +636,8 @@ class CurrencyConverterService:
 
 # Global instance for easy access
 _currency_service = None
+# Incremented whenever a new global instance (i.e. a new set of rates) is installed
+_fx_generation = 0
 
 def initialize_currency_service(excel_rates: Optional[pd.Series] = None, 
                                use_excel_fallback: bool = True,
@@ -497,13 +658,14 @@ def initialize_currency_service(excel_rates: Optional[pd.Series] = None,
     Returns:
         The initialized currency service
     """
-    global _currency_service
+    global _currency_service, _fx_generation
     _currency_service = CurrencyConverterService(
         excel_rates=excel_rates, 
         use_excel_fallback=use_excel_fallback,
         prefer_excel=prefer_excel,
         enable_forex_api=enable_forex_api
     )
+    _fx_generation += 1
     return _currency_service
 
 def get_currency_service() -> CurrencyConverterService:
@@ -513,12 +675,23 @@ def get_currency_service() -> CurrencyConverterService:
     If not initialized, creates a new instance without Excel rates.
     For best performance, call initialize_currency_service() first with Excel rates.
     """
-    global _currency_service
+    global _currency_service, _fx_generation
     if _currency_service is None:
         logger.warning("Currency service not initialized with Excel rates. Using hardcoded fallbacks only.")
         _currency_service = CurrencyConverterService()
+        _fx_generation += 1
     return _currency_service
 
+def get_fx_generation() -> int:
+    """
+    Generation of the global currency service's rates.
+    
+    Changes every time a new service is installed, so results computed under
+    older rates can be told apart (unlike id(), which CPython reuses).
+    """
+    get_currency_service()
+    return _fx_generation
+
 def get_historical_rate(from_currency: str, to_currency: str, date: pd.Timestamp) -> Optional[float]:
     """
     Convenience function to get historical exchange rate.
@@ -548,4 +721,21 @@ def convert_amount(amount: float, from_currency: str, to_currency: str, date: pd
         Converted amount or None if conversion fails
     """
     service = get_currency_service()
-    return service.convert_amount(amount, from_currency, to_currency, date)
\ No newline at end of file
+    return service.convert_amount(amount, from_currency, to_currency, date)
+
+
+def convert_series(amounts, currencies, dates, target: str = 'CNY') -> pd.Series:
+    """
+    Convenience function to convert many amounts in one batch.
+    
+    Args:
+        amounts: Amounts to convert
+        currencies: Source currency per amount (or one code for all)
+        dates: Conversion date per amount
+        target: Target currency code
+        
+    Returns:
+        Series of converted amounts, NaN where no rate is available
+    """
+    service = get_currency_service()
+    return service.convert_series(amounts, currencies, dates, target)
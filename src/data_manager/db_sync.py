@@ -6,9 +6,14 @@ import pandas as pd
 from typing import Optional
 from src.database import get_session, Asset
 from src.data_manager.readers import read_schwab_data
+from src.portfolio_lib.price_cache import get_price_cache
 
 logger = logging.getLogger(__name__)
 
+# Cached prices that a holdings sync can supersede (Excel fallback prices are never
+# shared, see price_service.INSTANCE_PRICE_SOURCES)
+HOLDINGS_PRICE_SOURCES = ('holdings_table',)
+
 def sync_assets_to_db():
     """
     Reads assets from:
@@ -422,6 +427,7 @@ def sync_bs_to_holdings(session, snapshot_date):
         count += 1
         
     session.commit()
+    get_price_cache().invalidate(sources=HOLDINGS_PRICE_SOURCES)
     logger.info(f"✅ Propagated {count} Balance Sheet items to Holding table.")
 
 def sync_full_holdings_snapshot():
@@ -435,13 +441,15 @@ def sync_full_holdings_snapshot():
     from src.data_manager.manager import DataManager
     from src.database.models import Holding, Asset
     from src.database.base import get_session
+    from src.database.bulk_sync import bulk_upsert, chunked, preload_existing_keys, KEY_LOOKUP_CHUNK_SIZE
+    from sqlalchemy import case
     from datetime import datetime
     
     logger.info("📸 Starting Full Holdings Snapshot Sync...")
     
     # 1. Get Data from Excel Pipeline
     # Force Excel mode to use calculation logic
-    dm = DataManager(force_mode='excel') 
+    dm = DataManager(force_mode='excel', lazy=True)
     metrics_df = dm.get_holdings(latest_only=True)
     
     if metrics_df is None or metrics_df.empty:
@@ -483,95 +491,86 @@ def sync_full_holdings_snapshot():
             
         logger.info(f"Syncing snapshot for date: {snapshot_date}")
         
-        # Get existing holdings for this date to support upsert/update
-        existing_holdings = session.query(Holding).filter_by(snapshot_date=snapshot_date).all()
-        existing_map = {h.asset_id: h for h in existing_holdings}
-        
         # Reset index to access Asset_ID easily if it's in index
         df_reset = metrics_df.reset_index()
-        
+        df_reset = df_reset[df_reset['Asset_ID'].notna() & (df_reset['Asset_ID'].astype(str) != '')]
+        df_reset = df_reset.assign(Asset_ID=df_reset['Asset_ID'].astype(str))
+
         # 2.5 CRITICAL: Ensure ALL assets exist in the database BEFORE inserting holdings
         # This prevents FK constraint failures for dynamically generated asset IDs (e.g., Ins_*)
-        assets_registered = 0
-        for _, row in df_reset.iterrows():
-            asset_id = row.get('Asset_ID')
-            if not asset_id:
+        source_asset_ids = list(dict.fromkeys(df_reset['Asset_ID']))
+        known_assets = preload_existing_keys(session, Asset, ['asset_id'], keys=source_asset_ids)
+        new_assets = []
+        for row in df_reset.drop_duplicates('Asset_ID').to_dict('records'):
+            asset_id = row['Asset_ID']
+            if asset_id in known_assets:
                 continue
-            asset_id = str(asset_id)
-            existing_asset = session.query(Asset).filter_by(asset_id=asset_id).first()
-            if not existing_asset:
-                asset_name = str(row.get('Asset_Name', asset_id))
-                asset_type = str(row.get('Asset_Type_Raw', 'Unknown'))
-                logger.info(f"Auto-registering missing asset: {asset_id} ({asset_name})")
-                new_asset = Asset(
-                    asset_id=asset_id,
-                    asset_name=asset_name,
-                    asset_type=asset_type,
-                    is_active=True
-                )
-                session.add(new_asset)
-                assets_registered += 1
-        if assets_registered > 0:
-            session.flush()  # Flush to ensure assets are available for FK reference
-            logger.info(f"✅ Auto-registered {assets_registered} missing assets")
-        
-        for _, row in df_reset.iterrows():
-            asset_id = row.get('Asset_ID')
-            if not asset_id:
-                continue
-                
-            # Extract standard fields
-            asset_name = row.get('Asset_Name', asset_id)
-            shares = row.get('Quantity', 0.0)
-            
-            # Helper to safely float
-            def safe_float(val):
-                try:
-                    return float(val) if pd.notnull(val) else 0.0
-                except:
-                    return 0.0
-            
+            asset_name = str(row.get('Asset_Name', asset_id))
+            logger.info(f"Auto-registering missing asset: {asset_id} ({asset_name})")
+            new_assets.append({
+                'asset_id': asset_id,
+                'asset_name': asset_name,
+                'asset_type': str(row.get('Asset_Type_Raw', 'Unknown')),
+                'is_active': True,
+            })
+        if new_assets:
+            asset_result = bulk_upsert(session, Asset, new_assets, ['asset_id'], existing_keys=known_assets)
+            logger.info(f"✅ Auto-registered {asset_result.inserted} missing assets")
+
+        # Helper to safely float
+        def safe_float(val):
+            try:
+                return float(val) if pd.notnull(val) else 0.0
+            except:
+                return 0.0
+
+        records = []
+        for row in df_reset.to_dict('records'):
             price = safe_float(row.get('Market_Price_Unit', 0.0))
             market_val = safe_float(row.get('Market_Value_CNY', 0.0))
             cost_basis = safe_float(row.get('Cost_Basis_CNY', 0.0))
-            currency = row.get('Currency', 'CNY')
-            
-            # Upsert
-            if asset_id in existing_map:
-                h = existing_map[asset_id]
-                h.shares = safe_float(shares)
-                h.current_price = price
-                h.market_value = market_val
-                h.currency = str(currency)
-                if cost_basis:
-                    h.cost_basis = cost_basis
-                updated += 1
-            else:
-                new_h = Holding(
-                    snapshot_date=snapshot_date,
-                    asset_id=str(asset_id),
-                    asset_name=str(asset_name),
-                    shares=safe_float(shares),
-                    current_price=price,
-                    market_value=market_val,
-                    cost_basis=cost_basis,
-                    currency=str(currency),
-                    unrealized_pnl=market_val - cost_basis
-                )
-                session.add(new_h)
-                count += 1
-        
+            records.append({
+                'snapshot_date': snapshot_date,
+                'asset_id': row['Asset_ID'],
+                'asset_name': str(row.get('Asset_Name', row['Asset_ID'])),
+                'shares': safe_float(row.get('Quantity', 0.0)),
+                'current_price': price,
+                'market_value': market_val,
+                'cost_basis': cost_basis,
+                'currency': str(row.get('Currency', 'CNY')),
+                'unrealized_pnl': market_val - cost_basis,
+            })
+
+        # Upsert: existing rows keep their stored cost basis when the new one is zero
+        existing_keys = preload_existing_keys(session, Holding, ['asset_id'], snapshot_date=snapshot_date)
+        result = bulk_upsert(
+            session, Holding, records,
+            key_columns=['snapshot_date', 'asset_id'],
+            update_columns=['shares', 'current_price', 'market_value', 'currency'],
+            update_overrides={
+                'cost_basis': lambda excluded: case(
+                    (excluded.cost_basis != 0, excluded.cost_basis), else_=Holding.cost_basis
+                ),
+            },
+            existing_keys={(snapshot_date, asset_id) for asset_id in existing_keys},
+        )
+        count, updated = result.inserted, result.updated
+        for failed_row, error in result.error_rows:
+            logger.error(f"Failed to sync holding {failed_row['asset_id']}: {error}")
+
         # Delete stale holdings that exist in DB but NOT in source Excel
-        source_asset_ids = set(df_reset['Asset_ID'].dropna().astype(str))
+        stale_ids = sorted(existing_keys - set(source_asset_ids))
+        for asset_id in stale_ids:
+            logger.info(f"🗑️ Deleting stale holding: {asset_id}")
         deleted = 0
-        for asset_id, holding in existing_map.items():
-            if asset_id not in source_asset_ids:
-                session.delete(holding)
-                deleted += 1
-                logger.info(f"🗑️ Deleting stale holding: {asset_id}")
-                
+        for id_chunk in chunked(stale_ids, KEY_LOOKUP_CHUNK_SIZE):
+            deleted += session.query(Holding).filter(
+                Holding.snapshot_date == snapshot_date, Holding.asset_id.in_(id_chunk)
+            ).delete(synchronize_session=False)
+
         session.commit()
-        logger.info(f"✅ Full Snapshot Sync Complete: Added {count}, Updated {updated}, Deleted {deleted} records for {snapshot_date}.")
+        get_price_cache().invalidate(sources=HOLDINGS_PRICE_SOURCES)
+        logger.info(f"✅ Full Snapshot Sync Complete: Added {count}, Updated {updated}, Skipped {result.skipped}, Deleted {deleted} records for {snapshot_date}.")
         return True
         
     except Exception as e:
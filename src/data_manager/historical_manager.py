@@ -33,15 +33,16 @@ class HistoricalDataManager(DataManager):
     Extends the base DataManager with Phase 3 features.
     """
     
-    def __init__(self, config_path: str = 'config/settings.yaml'):
+    def __init__(self, config_path: str = 'config/settings.yaml', lazy: bool = False):
         """
         Initialize the Enhanced Historical Data Manager.
         
         Args:
             config_path: Path to the main settings YAML file
+            lazy: Defer the Excel pipeline until a dataset is requested (see DataManager)
         """
         # Initialize base DataManager
-        super().__init__(config_path)
+        super().__init__(config_path, lazy=lazy)
         
         # Phase 3 specific initialization
         self.historical_storage_path = self._get_historical_storage_path()
@@ -7,6 +7,11 @@ Unified data import orchestrator for multi-source data integration.
 Coordinates data imports from all configured sources (APIs, CSV, plugins),
 handles deduplication, validation, and database syncing.
 
+Sources are fetched concurrently in a bounded thread pool. Each source has its
+own rate limiter, which its connector waits on before every API request.
+Processing and database writes go through a single writer thread, so SQLite
+only ever sees one writer.
+
 Usage:
     orchestrator = ImportOrchestrator(config)
     results = orchestrator.run_full_sync()
@@ -14,10 +19,13 @@ Usage:
 """
 
 import logging
+import queue
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -33,6 +41,9 @@ from .connectors.utils import generate_source_id
 
 logger = logging.getLogger(__name__)
 
+# Sources fetched at the same time (override with global.max_concurrent_syncs)
+DEFAULT_MAX_CONCURRENT_SYNCS = 4
+
 
 @dataclass
 class ImportResult:
@@ -88,13 +99,47 @@ class SyncResults:
         return any(r.success for r in self.source_results)
 
 
+class _WriterQueue:
+    """Runs submitted callables one at a time on a dedicated thread."""
+
+    _STOP = object()
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='import-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable, *args) -> Future:
+        future: Future = Future()
+        self._queue.put((fn, args, future))
+        return future
+
+    def close(self) -> None:
+        """Finish queued work and stop the thread."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            fn, args, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
 class ImportOrchestrator:
     """
     Orchestrates data imports from multiple sources.
 
     Handles:
     - Connector initialization and authentication
-    - Parallel or sequential data fetching
+    - Concurrent, rate-limited data fetching
     - Data deduplication
     - Database syncing
     - Import job tracking
@@ -120,6 +165,8 @@ class ImportOrchestrator:
         self.config = config
         self.db_session = db_session
         self.connectors: Dict[str, BaseConnector] = {}
+        # Sources whose connector rate limit has been configured
+        self._rate_limited: Set[str] = set()
         self._initialized = False
 
     def initialize_connectors(self) -> Dict[str, Tuple[bool, str]]:
@@ -275,45 +322,109 @@ class ImportOrchestrator:
                 if k in source_filter
             }
 
-        # Sync each source
-        for source_id, connector in sources_to_sync.items():
-            try:
-                result = self._sync_source(source_id, connector, since_date)
-                results.source_results.append(result)
-                results.total_records_imported += result.records_imported
-                results.total_records_updated += result.records_updated
-                results.total_records_skipped += result.records_skipped
+        # Fetch sources concurrently; processing and DB writes are serialized by the writer
+        max_workers = max(1, min(self._max_concurrent_syncs(), len(sources_to_sync)))
+        writer = _WriterQueue()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='import-sync') as pool:
+                futures = {
+                    source_id: pool.submit(self._sync_source, source_id, connector, since_date, writer)
+                    for source_id, connector in sources_to_sync.items()
+                }
+
+                # Merge in source order so results don't depend on timing
+                for source_id, future in futures.items():
+                    try:
+                        result = future.result()
+                        results.source_results.append(result)
+                        results.total_records_imported += result.records_imported
+                        results.total_records_updated += result.records_updated
+                        results.total_records_skipped += result.records_skipped
+
+                        if not result.success and result.error_message:
+                            results.errors.append(f"{source_id}: {result.error_message}")
+
+                    except Exception as e:
+                        logger.error(f"Error syncing {source_id}: {e}")
+                        results.errors.append(f"{source_id}: {e}")
+                        results.source_results.append(ImportResult(
+                            source_type=sources_to_sync[source_id].metadata.connector_type.value,
+                            source_id=source_id,
+                            success=False,
+                            error_message=str(e)
+                        ))
+
+            results.completed_at = datetime.now()
+            logger.info(f"Sync job {job_id} completed: {results.summary()}")
+
+            # Save import job to database if session available
+            if self.db_session:
+                writer.submit(self._save_import_job, results).result()
+        finally:
+            writer.close()
 
-                if not result.success and result.error_message:
-                    results.errors.append(f"{source_id}: {result.error_message}")
+        return results
 
-            except Exception as e:
-                logger.error(f"Error syncing {source_id}: {e}")
-                results.errors.append(f"{source_id}: {e}")
-                results.source_results.append(ImportResult(
-                    source_type=connector.metadata.connector_type.value,
-                    source_id=source_id,
-                    success=False,
-                    error_message=str(e)
-                ))
-
-        results.completed_at = datetime.now()
-        logger.info(f"Sync job {job_id} completed: {results.summary()}")
-
-        # Save import job to database if session available
-        if self.db_session:
-            self._save_import_job(results)
+    def _max_concurrent_syncs(self) -> int:
+        """Number of sources synced at the same time."""
+        return int(self.config.get('global', {}).get('max_concurrent_syncs', DEFAULT_MAX_CONCURRENT_SYNCS))
 
-        return results
+    def _configure_rate_limit(self, source_id: str, connector: BaseConnector) -> None:
+        """
+        Set the request rate of a source's connector (once per connection).
+
+        The connector waits on its own limiter before every API request. The rate
+        is the source's rate_limit (a number, or a mapping with calls_per_minute)
+        if configured, otherwise global.rate_limiting.calls_per_minute capped at
+        the connector's rate_limit_per_minute. Disabling global.rate_limiting
+        turns the connector's limiter off.
+        """
+        if source_id in self._rate_limited:
+            return
+        self._rate_limited.add(source_id)
+
+        rate_config = self.config.get('global', {}).get('rate_limiting', {})
+        if not rate_config.get('enabled', True):
+            connector.set_rate_limit(None)
+            return
+
+        calls_per_minute = connector.metadata.rate_limit_per_minute
+        source_rate = connector.config.get('rate_limit')
+        if isinstance(source_rate, dict):
+            source_rate = source_rate.get('calls_per_minute')
+        if source_rate:
+            calls_per_minute = source_rate
+        elif rate_config.get('calls_per_minute'):
+            calls_per_minute = min(calls_per_minute, rate_config['calls_per_minute'])
+        connector.set_rate_limit(calls_per_minute)
 
     def _sync_source(
         self,
         source_id: str,
         connector: BaseConnector,
-        since_date: Optional[datetime] = None
+        since_date: Optional[datetime] = None,
+        writer: Optional[_WriterQueue] = None
     ) -> ImportResult:
-        """Sync data from a single source."""
+        """
+        Sync data from a single source.
+
+        Args:
+            source_id: Source identifier
+            connector: Authenticated connector for the source
+            since_date: Only fetch transactions since this date
+            writer: Writer queue that processing/storing runs on (None runs it inline)
+
+        Returns:
+            ImportResult for the source
+        """
         start_time = datetime.now()
+        self._configure_rate_limit(source_id, connector)
+
+        def store(process: Callable, df: pd.DataFrame) -> Dict[str, int]:
+            if writer is None:
+                return process(df, source_id)
+            return writer.submit(process, df, source_id).result()
+
         result = ImportResult(
             source_type=connector.metadata.connector_type.value,
             source_id=source_id,
@@ -337,13 +448,13 @@ class ImportOrchestrator:
 
             # Process and deduplicate
             if result.holdings_df is not None:
-                processed = self._process_holdings(result.holdings_df, source_id)
+                processed = store(self._process_holdings, result.holdings_df)
                 result.records_imported += processed['imported']
                 result.records_updated += processed['updated']
                 result.records_skipped += processed['skipped']
 
             if result.transactions_df is not None:
-                processed = self._process_transactions(result.transactions_df, source_id)
+                processed = store(self._process_transactions, result.transactions_df)
                 result.records_imported += processed['imported']
                 result.records_updated += processed['updated']
                 result.records_skipped += processed['skipped']
@@ -457,4 +568,5 @@ class ImportOrchestrator:
                 logger.error(f"Error disconnecting from {source_id}: {e}")
 
         self.connectors.clear()
+        self._rate_limited.clear()
         self._initialized = False
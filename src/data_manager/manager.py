@@ -3,7 +3,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any, Tuple, List
+from typing import Dict, Optional, Any, Tuple, List, Set
 import os
 
 # Import functions from other modules within the package
@@ -11,6 +11,8 @@ import os
 from . import readers
 from . import cleaners
 from . import calculators
+from . import pipeline_cache
+from . import snapshot_store
 
 # --- Asset ID Generation Logic ---
 def generate_asset_id(asset_name: Optional[str], asset_type: Optional[str] = None, code: Optional[str] = None) -> Optional[str]:
@@ -302,6 +304,32 @@ def apply_transaction_sign_convention(df: pd.DataFrame) -> pd.DataFrame:
 
 # --- Main Orchestration Logic ---
 
+# Source branch (readers.SOURCE_READERS key) -> cleaned_data keys derived from it
+PIPELINE_SOURCES = {
+    'financial_summary': ['balance_sheet', 'monthly_income_expense'],
+    'funds': ['fund_holdings', 'fund_transactions'],
+    'gold': ['gold_holdings', 'gold_transactions'],
+    'insurance': ['insurance_summary', 'insurance_premiums_long'],
+    'rsu': ['rsu_transactions'],
+    'schwab': ['schwab_holdings', 'schwab_transactions'],
+}
+# calculated_data keys; all derive from the financial summary branch
+CALCULATED_KEYS = ['balance_sheet', 'monthly_income_expense']
+FINAL_KEYS = ['balance_sheet_df', 'monthly_df', 'holdings_df', 'transactions_df']
+
+# Lazy mode: pipeline stage -> stages it depends on.
+# 'raw/<source>' and 'cleaned/<source>' exist for every PIPELINE_SOURCES key.
+TRANSACTION_SOURCES = ['funds', 'gold', 'insurance', 'rsu', 'schwab']
+PIPELINE_STAGES = {
+    **{f'raw/{source}': [] for source in PIPELINE_SOURCES},
+    **{f'cleaned/{source}': [f'raw/{source}'] for source in PIPELINE_SOURCES},
+    'calculated': ['cleaned/financial_summary'],
+    'final/statements': ['calculated'],
+    'final/holdings': ['final/statements'] + [f'cleaned/{source}' for source in TRANSACTION_SOURCES],
+    'final/transactions': [f'cleaned/{source}' for source in TRANSACTION_SOURCES],
+    'historical': [],
+}
+
 class DataManager:
     """
     Orchestrates the reading, cleaning, transforming, calculating,
@@ -309,13 +337,17 @@ class DataManager:
 
     Provides access to the final, processed DataFrames.
     """
-    def __init__(self, config_path: str = 'config/settings.yaml', force_mode: Optional[str] = None):
+    def __init__(self, config_path: str = 'config/settings.yaml', force_mode: Optional[str] = None,
+                 lazy: bool = False):
         """
         Initializes the DataManager, loads settings, and runs the full data processing pipeline.
 
         Args:
             config_path: Path to the main settings YAML file.
             force_mode: Optional override for operation mode ('excel' or 'database').
+            lazy: If True, defer the Excel pipeline; each accessor then runs only the
+                  reader, cleaner and integration stages it depends on (PIPELINE_STAGES).
+                  Callers must use the accessors rather than final_data/cleaned_data directly.
         """
         print("Initializing DataManager...")
         self.config_path = config_path
@@ -350,26 +382,42 @@ class DataManager:
         
         # Initialize historical data cache
         self.historical_holdings_cache: Optional[pd.DataFrame] = None
+        self._snapshot_store: Optional[snapshot_store.SnapshotStore] = None
+
+        # Lazy pipeline state
+        self.lazy = False
+        self._completed_stages: Set[str] = set()
+        self._lazy_cache_checked = False
 
         # Execute processing steps.
-        if self.database_mode == 'excel':
-            self._initialize_excel_pipeline()
-        else:
-            load_excel_fallback = database_config.get('load_excel_fallback', True)
-            if load_excel_fallback:
+        run_excel_pipeline = True
+        if self.database_mode != 'excel':
+            run_excel_pipeline = database_config.get('load_excel_fallback', True)
+            if run_excel_pipeline:
                 print("📎 Database mode: loading Excel compatibility pipeline for legacy modules (balance sheet, monthly cash flow, etc.)")
-                self._initialize_excel_pipeline()
             else:
                 print("⚠️ Excel compatibility disabled in database mode. Some reports may not have historical data until database tables are populated.")
 
+        if run_excel_pipeline and lazy:
+            self.lazy = True
+            print("DataManager initialized in lazy mode; datasets load on first access.")
+            return
+
+        if run_excel_pipeline:
+            self._initialize_excel_pipeline()
+
         print("DataManager initialized and data processed.")
 
     def _initialize_excel_pipeline(self) -> None:
         """Run the legacy Excel processing pipeline for modules still depending on it."""
-        self._load_raw_data()
-        self._clean_and_transform_data()
-        self._calculate_data()
-        self._integrate_data()
+        cache = self._get_pipeline_cache()
+        if cache is not None:
+            self._run_cached_pipeline(cache)
+        else:
+            self._load_raw_data()
+            self._clean_and_transform_data()
+            self._calculate_data()
+            self._integrate_data()
 
         # Load historical snapshots if enabled
         self._load_historical_data()
@@ -381,35 +429,237 @@ class DataManager:
         """Loads raw data from all sources defined in settings."""
         self.raw_data = readers.read_all_sources(self.config_path)
 
-    def _clean_and_transform_data(self):
-        """Applies cleaning functions and transformations to raw data."""
-        print("\n--- Cleaning and Transforming Data ---")
+    def _get_pipeline_cache(self) -> Optional['pipeline_cache.PipelineCache']:
+        """
+        Create the persistent pipeline-output cache if enabled in settings.
 
-        # Clean individual sources and store in self.cleaned_data
-        fs_data = self.raw_data.get('financial_summary', {})
-        self.cleaned_data['balance_sheet'] = cleaners.clean_balance_sheet(fs_data.get('balance_sheet'), self.settings)
-        self.cleaned_data['monthly_income_expense'] = cleaners.clean_monthly_income_expense(fs_data.get('monthly_income_expense'), self.settings)
+        Settings (all optional):
+            pipeline_cache:
+              enabled: true
+              directory: "data/cache/pipeline/"
+
+        Returns:
+            PipelineCache, or None if disabled or no Parquet engine is installed
+        """
+        cache_config = self.settings.get('pipeline_cache', {}) or {}
+        if not cache_config.get('enabled', True):
+            return None
+        if not pipeline_cache.parquet_available():
+            print("Info: pyarrow not installed. Pipeline cache disabled.")
+            return None
+
+        cache_dir = cache_config.get('directory', 'data/cache/pipeline/')
+        if not os.path.isabs(cache_dir):
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            cache_dir = os.path.join(project_root, cache_dir)
+
+        settings_hash = pipeline_cache.compute_settings_hash(
+            self.settings, extra_files=[cleaners._get_config_path('column_mapping.yaml')]
+        )
+        try:
+            return pipeline_cache.PipelineCache(cache_dir, settings_hash)
+        except OSError as e:
+            print(f"Warning: Could not open pipeline cache at {cache_dir}: {e}")
+            return None
+
+    def _run_cached_pipeline(self, cache: 'pipeline_cache.PipelineCache') -> None:
+        """
+        Run the Excel pipeline through the persistent cache.
+
+        Nothing changed: cleaned, calculated and final frames are loaded from Parquet.
+        Some sources changed: only those are re-read and re-cleaned, the calculation
+        step reruns only if the financial summary changed, and integration reruns.
+        """
+        fingerprints = self._source_fingerprints()
+        stale = cache.stale_sources(fingerprints)
+
+        if not stale:
+            if self._load_cached_outputs(cache):
+                return
+            stale = set(PIPELINE_SOURCES)
+
+        fresh = [source for source in PIPELINE_SOURCES if source not in stale]
+        reuse_calculated = 'financial_summary' not in stale
+        cached = {}
+        if fresh:
+            names = [f'cleaned/{key}' for source in fresh for key in PIPELINE_SOURCES[source]]
+            if reuse_calculated:
+                names += [f'calculated/{key}' for key in CALCULATED_KEYS] + ['fx_rates']
+            cached = cache.load_frames(names)
+            if cached is None:
+                fresh, reuse_calculated, cached = [], False, {}
+                stale = set(PIPELINE_SOURCES)
+
+        if fresh:
+            print(f"\n--- Pipeline cache: reusing {', '.join(fresh)}; recomputing {', '.join(sorted(stale))} ---")
+            self.raw_data = readers.read_sources(self.settings, sorted(stale))
+            self._restore_pipeline_frames(cached)
+        else:
+            self._load_raw_data()
+
+        self._clean_and_transform_data(sources=stale)
+        if reuse_calculated:
+            self._initialize_currency_service()
+        else:
+            self._calculate_data()
+        self._integrate_data()
+
+        if cache.save(fingerprints, self._collect_pipeline_frames()):
+            print("  - Pipeline outputs cached.")
+
+    def _source_fingerprints(self) -> Dict[str, Any]:
+        """File fingerprints of every source branch's inputs."""
+        return {
+            source: [pipeline_cache.file_fingerprint(path) for path in readers.get_source_files(self.settings, source)]
+            for source in PIPELINE_SOURCES
+        }
+
+    def _load_cached_outputs(self, cache: 'pipeline_cache.PipelineCache') -> bool:
+        """
+        Restore every pipeline output from the cache.
+
+        Returns:
+            True if all frames were loaded (the caller must have checked that no source is stale)
+        """
+        cached = cache.load_frames(self._pipeline_frame_names())
+        if cached is None:
+            return False
+        print("\n--- Loading Pipeline Outputs from Cache (sources unchanged) ---")
+        self._restore_pipeline_frames(cached)
+        self._initialize_currency_service()
+        return True
+
+    # --- Lazy Pipeline ---
+    def _ensure_stages(self, *stages: str) -> None:
+        """
+        In lazy mode, run the given PIPELINE_STAGES and everything they depend on.
 
-        fund_data = self.raw_data.get('funds', {})
-        self.cleaned_data['fund_holdings'] = cleaners.clean_fund_holdings(fund_data.get('holdings'), self.settings)
-        self.cleaned_data['fund_transactions'] = cleaners.clean_fund_transactions(fund_data.get('transactions'), self.settings)
+        Stages that already ran are skipped. On first use a fully valid pipeline
+        cache is loaded instead, which completes every stage but 'historical'.
+        In eager mode this is a no-op.
+        """
+        if not self.lazy:
+            return
+
+        if not self._lazy_cache_checked:
+            self._lazy_cache_checked = True
+            cache = self._get_pipeline_cache()
+            if cache is not None and not cache.stale_sources(self._source_fingerprints()):
+                if self._load_cached_outputs(cache):
+                    self._completed_stages.update(stage for stage in PIPELINE_STAGES if stage != 'historical')
+
+        for stage in stages:
+            self._run_stage(stage)
+
+    def _run_stage(self, stage: str) -> None:
+        """Run one lazy pipeline stage after its dependencies."""
+        if stage in self._completed_stages:
+            return
+        for dependency in PIPELINE_STAGES[stage]:
+            self._run_stage(dependency)
+
+        step, _, source = stage.partition('/')
+        if step == 'raw':
+            self._load_raw_source(source)
+        elif step == 'cleaned':
+            self._clean_and_transform_data(sources={source})
+        elif stage == 'calculated':
+            self._calculate_data()
+        elif stage == 'final/statements':
+            self._integrate_statements()
+        elif stage == 'final/holdings':
+            self._integrate_holdings()
+        elif stage == 'final/transactions':
+            self._integrate_transactions()
+        elif stage == 'historical':
+            self._load_historical_data()
+            self._cleanup_old_snapshots()
+
+        self._completed_stages.add(stage)
+
+    def _load_raw_source(self, source: str) -> None:
+        """Read a single source; the demo workbook holds every source and is read once."""
+        if readers.uses_demo_data(self.settings):
+            self._load_raw_data()
+            self._completed_stages.update(f'raw/{name}' for name in PIPELINE_SOURCES)
+        else:
+            self.raw_data.update(readers.read_sources(self.settings, [source]))
+
+    @staticmethod
+    def _pipeline_frame_names() -> List[str]:
+        """Names of every frame stored in the pipeline cache."""
+        return (
+            [f'cleaned/{key}' for keys in PIPELINE_SOURCES.values() for key in keys]
+            + [f'calculated/{key}' for key in CALCULATED_KEYS]
+            + [f'final/{key}' for key in FINAL_KEYS]
+            + ['fx_rates']
+        )
 
-        gold_data = self.raw_data.get('gold', {})
-        self.cleaned_data['gold_holdings'] = cleaners.clean_gold_holdings(gold_data.get('holdings'), self.settings)
-        self.cleaned_data['gold_transactions'] = cleaners.clean_gold_transactions(gold_data.get('transactions'), self.settings)
+    def _collect_pipeline_frames(self) -> Dict[str, Any]:
+        """Gather the pipeline outputs under their cache names."""
+        stages = {'cleaned': self.cleaned_data, 'calculated': self.calculated_data, 'final': self.final_data}
+        frames = {}
+        for name in self._pipeline_frame_names():
+            if name == 'fx_rates':
+                frames[name] = self.fx_rates
+            else:
+                stage, key = name.split('/', 1)
+                frames[name] = stages[stage].get(key)
+        return frames
+
+    def _restore_pipeline_frames(self, frames: Dict[str, Any]) -> None:
+        """Put cached frames back into cleaned_data/calculated_data/final_data/fx_rates."""
+        stages = {'cleaned': self.cleaned_data, 'calculated': self.calculated_data, 'final': self.final_data}
+        for name, value in frames.items():
+            if name == 'fx_rates':
+                self.fx_rates = value
+            else:
+                stage, key = name.split('/', 1)
+                stages[stage][key] = value
+
+    def _clean_and_transform_data(self, sources: Optional[set] = None):
+        """
+        Applies cleaning functions and transformations to raw data.
+
+        Args:
+            sources: Optional subset of PIPELINE_SOURCES to clean (default: all)
+        """
+        print("\n--- Cleaning and Transforming Data ---")
 
-        ins_data = self.raw_data.get('insurance', {})
-        self.cleaned_data['insurance_summary'] = cleaners.clean_insurance_summary(ins_data.get('summary'), self.settings)
-        # Transform premiums - result is already like a transaction df
-        self.cleaned_data['insurance_premiums_long'] = cleaners.transform_insurance_premiums(ins_data.get('premiums'), self.settings)
+        def selected(source: str) -> bool:
+            return sources is None or source in sources
 
-        rsu_data = self.raw_data.get('rsu', {})
-        self.cleaned_data['rsu_transactions'] = cleaners.clean_rsu_transactions(rsu_data.get('transactions'), self.settings)
+        # Clean individual sources and store in self.cleaned_data
+        if selected('financial_summary'):
+            fs_data = self.raw_data.get('financial_summary', {})
+            self.cleaned_data['balance_sheet'] = cleaners.clean_balance_sheet(fs_data.get('balance_sheet'), self.settings)
+            self.cleaned_data['monthly_income_expense'] = cleaners.clean_monthly_income_expense(fs_data.get('monthly_income_expense'), self.settings)
+
+        if selected('funds'):
+            fund_data = self.raw_data.get('funds', {})
+            self.cleaned_data['fund_holdings'] = cleaners.clean_fund_holdings(fund_data.get('holdings'), self.settings)
+            self.cleaned_data['fund_transactions'] = cleaners.clean_fund_transactions(fund_data.get('transactions'), self.settings)
+
+        if selected('gold'):
+            gold_data = self.raw_data.get('gold', {})
+            self.cleaned_data['gold_holdings'] = cleaners.clean_gold_holdings(gold_data.get('holdings'), self.settings)
+            self.cleaned_data['gold_transactions'] = cleaners.clean_gold_transactions(gold_data.get('transactions'), self.settings)
+
+        if selected('insurance'):
+            ins_data = self.raw_data.get('insurance', {})
+            self.cleaned_data['insurance_summary'] = cleaners.clean_insurance_summary(ins_data.get('summary'), self.settings)
+            # Transform premiums - result is already like a transaction df
+            self.cleaned_data['insurance_premiums_long'] = cleaners.transform_insurance_premiums(ins_data.get('premiums'), self.settings)
+
+        if selected('rsu'):
+            rsu_data = self.raw_data.get('rsu', {})
+            self.cleaned_data['rsu_transactions'] = cleaners.clean_rsu_transactions(rsu_data.get('transactions'), self.settings)
 
         # --- **新增**: 清洗 Schwab 数据 (CSV format) ---
-        schwab_data = self.raw_data.get('schwab', {})
-        self.cleaned_data['schwab_holdings'] = cleaners.clean_schwab_holdings_csv(schwab_data.get('holdings'), self.settings)
-        self.cleaned_data['schwab_transactions'] = cleaners.clean_schwab_transactions_csv(schwab_data.get('transactions'), self.settings)
+        if selected('schwab'):
+            schwab_data = self.raw_data.get('schwab', {})
+            self.cleaned_data['schwab_holdings'] = cleaners.clean_schwab_holdings_csv(schwab_data.get('holdings'), self.settings)
+            self.cleaned_data['schwab_transactions'] = cleaners.clean_schwab_transactions_csv(schwab_data.get('transactions'), self.settings)
         # --- **新增结束** ---
 
     def _calculate_data(self):
@@ -418,8 +668,19 @@ class DataManager:
 
         # Get FX rates first, store as instance variable
         self.fx_rates = calculators.get_fx_rates(self.cleaned_data.get('monthly_income_expense'))
-        
-        # Initialize currency converter service with Excel rates for fallback
+        self._initialize_currency_service()
+
+        # Calculate for Balance Sheet using self.fx_rates
+        self.calculated_data['balance_sheet'] = calculators.calculate_balance_sheet_totals(
+            self.cleaned_data.get('balance_sheet'), self.fx_rates
+        )
+        # Calculate for Monthly Income/Expense using self.fx_rates
+        self.calculated_data['monthly_income_expense'] = calculators.calculate_monthly_totals(
+            self.cleaned_data.get('monthly_income_expense'), self.fx_rates
+        )
+
+    def _initialize_currency_service(self) -> None:
+        """Initialize the currency converter service with the Excel FX rates for fallback."""
         if self.fx_rates is not None and not self.fx_rates.empty:
             from .currency_converter import initialize_currency_service
             # Use Excel-first strategy with API disabled for best performance
@@ -431,20 +692,20 @@ class DataManager:
             )
             print(f"  - Initialized currency converter with {len(self.fx_rates)} Excel exchange rates (API disabled for performance)")
 
-        # Calculate for Balance Sheet using self.fx_rates
-        self.calculated_data['balance_sheet'] = calculators.calculate_balance_sheet_totals(
-            self.cleaned_data.get('balance_sheet'), self.fx_rates
-        )
-        # Calculate for Monthly Income/Expense using self.fx_rates
-        self.calculated_data['monthly_income_expense'] = calculators.calculate_monthly_totals(
-            self.cleaned_data.get('monthly_income_expense'), self.fx_rates
-        )
-
     def _integrate_data(self): # <-- **修改此方法**
         """Integrates data from various sources into final holdings and transactions DFs."""
         print("\n--- Integrating Data ---")
+        self._integrate_statements()
+        self._integrate_holdings()
+        self._integrate_transactions()
+
+    def _integrate_statements(self) -> None:
+        """Publish the calculated balance sheet and monthly income/expense as final data."""
         self.final_data['balance_sheet_df'] = self.calculated_data.get('balance_sheet')
         self.final_data['monthly_df'] = self.calculated_data.get('monthly_income_expense')
+
+    def _integrate_holdings(self) -> None:
+        """Builds the consolidated holdings_df (latest snapshot) from all sources."""
         print("  - Integrating Holdings...")
         all_holdings: List[pd.DataFrame] = []
         latest_bs_date = pd.Timestamp.min
@@ -955,20 +1216,8 @@ class DataManager:
                     # 添加FX_Rate列到holdings_df以便于审核和调试
                     holdings_df['FX_Rate'] = fx_rate_value
                     
-                    # 应用汇率转换
-                    holdings_df['Market_Value_CNY'] = holdings_df.apply(
-                        lambda row: row['Market_Value_Raw'] * fx_rate_value if row['Currency'] == 'USD' 
-                                  else row['Market_Value_Raw'], 
-                        axis=1
-                    )
-                    
-                    # CRITICAL: Apply FX conversion to Cost Basis as well
-                    if 'Cost_Basis_Raw' in holdings_df.columns:
-                        holdings_df['Cost_Basis_CNY'] = holdings_df.apply(
-                            lambda row: row['Cost_Basis_Raw'] * fx_rate_value if row['Currency'] == 'USD' and pd.notnull(row['Cost_Basis_Raw'])
-                                      else (row['Cost_Basis_Raw'] if pd.notnull(row['Cost_Basis_Raw']) else np.nan),
-                            axis=1
-                        )
+                    # 应用汇率转换 (Market Value 和 Cost Basis)
+                    self._apply_usd_fx_rate(holdings_df, fx_rate_value)
                 else:
                     print(f"    - Warning: Invalid FX rate ({fx_rate_value}). USD assets will not be converted to CNY.")
                     holdings_df['FX_Rate'] = fx_rate_value
@@ -981,20 +1230,8 @@ class DataManager:
                 print(f"    - Warning: No FX rates available. Using fallback rate USD/CNY = {default_fx_rate}")
                 holdings_df['FX_Rate'] = default_fx_rate
                 
-                # Apply fallback FX conversion for USD assets
-                holdings_df['Market_Value_CNY'] = holdings_df.apply(
-                    lambda row: row['Market_Value_Raw'] * default_fx_rate if row['Currency'] == 'USD' 
-                              else row['Market_Value_Raw'], 
-                    axis=1
-                )
-                
-                # Also convert cost basis
-                if 'Cost_Basis_Raw' in holdings_df.columns:
-                    holdings_df['Cost_Basis_CNY'] = holdings_df.apply(
-                        lambda row: row['Cost_Basis_Raw'] * default_fx_rate if row['Currency'] == 'USD' and pd.notnull(row['Cost_Basis_Raw'])
-                                  else (row['Cost_Basis_Raw'] if pd.notnull(row['Cost_Basis_Raw']) else np.nan),
-                        axis=1
-                    )
+                # Apply fallback FX conversion for USD assets (market value and cost basis)
+                self._apply_usd_fx_rate(holdings_df, default_fx_rate)
             
             # 确保Market_Value_CNY是数值类型
             holdings_df['Market_Value_CNY'] = pd.to_numeric(holdings_df['Market_Value_CNY'], errors='coerce')
@@ -1019,6 +1256,23 @@ class DataManager:
         else: 
             print("  - No holdings data found to integrate.")
 
+    @staticmethod
+    def _apply_usd_fx_rate(holdings_df: pd.DataFrame, fx_rate: float) -> None:
+        """
+        Fills Market_Value_CNY (and Cost_Basis_CNY) by multiplying the USD rows by fx_rate.
+
+        All holdings share one as-of snapshot date, so a single rate applies; other
+        currencies keep their raw values and missing cost bases stay NaN.
+        """
+        is_usd = (holdings_df['Currency'] == 'USD').to_numpy()
+        market_value = pd.to_numeric(holdings_df['Market_Value_Raw'], errors='coerce')
+        holdings_df['Market_Value_CNY'] = market_value.where(~is_usd, market_value * fx_rate)
+        if 'Cost_Basis_Raw' in holdings_df.columns:
+            cost_basis = pd.to_numeric(holdings_df['Cost_Basis_Raw'], errors='coerce')
+            holdings_df['Cost_Basis_CNY'] = cost_basis.where(~is_usd, cost_basis * fx_rate)
+
+    def _integrate_transactions(self) -> None:
+        """Builds the consolidated transactions_df from all transaction sources."""
         # --- 3. Create Consolidated Transactions DataFrame (`transactions_df`) ---
         print("  - Integrating Transactions...")
         all_transactions = []
@@ -1175,6 +1429,16 @@ class DataManager:
             return
         
         print("\n--- Loading Historical Snapshots ---")
+        store = self._get_snapshot_store()
+        if store is not None:
+            # Partitioned store: snapshots are read on demand for the requested dates only
+            print(f"Snapshot store has {len(store.available_dates())} snapshots (loaded on demand).")
+            legacy_files = snapshot_store.find_legacy_snapshots(self._get_snapshots_directory())
+            if legacy_files:
+                print(f"Note: {len(legacy_files)} flat snapshot files are not in the Parquet store. "
+                      "Run src/scripts/convert_snapshots_to_parquet.py to migrate them.")
+            return
+
         self.historical_holdings_cache = self._load_all_historical_snapshots()
         
         if self.historical_holdings_cache is not None:
@@ -1186,10 +1450,12 @@ class DataManager:
     # --- Accessor Methods ---
     def get_balance_sheet(self) -> Optional[pd.DataFrame]:
         """Returns the final, calculated Balance Sheet DataFrame."""
+        self._ensure_stages('final/statements')
         return self.final_data.get('balance_sheet_df')
 
     def get_monthly_income_expense(self) -> Optional[pd.DataFrame]:
         """Returns the final, calculated Monthly Income/Expense DataFrame."""
+        self._ensure_stages('final/statements')
         return self.final_data.get('monthly_df')
 
     def get_transactions(self) -> Optional[pd.DataFrame]:
@@ -1203,6 +1469,7 @@ class DataManager:
         if self.database_mode == 'database' and self.db_connector:
             return self.db_connector.get_transactions()
         else:
+            self._ensure_stages('final/transactions')
             return self.final_data.get('transactions_df')
 
     def get_holdings(self, latest_only: bool = True) -> Optional[pd.DataFrame]:
@@ -1236,6 +1503,7 @@ class DataManager:
         if self.database_mode == 'database' and self.db_connector:
             holdings_df = self.db_connector.get_holdings(latest_only=True)
         else:
+            self._ensure_stages('final/holdings')
             holdings_df = self.final_data.get('holdings_df')
         
         if holdings_df is None or holdings_df.empty:
@@ -1363,20 +1631,37 @@ class DataManager:
             result_df['Risk_Level'] = None
             return result_df
     
-    def _get_all_historical_holdings(self) -> Optional[pd.DataFrame]:
+    def _get_all_historical_holdings(
+        self,
+        start_date: Optional[pd.Timestamp] = None,
+        end_date: Optional[pd.Timestamp] = None,
+        dates: Optional[List[pd.Timestamp]] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Returns all historical holdings snapshots, combining stored snapshots with current holdings.
+
+        With the Parquet snapshot store, start_date/end_date/dates are pushed down so only
+        matching snapshots are read; otherwise they are ignored and callers filter.
         
         Returns:
             DataFrame with MultiIndex (Snapshot_Date, Asset_ID) containing historical holdings data.
             Returns None if no historical data is available.
         """
+        self._ensure_stages('historical', 'final/holdings')
         all_snapshots = []
         
-        # 1. Load stored historical snapshots from cache
-        if self.historical_holdings_cache is not None:
-            all_snapshots.append(self.historical_holdings_cache)
-            print(f"Added {len(self.historical_holdings_cache.index.get_level_values(0).unique())} stored snapshots")
+        # 1. Load stored historical snapshots from the store or cache
+        store = self._get_snapshot_store()
+        if store is not None:
+            stored_snapshots = self._load_all_historical_snapshots(start_date=start_date, end_date=end_date, dates=dates)
+            stored_dates = set(store.available_dates())
+        else:
+            stored_snapshots = self.historical_holdings_cache
+            stored_dates = set() if stored_snapshots is None else set(stored_snapshots.index.get_level_values(0))
+
+        if stored_snapshots is not None:
+            all_snapshots.append(stored_snapshots)
+            print(f"Added {len(stored_snapshots.index.get_level_values(0).unique())} stored snapshots")
         
         # 2. Add current holdings as the latest snapshot
         current_holdings = self.final_data.get('holdings_df')
@@ -1400,8 +1685,7 @@ class DataManager:
                 current_snapshot = current_snapshot.set_index(['Snapshot_Date', 'Asset_ID'])
                 
                 # Only add if this date is not already in stored snapshots
-                if (self.historical_holdings_cache is None or 
-                    latest_date not in self.historical_holdings_cache.index.get_level_values(0)):
+                if latest_date not in stored_dates:
                     all_snapshots.append(current_snapshot)
                     print(f"Added current holdings as snapshot for date: {latest_date}")
                 else:
@@ -1434,8 +1718,8 @@ class DataManager:
         Returns:
             DataFrame with MultiIndex (Snapshot_Date, Asset_ID) containing filtered historical data.
         """
-        # Get all historical holdings
-        historical_holdings = self._get_all_historical_holdings()
+        # Get all historical holdings (the snapshot store only reads the requested range)
+        historical_holdings = self._get_all_historical_holdings(start_date=start_date, end_date=end_date)
         
         if historical_holdings is None:
             return None
@@ -1471,7 +1755,7 @@ class DataManager:
         Returns:
             DataFrame with MultiIndex (Snapshot_Date, Asset_ID) for specified dates.
         """
-        historical_holdings = self._get_all_historical_holdings()
+        historical_holdings = self._get_all_historical_holdings(dates=dates_list)
         
         if historical_holdings is None:
             return None
@@ -1513,6 +1797,7 @@ class DataManager:
             print("Historical snapshots disabled in configuration.")
             return False
         
+        self._ensure_stages('historical', 'final/holdings')
         current_holdings = self.final_data.get('holdings_df')
         if current_holdings is None or current_holdings.empty:
             print("No current holdings data available to create snapshot.")
@@ -1530,7 +1815,7 @@ class DataManager:
         snapshot_date = pd.Timestamp(snapshot_date)
         
         # Check if snapshot already exists
-        existing_snapshots = self._get_all_historical_holdings()
+        existing_snapshots = self._get_all_historical_holdings(dates=[snapshot_date])
         if (existing_snapshots is not None and 
             snapshot_date in existing_snapshots.index.get_level_values(0)):
             print(f"Snapshot for date {snapshot_date} already exists.")
@@ -1543,8 +1828,9 @@ class DataManager:
         success = self._save_snapshot_to_file(snapshot_holdings, snapshot_date)
         
         if success:
-            # Refresh the cache to include the new snapshot
-            self.historical_holdings_cache = self._load_all_historical_snapshots()
+            # Refresh the cache to include the new snapshot (the store is read on demand)
+            if self._get_snapshot_store() is None:
+                self.historical_holdings_cache = self._load_all_historical_snapshots()
             print(f"Successfully created and saved snapshot for date: {snapshot_date}")
             print(f"Holdings records in snapshot: {len(snapshot_holdings)}")
         else:
@@ -1590,6 +1876,22 @@ class DataManager:
     def _get_storage_format(self) -> str:
         """Get the storage format from configuration."""
         return self.settings.get('historical_data', {}).get('storage_format', 'excel')
+
+    def _get_snapshot_store(self) -> Optional[snapshot_store.SnapshotStore]:
+        """
+        Returns the partitioned Parquet snapshot store when storage_format is 'parquet_dataset'.
+
+        Returns None for the flat-file formats, or if pyarrow is not installed
+        (snapshots then fall back to flat Excel files).
+        """
+        if self._get_storage_format() != 'parquet_dataset':
+            return None
+        if self._snapshot_store is None:
+            if not snapshot_store.pyarrow_available():
+                print("Warning: pyarrow not installed. Falling back to flat Excel snapshot files.")
+                return None
+            self._snapshot_store = snapshot_store.SnapshotStore(self._get_snapshots_directory())
+        return self._snapshot_store
     
     def _generate_snapshot_filename(self, snapshot_date: pd.Timestamp, storage_format: str) -> str:
         """Generate filename for a snapshot."""
@@ -1634,12 +1936,17 @@ class DataManager:
             save_df['DataManager_Version'] = '1.2'
             
             # Save based on format
-            if storage_format == 'excel':
+            store = self._get_snapshot_store()
+            if store is not None:
+                filepath = store.write(save_df, snapshot_date)
+            elif storage_format == 'excel':
                 save_df.to_excel(filepath, index=False, sheet_name='Holdings_Snapshot')
             elif storage_format == 'csv':
                 save_df.to_csv(filepath, index=False)
             elif storage_format == 'parquet':
                 save_df.to_parquet(filepath, index=False)
+            else:
+                save_df.to_excel(filepath, index=False, sheet_name='Holdings_Snapshot')
             
             print(f"Snapshot saved successfully: {filepath}")
             return True
@@ -1664,38 +1971,50 @@ class DataManager:
             if not os.path.exists(filepath):
                 return None
             
-            # Determine format from file extension
-            if filepath.endswith('.xlsx'):
-                df = pd.read_excel(filepath, sheet_name='Holdings_Snapshot')
-            elif filepath.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            elif filepath.endswith('.parquet'):
-                df = pd.read_parquet(filepath)
-            else:
-                print(f"Unsupported file format: {filepath}")
-                return None
-            
-            # Convert Snapshot_Date to datetime
-            if 'Snapshot_Date' in df.columns:
-                df['Snapshot_Date'] = pd.to_datetime(df['Snapshot_Date'])
-            
-            # Remove metadata columns that aren't part of holdings data
-            metadata_cols = ['Created_At', 'DataManager_Version']
-            df = df.drop(columns=[col for col in metadata_cols if col in df.columns])
-            
-            return df
+            # Format is determined from the file extension
+            df = snapshot_store.read_snapshot_file(filepath)
+            return self._drop_snapshot_metadata(df)
             
         except Exception as e:
             print(f"Error loading snapshot from {filepath}: {e}")
             return None
     
-    def _load_all_historical_snapshots(self) -> Optional[pd.DataFrame]:
+    @staticmethod
+    def _drop_snapshot_metadata(df: pd.DataFrame) -> pd.DataFrame:
+        """Remove metadata columns that aren't part of holdings data."""
+        metadata_cols = ['Created_At', 'DataManager_Version']
+        return df.drop(columns=[col for col in metadata_cols if col in df.columns])
+
+    def _load_all_historical_snapshots(
+        self,
+        start_date: Optional[pd.Timestamp] = None,
+        end_date: Optional[pd.Timestamp] = None,
+        dates: Optional[List[pd.Timestamp]] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Load all available historical snapshots from storage.
+
+        Args:
+            start_date: Optional inclusive lower bound on the snapshot date
+            end_date: Optional inclusive upper bound on the snapshot date
+            dates: Optional exact snapshot dates to load
         
         Returns:
             DataFrame with MultiIndex (Snapshot_Date, Asset_ID) containing all historical data
         """
+        store = self._get_snapshot_store()
+        if store is not None:
+            combined_df = store.read(start_date=start_date, end_date=end_date, dates=dates)
+            if combined_df is None:
+                print("No historical snapshots found in the snapshot store.")
+                return None
+            combined_df = self._drop_snapshot_metadata(combined_df)
+            if 'Asset_ID' in combined_df.columns and 'Snapshot_Date' in combined_df.columns:
+                combined_df = combined_df.set_index(['Snapshot_Date', 'Asset_ID']).sort_index()
+            snapshot_count = combined_df.index.get_level_values(0).nunique() if isinstance(combined_df.index, pd.MultiIndex) else 0
+            print(f"Loaded {snapshot_count} historical snapshots with {len(combined_df)} total records from the snapshot store")
+            return combined_df
+
         snapshots_dir = self._get_snapshots_directory()
         storage_format = self._get_storage_format()
         
@@ -1711,6 +2030,20 @@ class DataManager:
         
         import glob
         snapshot_files = glob.glob(os.path.join(snapshots_dir, pattern))
+
+        # Skip files outside the requested dates before opening them
+        if start_date is not None or end_date is not None or dates is not None:
+            wanted = None if dates is None else {pd.Timestamp(date) for date in dates}
+            selected_files = []
+            for filepath in snapshot_files:
+                file_date = snapshot_store.snapshot_date_from_filename(filepath)
+                if file_date is None:
+                    selected_files.append(filepath)
+                elif ((start_date is None or file_date >= pd.Timestamp(start_date))
+                      and (end_date is None or file_date <= pd.Timestamp(end_date))
+                      and (wanted is None or file_date in wanted)):
+                    selected_files.append(filepath)
+            snapshot_files = selected_files
         
         if not snapshot_files:
             print("No historical snapshot files found.")
@@ -1755,6 +2088,12 @@ class DataManager:
             snapshot_files = glob.glob(os.path.join(snapshots_dir, 'holdings_snapshot_*.*'))
             
             deleted_count = 0
+            store = self._get_snapshot_store()
+            if store is not None:
+                for removed_date in store.delete_before(cutoff_date):
+                    deleted_count += 1
+                    print(f"Deleted old snapshot from store: {removed_date.strftime('%Y-%m-%d')}")
+
             for filepath in snapshot_files:
                 # Extract date from filename
                 filename = os.path.basename(filepath)
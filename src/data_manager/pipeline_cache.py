@@ -0,0 +1,239 @@
+"""
+Persistent cache for the DataManager Excel pipeline outputs.
+
+The cleaned, calculated and final DataFrames produced by DataManager are
+written as Parquet files next to a JSON manifest. The manifest records:
+- a fingerprint (path, mtime, size) of the input files of every source branch
+  (financial summary, funds, gold, insurance, RSU, Schwab)
+- a hash of the settings, the column mappings and the pipeline modules
+
+When no fingerprint changed the frames are loaded straight from Parquet.
+When only some sources changed, DataManager re-reads and re-cleans just those
+branches and reuses the cached cleaned frames of the others.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+CACHE_FORMAT_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+
+# Modules whose code shapes the cached frames; editing them invalidates the cache
+PIPELINE_MODULES = ('manager.py', 'readers.py', 'cleaners.py', 'calculators.py', 'pipeline_cache.py')
+
+
+def parquet_available() -> bool:
+    """Returns True if a pandas Parquet engine (pyarrow) is installed."""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def file_fingerprint(path: str) -> List[Any]:
+    """Returns [path, mtime_ns, size] for a file, with None stats if it is missing."""
+    try:
+        stat = os.stat(path)
+        return [path, stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        return [path, None, None]
+
+
+def compute_settings_hash(settings: Dict[str, Any], extra_files: Iterable[str] = ()) -> str:
+    """
+    Hash the settings dict together with auxiliary config files and pipeline code.
+
+    Args:
+        settings: Parsed settings.yaml contents
+        extra_files: Additional files whose contents affect the pipeline
+                     (e.g. column_mapping.yaml)
+
+    Returns:
+        Hex digest identifying this pipeline configuration
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_FORMAT_VERSION}".encode())
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+
+    for path in extra_files:
+        digest.update(path.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in PIPELINE_MODULES:
+        digest.update(json.dumps(file_fingerprint(os.path.join(module_dir, module))[1:]).encode())
+
+    return digest.hexdigest()
+
+
+class PipelineCache:
+    """
+    Parquet-backed store for named pipeline frames with per-source invalidation.
+
+    Frames are addressed by names such as 'cleaned/fund_transactions' or
+    'final/holdings_df'. Series are stored as single-column frames and None
+    values are recorded in the manifest only. Frames Arrow cannot represent
+    (e.g. mixed-type object columns) are pickled instead.
+    """
+
+    def __init__(self, cache_dir: str, settings_hash: str):
+        """
+        Args:
+            cache_dir: Directory for the manifest and frame files (created if needed)
+            settings_hash: Output of compute_settings_hash for the current configuration
+        """
+        self.cache_dir = cache_dir
+        self.settings_hash = settings_hash
+        os.makedirs(cache_dir, exist_ok=True)
+        self._manifest = self._read_manifest()
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.cache_dir, MANIFEST_FILENAME)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._manifest_path(), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('version') != CACHE_FORMAT_VERSION or manifest.get('settings_hash') != self.settings_hash:
+            return None
+        return manifest
+
+    def stale_sources(self, source_fingerprints: Dict[str, Any]) -> Set[str]:
+        """
+        Returns the sources whose input files changed since the cache was written.
+
+        Every source is stale if there is no valid manifest for the current settings.
+        """
+        if self._manifest is None:
+            return set(source_fingerprints)
+
+        cached = self._manifest.get('sources', {})
+        return {
+            source for source, fingerprint in source_fingerprints.items()
+            if cached.get(source) != json.loads(json.dumps(fingerprint))
+        }
+
+    def load_frames(self, names: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """
+        Load the named frames from the cache.
+
+        Returns:
+            Mapping of name to DataFrame/Series/None, or None if any frame is missing
+            or unreadable (the caller should then recompute everything).
+        """
+        if self._manifest is None:
+            return None
+
+        entries = self._manifest.get('frames', {})
+        frames = {}
+        for name in names:
+            entry = entries.get(name)
+            if entry is None:
+                return None
+            try:
+                frames[name] = self._read_frame(entry)
+            except Exception as e:
+                print(f"  - Warning: Pipeline cache entry '{name}' unreadable ({e}).")
+                return None
+        return frames
+
+    def _read_frame(self, entry: Dict[str, Any]) -> Any:
+        kind = entry['kind']
+        if kind == 'none':
+            return None
+
+        path = os.path.join(self.cache_dir, entry['file'])
+        if entry.get('format') == 'pickle':
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+
+        df = pd.read_parquet(path)
+        if kind == 'series':
+            series = df.iloc[:, 0]
+            series.name = entry.get('series_name')
+            return series
+        return df
+
+    def save(self, source_fingerprints: Dict[str, Any], frames: Dict[str, Any]) -> bool:
+        """
+        Write all frames and a manifest for the given source fingerprints.
+
+        Frame files get new names on every save and the manifest is replaced last,
+        so an interrupted save leaves the previous cache intact.
+
+        Returns:
+            True if the cache was written
+        """
+        entries = {}
+        # Fresh file names per save so the current manifest's files stay intact until replaced
+        token = uuid.uuid4().hex[:8]
+        try:
+            for name, value in frames.items():
+                entries[name] = self._write_frame(name, value, token)
+
+            manifest = {
+                'version': CACHE_FORMAT_VERSION,
+                'settings_hash': self.settings_hash,
+                'sources': source_fingerprints,
+                'frames': entries,
+            }
+            tmp_path = self._manifest_path() + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, default=str)
+            os.replace(tmp_path, self._manifest_path())
+        except Exception as e:
+            print(f"  - Warning: Could not write pipeline cache: {e}")
+            return False
+
+        self._manifest = json.loads(json.dumps(manifest, default=str))
+        self._remove_orphans({entry['file'] for entry in entries.values() if entry.get('file')})
+        return True
+
+    def _write_frame(self, name: str, value: Any, token: str) -> Dict[str, Any]:
+        if value is None:
+            return {'kind': 'none'}
+
+        kind = 'series' if isinstance(value, pd.Series) else 'frame'
+        entry: Dict[str, Any] = {'kind': kind}
+        df = value
+        if kind == 'series':
+            entry['series_name'] = value.name
+            df = value.to_frame(name='value')
+
+        stem = f"{name.replace('/', '__')}.{token}"
+        try:
+            filename = f"{stem}.parquet"
+            df.to_parquet(os.path.join(self.cache_dir, filename))
+            entry['format'] = 'parquet'
+        except Exception:
+            # Arrow cannot represent this frame; keep it exact with pickle instead
+            filename = f"{stem}.pkl"
+            with open(os.path.join(self.cache_dir, filename), 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry['format'] = 'pickle'
+
+        entry['file'] = filename
+        return entry
+
+    def _remove_orphans(self, keep: Set[str]) -> None:
+        """Delete frame files no longer referenced by the manifest."""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(('.parquet', '.pkl', '.tmp')) and filename not in keep:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError:
+                    pass
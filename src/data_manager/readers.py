@@ -2,7 +2,7 @@ import pandas as pd
 import yaml
 import os
 import glob
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 def load_settings(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
     """Loads configuration settings from a YAML file."""
@@ -18,16 +18,115 @@ def load_settings(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
         print(f"Error loading configuration from {config_path}: {e}")
         raise
 
+# Excel engines accepted under settings['excel_reader']['engine'].
+# 'calamine' (python-calamine, pandas>=2.2) parses values only and is several
+# times faster than openpyxl; 'auto' uses it when installed.
+EXCEL_ENGINES = ('openpyxl', 'calamine', 'auto')
+
+
+def calamine_available() -> bool:
+    """Returns True if the python-calamine Excel engine is installed."""
+    try:
+        import python_calamine  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_excel_engine(settings: Optional[Dict[str, Any]]) -> str:
+    """
+    Resolves the pandas Excel engine from settings.
+
+    openpyxl is always opened read-only and values-only by pandas; calamine is used
+    when requested (or with 'auto') and installed, otherwise openpyxl.
+    """
+    engine = ((settings or {}).get('excel_reader') or {}).get('engine', 'openpyxl')
+    if engine not in EXCEL_ENGINES:
+        print(f"Warning: Unknown excel_reader engine '{engine}', using openpyxl.")
+        return 'openpyxl'
+    if engine in ('calamine', 'auto'):
+        if calamine_available():
+            return 'calamine'
+        if engine == 'calamine':
+            print("Warning: python-calamine is not installed, using openpyxl.")
+    return 'openpyxl'
+
+
+def read_excel_sheets(
+    file_config: Dict[str, Any],
+    sheet_specs: Dict[str, Dict[str, Any]],
+    engine: str = 'openpyxl'
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Reads several sheets of one workbook, opening and parsing the file only once.
+
+    Args:
+        file_config: Dictionary containing 'path' and 'sheets' mapping for the file.
+        sheet_specs: Sheet key (as defined under the file's 'sheets' in settings.yaml)
+                     -> read options: 'header_row', 'use_cols', 'converters'.
+        engine: pandas Excel engine ('openpyxl' or 'calamine').
+
+    Returns:
+        Dictionary with one DataFrame per sheet key, or None for sheets that
+        are not configured, missing, or fail to parse.
+    """
+    results: Dict[str, Optional[pd.DataFrame]] = {key: None for key in sheet_specs}
+    file_path = file_config.get('path')
+    sheet_names = file_config.get('sheets', {})
+
+    if not file_path:
+        print("Error: Path not found in file configuration.")
+        return results
+
+    if not os.path.exists(file_path):
+        print(f"Error: File not found at {file_path}")
+        return results
+
+    try:
+        xls = pd.ExcelFile(file_path, engine=engine)
+    except Exception as e:
+        print(f"Error opening {file_path}: {e}")
+        return results
+
+    with xls:
+        for sheet_key, options in sheet_specs.items():
+            actual_sheet_name = sheet_names.get(sheet_key)
+            if not actual_sheet_name:
+                print(f"Error: Sheet key '{sheet_key}' not found in file configuration.")
+                continue
+            if actual_sheet_name not in xls.sheet_names:
+                print(f"Error: Sheet '{actual_sheet_name}' not found in {os.path.basename(file_path)}")
+                continue
+
+            header_row = options.get('header_row', 0)
+            print(f"Reading sheet '{actual_sheet_name}' from {os.path.basename(file_path)} (Header row: {header_row})...")
+            try:
+                df = xls.parse(
+                    sheet_name=actual_sheet_name,
+                    header=header_row,
+                    usecols=options.get('use_cols'),
+                    converters=options.get('converters')
+                )
+                print(f"  Successfully read {df.shape[0]} rows, {df.shape[1]} columns.")
+                results[sheet_key] = df
+            except Exception as e:
+                print(f"Error reading sheet '{actual_sheet_name}' from {file_path}: {e}")
+
+    return results
+
 def read_excel_file(
     file_config: Dict[str, Any],
     sheet_name: str,
     header_row: int = 0, # Default header row is 0 (first row)
     use_cols: Optional[list] = None,
-    converters: Optional[Dict] = None
+    converters: Optional[Dict] = None,
+    engine: str = 'openpyxl'
 ) -> Optional[pd.DataFrame]:
     """
     Reads a specific sheet from an Excel file based on configuration.
 
+    Prefer read_excel_sheets when more than one sheet of the same workbook is needed.
+
     Args:
         file_config: Dictionary containing 'path' and 'sheets' mapping for the file.
         sheet_name: The specific sheet name key (e.g., 'balance_sheet', 'transactions')
@@ -35,43 +134,14 @@ def read_excel_file(
         header_row: The 0-indexed row number to use as the header.
         use_cols: Optional list of columns to read.
         converters: Optional dictionary specifying converters for columns.
+        engine: pandas Excel engine ('openpyxl' or 'calamine').
 
     Returns:
         A pandas DataFrame containing the data from the specified sheet,
         or None if the file/sheet doesn't exist or an error occurs.
     """
-    file_path = file_config.get('path')
-    actual_sheet_name = file_config.get('sheets', {}).get(sheet_name)
-
-    if not file_path or not actual_sheet_name:
-        print(f"Error: Path or sheet key '{sheet_name}' not found in file configuration.")
-        return None
-
-    if not os.path.exists(file_path):
-        print(f"Error: File not found at {file_path}")
-        return None
-
-    print(f"Reading sheet '{actual_sheet_name}' from {os.path.basename(file_path)} (Header row: {header_row})...")
-    try:
-        # Check if sheet exists before reading
-        xls = pd.ExcelFile(file_path, engine='openpyxl')
-        if actual_sheet_name not in xls.sheet_names:
-             print(f"Error: Sheet '{actual_sheet_name}' not found in {os.path.basename(file_path)}")
-             return None
-
-        df = pd.read_excel(
-            file_path,
-            sheet_name=actual_sheet_name,
-            header=header_row,
-            engine='openpyxl', # Explicitly use openpyxl
-            usecols=use_cols,
-            converters=converters
-        )
-        print(f"  Successfully read {df.shape[0]} rows, {df.shape[1]} columns.")
-        return df
-    except Exception as e:
-        print(f"Error reading sheet '{actual_sheet_name}' from {file_path}: {e}")
-        return None
+    spec = {'header_row': header_row, 'use_cols': use_cols, 'converters': converters}
+    return read_excel_sheets(file_config, {sheet_name: spec}, engine=engine)[sheet_name]
 
 # --- Specific Reader Functions ---
 
@@ -82,12 +152,12 @@ def read_financial_summary_data(settings: Dict[str, Any]) -> Dict[str, Optional[
         print("Error: 'financial_summary' configuration not found in settings.")
         return {'balance_sheet': None, 'monthly_income_expense': None}
 
-    # Balance Sheet: Header is on Row 4 (index 3)
-    balance_df = read_excel_file(fs_config, 'balance_sheet', header_row=3)
-    # Monthly Income/Expense: Header is on Row 4 (index 3)
-    monthly_df = read_excel_file(fs_config, 'monthly_income_expense', header_row=3)
-
-    return {'balance_sheet': balance_df, 'monthly_income_expense': monthly_df}
+    # Balance Sheet and Monthly Income/Expense: Header is on Row 4 (index 3)
+    return read_excel_sheets(
+        fs_config,
+        {'balance_sheet': {'header_row': 3}, 'monthly_income_expense': {'header_row': 3}},
+        engine=get_excel_engine(settings)
+    )
 
 def read_fund_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]:
     """Reads Fund Holdings and Transactions data."""
@@ -99,10 +169,11 @@ def read_fund_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]
     # Specify converters for fund code
     converters = {'基金代码': str}
 
-    holdings_df = read_excel_file(fund_config, 'holdings', header_row=0, converters=converters)
-    transactions_df = read_excel_file(fund_config, 'transactions', header_row=0, converters=converters)
-
-    return {'holdings': holdings_df, 'transactions': transactions_df}
+    return read_excel_sheets(
+        fund_config,
+        {'holdings': {'converters': converters}, 'transactions': {'converters': converters}},
+        engine=get_excel_engine(settings)
+    )
 
 def read_gold_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]:
     """Reads Gold Holdings and Transactions data."""
@@ -111,10 +182,9 @@ def read_gold_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]
         print("Error: 'gold_transactions' configuration not found in settings.")
         return {'holdings': None, 'transactions': None}
 
-    holdings_df = read_excel_file(gold_config, 'holdings', header_row=0)
-    transactions_df = read_excel_file(gold_config, 'transactions', header_row=0)
-
-    return {'holdings': holdings_df, 'transactions': transactions_df}
+    return read_excel_sheets(
+        gold_config, {'holdings': {}, 'transactions': {}}, engine=get_excel_engine(settings)
+    )
 
 def read_insurance_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]:
     """Reads Insurance Summary and Premiums data."""
@@ -123,10 +193,10 @@ def read_insurance_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataF
         print("Error: 'insurance_portfolio' configuration not found in settings.")
         return {'summary': None, 'premiums': None}
 
-    summary_df = read_excel_file(ins_config, 'summary', header_row=0)
-    premiums_df = read_excel_file(ins_config, 'premiums', header_row=0) # Premiums read in wide format initially
-
-    return {'summary': summary_df, 'premiums': premiums_df}
+    # Premiums read in wide format initially
+    return read_excel_sheets(
+        ins_config, {'summary': {}, 'premiums': {}}, engine=get_excel_engine(settings)
+    )
 
 def read_rsu_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]:
     """Reads RSU Transactions data."""
@@ -138,7 +208,7 @@ def read_rsu_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]
 
     # Assuming the sheet name is defined as 'transactions' in settings for rsu_transactions
     # Assuming header is on the first row (index 0)
-    transactions_df = read_excel_file(rsu_config, 'transactions', header_row=0)
+    transactions_df = read_excel_file(rsu_config, 'transactions', header_row=0, engine=get_excel_engine(settings))
 
     return {'transactions': transactions_df}
 
@@ -269,6 +339,68 @@ def read_schwab_data(settings: Dict[str, Any]) -> Dict[str, Optional[pd.DataFram
 
     return {'holdings': holdings_df, 'transactions': transactions_df}
 
+# Source key in read_all_sources output -> (reader, data_files config key)
+SOURCE_READERS = {
+    'financial_summary': (read_financial_summary_data, 'financial_summary'),
+    'funds': (read_fund_data, 'fund_transactions'),
+    'gold': (read_gold_data, 'gold_transactions'),
+    'insurance': (read_insurance_data, 'insurance_portfolio'),
+    'rsu': (read_rsu_data, 'rsu_transactions'),
+    'schwab': (read_schwab_data, 'schwab_investments'),
+}
+
+DEMO_DATA_PATH = 'data/mock_financial_data.xlsx'
+
+
+def uses_demo_data(settings: Dict[str, Any]) -> bool:
+    """True if the primary data files are missing and the demo workbook will be read instead."""
+    primary_file = settings.get('data_files', {}).get('financial_summary', {}).get('path')
+    return bool(primary_file) and not os.path.exists(primary_file) and os.path.exists(DEMO_DATA_PATH)
+
+
+def get_source_files(settings: Dict[str, Any], source: str) -> List[str]:
+    """
+    Lists the input files a source reads (all files matching Schwab glob patterns).
+
+    Args:
+        settings: Parsed settings
+        source: Key of SOURCE_READERS
+
+    Returns:
+        Sorted list of file paths (configured paths are included even if missing)
+    """
+    if uses_demo_data(settings):
+        return [DEMO_DATA_PATH]
+
+    source_config = settings.get('data_files', {}).get(SOURCE_READERS[source][1]) or {}
+    files = []
+    if source_config.get('path'):
+        files.append(source_config['path'])
+    for key in ('holdings_path_pattern', 'transactions_path_pattern'):
+        if source_config.get(key):
+            files.extend(glob.glob(source_config[key]))
+    return sorted(set(files))
+
+
+def read_sources(settings: Dict[str, Any], sources: List[str]) -> Dict[str, Any]:
+    """
+    Reads only the given sources, in the same shape as read_all_sources.
+
+    Args:
+        settings: Parsed settings
+        sources: Keys of SOURCE_READERS to read
+
+    Returns:
+        Dictionary with one entry per requested source
+    """
+    all_data = {}
+    for source, (reader, _) in SOURCE_READERS.items():
+        if source in sources:
+            print(f"\n--- Reading {source} ---")
+            all_data[source] = reader(settings)
+    return all_data
+
+
 def read_all_sources(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
     """
     Reads all configured data sources.
@@ -292,19 +424,10 @@ def read_all_sources(config_path: str = 'config/settings.yaml') -> Dict[str, Any
     all_data = {}
     
     # Check for demo mode - if primary data files don't exist, try mock data
-    demo_data_path = 'data/mock_financial_data.xlsx'
-    use_demo_mode = False
-    
-    # Check if any primary data file exists
-    primary_file = settings.get('data_files', {}).get('financial_summary', {}).get('path')
-    if primary_file and not os.path.exists(primary_file):
-        if os.path.exists(demo_data_path):
-            print(f"\n⚠️  Primary data files not found. Using demo data: {demo_data_path}")
-            use_demo_mode = True
-    
-    if use_demo_mode:
+    if uses_demo_data(settings):
+        print(f"\n⚠️  Primary data files not found. Using demo data: {DEMO_DATA_PATH}")
         # Load from consolidated demo file
-        return _read_demo_data(demo_data_path)
+        return _read_demo_data(DEMO_DATA_PATH)
 
     print("\n--- Reading Financial Summary ---")
     all_data['financial_summary'] = read_financial_summary_data(settings)
@@ -408,12 +531,16 @@ def _read_demo_data(demo_path: str) -> Dict[str, Any]:
             'schwab': {'holdings': None, 'transactions': None}
         }
 
-def read_raw_fund_sheets(file_path: str) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+def read_raw_fund_sheets(
+    file_path: str,
+    settings: Optional[Dict[str, Any]] = None
+) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
     """
     Reads raw fund data from paste sheets for automated processing.
     
     Args:
         file_path: Path to the Excel file containing raw paste sheets.
+        settings: Loaded settings, used for the excel_reader engine (openpyxl if None).
         
     Returns:
         tuple: (raw_holdings_df, raw_transactions_df)
@@ -428,31 +555,33 @@ def read_raw_fund_sheets(file_path: str) -> tuple[Optional[pd.DataFrame], Option
         return None, None
     
     try:
-        # Read raw holdings paste sheet
-        raw_holdings_df = None
-        try:
-            raw_holdings_df = pd.read_excel(file_path, sheet_name='raw_holdings_paste')
-            if raw_holdings_df.empty:
-                logger.warning("raw_holdings_paste sheet is empty")
-                raw_holdings_df = None
-            else:
-                logger.info(f"Successfully read {len(raw_holdings_df)} rows from raw_holdings_paste")
-        except Exception as e:
-            logger.warning(f"Error reading raw_holdings_paste sheet: {e}")
+        # Open the workbook once for both paste sheets
+        with pd.ExcelFile(file_path, engine=get_excel_engine(settings)) as xls:
+            # Read raw holdings paste sheet
             raw_holdings_df = None
-        
-        # Read raw transactions paste sheet  
-        raw_transactions_df = None
-        try:
-            raw_transactions_df = pd.read_excel(file_path, sheet_name='raw_transactions_paste')
-            if raw_transactions_df.empty:
-                logger.warning("raw_transactions_paste sheet is empty")
-                raw_transactions_df = None
-            else:
-                logger.info(f"Successfully read {len(raw_transactions_df)} rows from raw_transactions_paste")
-        except Exception as e:
-            logger.warning(f"Error reading raw_transactions_paste sheet: {e}")
+            try:
+                raw_holdings_df = xls.parse(sheet_name='raw_holdings_paste')
+                if raw_holdings_df.empty:
+                    logger.warning("raw_holdings_paste sheet is empty")
+                    raw_holdings_df = None
+                else:
+                    logger.info(f"Successfully read {len(raw_holdings_df)} rows from raw_holdings_paste")
+            except Exception as e:
+                logger.warning(f"Error reading raw_holdings_paste sheet: {e}")
+                raw_holdings_df = None
+            
+            # Read raw transactions paste sheet  
             raw_transactions_df = None
+            try:
+                raw_transactions_df = xls.parse(sheet_name='raw_transactions_paste')
+                if raw_transactions_df.empty:
+                    logger.warning("raw_transactions_paste sheet is empty")
+                    raw_transactions_df = None
+                else:
+                    logger.info(f"Successfully read {len(raw_transactions_df)} rows from raw_transactions_paste")
+            except Exception as e:
+                logger.warning(f"Error reading raw_transactions_paste sheet: {e}")
+                raw_transactions_df = None
             
         return raw_holdings_df, raw_transactions_df
         
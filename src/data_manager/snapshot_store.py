@@ -0,0 +1,243 @@
+"""
+Partitioned Parquet store for historical holdings snapshots.
+
+Snapshots live in one Hive-partitioned dataset under the snapshots directory:
+
+    holdings_dataset/year=2024/month=03/holdings_snapshot_20240331.parquet
+
+Reads push the requested date range (or date list) down to pyarrow, so only
+the matching year/month partitions are opened and only matching rows are
+materialised. Each snapshot date is one file, so re-saving a date replaces it
+and available dates are known from file names without reading any data.
+
+convert_legacy_snapshots() migrates the flat holdings_snapshot_YYYYMMDD.xlsx/
+.csv/.parquet files written by earlier versions.
+"""
+
+import glob
+import os
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+DATASET_DIRNAME = 'holdings_dataset'
+SNAPSHOT_PREFIX = 'holdings_snapshot_'
+LEGACY_EXTENSIONS = ('.xlsx', '.csv', '.parquet')
+
+
+def pyarrow_available() -> bool:
+    """Returns True if pyarrow (with the dataset API) is installed."""
+    try:
+        import pyarrow.dataset  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def snapshot_date_from_filename(filename: str) -> Optional[pd.Timestamp]:
+    """Parses the YYYYMMDD date from a holdings_snapshot_YYYYMMDD.* file name."""
+    stem = os.path.basename(filename)
+    if not stem.startswith(SNAPSHOT_PREFIX):
+        return None
+    date_str = stem[len(SNAPSHOT_PREFIX):].split('.')[0]
+    try:
+        return pd.to_datetime(date_str, format='%Y%m%d')
+    except ValueError:
+        return None
+
+
+def read_snapshot_file(filepath: str) -> pd.DataFrame:
+    """
+    Reads one flat snapshot file (.xlsx, .csv or .parquet).
+
+    Raises:
+        ValueError: For unsupported extensions
+    """
+    if filepath.endswith('.xlsx'):
+        df = pd.read_excel(filepath, sheet_name='Holdings_Snapshot')
+    elif filepath.endswith('.csv'):
+        df = pd.read_csv(filepath)
+    elif filepath.endswith('.parquet'):
+        df = pd.read_parquet(filepath)
+    else:
+        raise ValueError(f"Unsupported file format: {filepath}")
+
+    if 'Snapshot_Date' in df.columns:
+        df['Snapshot_Date'] = pd.to_datetime(df['Snapshot_Date'])
+    return df
+
+
+class SnapshotStore:
+    """Year/month partitioned Parquet dataset of holdings snapshots."""
+
+    def __init__(self, snapshots_dir: str):
+        """
+        Args:
+            snapshots_dir: Historical snapshots directory; the dataset is kept in
+                           its holdings_dataset/ subdirectory (created if needed)
+        """
+        self.root = os.path.join(snapshots_dir, DATASET_DIRNAME)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _partition_dir(self, snapshot_date: pd.Timestamp) -> str:
+        return os.path.join(self.root, f"year={snapshot_date.year}", f"month={snapshot_date.month:02d}")
+
+    def _snapshot_path(self, snapshot_date: pd.Timestamp) -> str:
+        filename = f"{SNAPSHOT_PREFIX}{snapshot_date.strftime('%Y%m%d')}.parquet"
+        return os.path.join(self._partition_dir(snapshot_date), filename)
+
+    def _snapshot_files(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.root, 'year=*', 'month=*', f'{SNAPSHOT_PREFIX}*.parquet')))
+
+    def write(self, snapshot_df: pd.DataFrame, snapshot_date: pd.Timestamp) -> str:
+        """
+        Write (or replace) the snapshot for one date.
+
+        Args:
+            snapshot_df: Flat holdings frame including a Snapshot_Date column
+            snapshot_date: Date of the snapshot
+
+        Returns:
+            Path of the written file
+        """
+        snapshot_date = pd.Timestamp(snapshot_date)
+        path = self._snapshot_path(snapshot_date)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        frame = snapshot_df.copy()
+        frame['Snapshot_Date'] = pd.to_datetime(frame['Snapshot_Date'])
+        tmp_path = path + '.tmp'
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def available_dates(self) -> List[pd.Timestamp]:
+        """Sorted snapshot dates in the store (from file names, no data is read)."""
+        dates = (snapshot_date_from_filename(path) for path in self._snapshot_files())
+        return sorted(date for date in dates if date is not None)
+
+    def read(
+        self,
+        start_date: Optional[pd.Timestamp] = None,
+        end_date: Optional[pd.Timestamp] = None,
+        dates: Optional[Iterable[pd.Timestamp]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load snapshots, pruning partitions and rows outside the requested dates.
+
+        Args:
+            start_date: Inclusive lower bound on Snapshot_Date
+            end_date: Inclusive upper bound on Snapshot_Date
+            dates: Exact snapshot dates to load (combined with the bounds)
+
+        Returns:
+            Flat DataFrame of all matching snapshot rows, or None if nothing matches
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        if not self._snapshot_files():
+            return None
+
+        partition_filter = None
+        row_filter = None
+
+        def both(left, right):
+            return right if left is None else left & right
+
+        year, month = ds.field('year'), ds.field('month')
+        snapshot_date = ds.field('Snapshot_Date')
+        if start_date is not None:
+            start_date = pd.Timestamp(start_date)
+            partition_filter = both(partition_filter, (year > start_date.year) | ((year == start_date.year) & (month >= start_date.month)))
+            row_filter = both(row_filter, snapshot_date >= pa.scalar(start_date.to_pydatetime()))
+        if end_date is not None:
+            end_date = pd.Timestamp(end_date)
+            partition_filter = both(partition_filter, (year < end_date.year) | ((year == end_date.year) & (month <= end_date.month)))
+            row_filter = both(row_filter, snapshot_date <= pa.scalar(end_date.to_pydatetime()))
+        if dates is not None:
+            dates = sorted({pd.Timestamp(date) for date in dates})
+            if not dates:
+                return None
+            in_months = None
+            for y, m in sorted({(date.year, date.month) for date in dates}):
+                month_expr = (year == y) & (month == m)
+                in_months = month_expr if in_months is None else in_months | month_expr
+            partition_filter = both(partition_filter, in_months)
+            row_filter = both(row_filter, snapshot_date.isin(pa.array([date.to_pydatetime() for date in dates], type=pa.timestamp('us'))))
+
+        dataset = ds.dataset(self.root, format='parquet', partitioning='hive')
+        frames = []
+        # Fragments are read with their own schema so snapshots with different columns combine in pandas
+        for fragment in dataset.get_fragments(filter=partition_filter):
+            table = fragment.to_table(filter=row_filter)
+            if table.num_rows:
+                frames.append(table.to_pandas())
+
+        if not frames:
+            return None
+        combined = pd.concat(frames, ignore_index=True)
+        return combined.drop(columns=[col for col in ('year', 'month') if col in combined.columns])
+
+    def delete_before(self, cutoff_date: pd.Timestamp) -> List[pd.Timestamp]:
+        """
+        Remove snapshots dated before cutoff_date.
+
+        Returns:
+            Dates of the removed snapshots
+        """
+        removed = []
+        for path in self._snapshot_files():
+            date = snapshot_date_from_filename(path)
+            if date is not None and date < cutoff_date:
+                os.remove(path)
+                removed.append(date)
+                partition_dir = os.path.dirname(path)
+                if not os.listdir(partition_dir):
+                    os.rmdir(partition_dir)
+        return removed
+
+
+def find_legacy_snapshots(snapshots_dir: str) -> List[str]:
+    """Flat holdings_snapshot_* files in snapshots_dir (not inside the dataset)."""
+    return sorted(
+        path for path in glob.glob(os.path.join(snapshots_dir, f'{SNAPSHOT_PREFIX}*.*'))
+        if path.endswith(LEGACY_EXTENSIONS)
+    )
+
+
+def convert_legacy_snapshots(snapshots_dir: str, store: SnapshotStore, remove_source: bool = False) -> int:
+    """
+    One-shot migration of flat xlsx/csv/parquet snapshots into the dataset.
+
+    When several formats exist for the same date the file read last wins
+    (sorted by name, so .xlsx over .parquet over .csv).
+
+    Args:
+        snapshots_dir: Directory holding holdings_snapshot_YYYYMMDD.* files
+        store: Destination store
+        remove_source: Delete each legacy file after it was converted
+
+    Returns:
+        Number of snapshots written
+    """
+    converted = 0
+    for filepath in find_legacy_snapshots(snapshots_dir):
+        snapshot_date = snapshot_date_from_filename(filepath)
+        if snapshot_date is None:
+            print(f"Could not parse date from filename: {os.path.basename(filepath)}")
+            continue
+        try:
+            df = read_snapshot_file(filepath)
+            if 'Snapshot_Date' not in df.columns:
+                df['Snapshot_Date'] = snapshot_date
+            store.write(df, snapshot_date)
+        except Exception as e:
+            print(f"Error converting snapshot {filepath}: {e}")
+            continue
+
+        converted += 1
+        print(f"Converted snapshot: {os.path.basename(filepath)}")
+        if remove_source:
+            os.remove(filepath)
+    return converted
@@ -6,7 +6,10 @@ This module provides SQLAlchemy ORM models and database management utilities
 to replace Excel-based data storage with a robust, queryable database.
 """
 
-from .base import Base, get_engine, get_session, init_database, reset_engine
+from .base import (
+    Base, get_engine, get_session, init_database, reset_engine,
+    get_read_engine, get_scoped_session, remove_scoped_session, get_pool_stats,
+)
 from .migrator import DatabaseMigrator
 from .connector import DatabaseConnector
 from .models import (
@@ -36,6 +39,10 @@ __all__ = [
     'get_session',
     'init_database',
     'reset_engine',
+    'get_read_engine',
+    'get_scoped_session',
+    'remove_scoped_session',
+    'get_pool_stats',
     # Migration tool
     'DatabaseMigrator',
     # Database connector
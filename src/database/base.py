@@ -7,14 +7,19 @@ for the Personal Investment System database.
 """
 
 import os
-from typing import Optional
-from sqlalchemy import create_engine, event
+from itertools import chain
+from typing import Any, Dict, Optional, Set
+from sqlalchemy import create_engine, event, inspect as sa_inspect
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker, Session
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
 import logging
 from dotenv import load_dotenv
 
+from .query_cache import CACHED_TABLES, bump_generation, query_cache
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -27,6 +32,140 @@ Base = declarative_base()
 _engine: Optional[Engine] = None
 _SessionFactory: Optional[sessionmaker] = None
 
+# SQLite connection handling, chosen with the DB_POOL_MODE environment variable:
+#   static - one connection shared by all threads (default)
+#   pooled - WAL mode, a pool of read connections (one per active thread/session)
+#            and a single dedicated writer connection
+POOL_MODES = ('static', 'pooled')
+DEFAULT_READ_POOL_SIZE = 5
+DEFAULT_READ_POOL_OVERFLOW = 10
+# Seconds to wait for the writer connection / a locked database
+WRITER_TIMEOUT = 30
+
+# Read-only engine in pooled mode (None otherwise)
+_read_engine: Optional[Engine] = None
+# Thread-local sessions for request handling
+_scoped_session: Optional[scoped_session] = None
+
+
+def get_pool_mode() -> str:
+    """Returns the configured SQLite pool mode ('static' or 'pooled')."""
+    mode = os.getenv('DB_POOL_MODE', 'static').strip().lower()
+    if mode not in POOL_MODES:
+        logger.warning(f"Unknown DB_POOL_MODE '{mode}', using 'static'")
+        return 'static'
+    return mode
+
+
+def pooling_enabled() -> bool:
+    """True if separate reader/writer engines are active."""
+    get_engine()
+    return _read_engine is not None
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Per-connection settings for pooled SQLite connections."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")  # Readers never block the writer (and vice versa)
+    cursor.execute(f"PRAGMA busy_timeout={WRITER_TIMEOUT * 1000}")
+    cursor.close()
+
+
+def _create_pooled_engines(database_url: str, echo: bool) -> Engine:
+    """Creates the writer engine (returned) and the reader engine for pooled mode."""
+    global _read_engine
+
+    connect_args = {'check_same_thread': False, 'timeout': WRITER_TIMEOUT}
+    writer = create_engine(
+        database_url,
+        echo=echo,
+        connect_args=connect_args,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,  # Writers queue here instead of failing with 'database is locked'
+        pool_timeout=WRITER_TIMEOUT,
+    )
+    reader = create_engine(
+        database_url,
+        echo=echo,
+        connect_args=connect_args,
+        poolclass=QueuePool,
+        pool_size=int(os.getenv('DB_READ_POOL_SIZE', DEFAULT_READ_POOL_SIZE)),
+        max_overflow=int(os.getenv('DB_READ_POOL_OVERFLOW', DEFAULT_READ_POOL_OVERFLOW)),
+        pool_timeout=WRITER_TIMEOUT,
+    )
+    for engine in (writer, reader):
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+
+    _read_engine = reader
+    return writer
+
+
+def _is_write(clause: Any) -> bool:
+    """True for statements that must run on the writer connection."""
+    if isinstance(clause, UpdateBase):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith(('SELECT', 'WITH', 'PRAGMA', 'EXPLAIN'))
+    return False
+
+
+class RoutingSession(Session):
+    """
+    Session that reads through the reader pool and writes through the writer.
+
+    Once a transaction has written (flush, INSERT/UPDATE/DELETE or non-SELECT
+    text SQL) it stays on the writer until commit/rollback, so it keeps seeing
+    its own uncommitted changes. Requests without a statement (session.connection(),
+    dialect lookups) also go to the writer, since the caller may write through them.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if _read_engine is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        if self.info.get('writing') or self._flushing or clause is None or _is_write(clause):
+            self.info['writing'] = True
+            return _engine
+        return _read_engine
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    """Tables written by the session's current transaction."""
+    return session.info.setdefault('changed_tables', set())
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _record_flushed_tables(session, flush_context):
+    tables = _changed_tables(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        tables.update(table.name for table in sa_inspect(obj).mapper.tables)
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _record_executed_tables(orm_execute_state):
+    statement = orm_execute_state.statement
+    if not _is_write(statement):
+        return
+    table = getattr(statement, 'table', None)
+    name = getattr(table, 'name', None)
+    # Text SQL doesn't say which tables it touches
+    _changed_tables(orm_execute_state.session).update([name] if name else CACHED_TABLES)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _bump_changed_tables(session):
+    tables = session.info.pop('changed_tables', None)
+    if tables:
+        bump_generation(*tables)
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _release_writer(session, transaction):
+    if transaction.parent is None:
+        session.info.pop('writing', None)
+        session.info.pop('changed_tables', None)
+
 
 def get_engine(database_url: Optional[str] = None, echo: bool = False) -> Engine:
     """
@@ -70,7 +209,9 @@ def get_engine(database_url: Optional[str] = None, echo: bool = False) -> Engine
             logger.info(f"Using database: {db_path}")
     
     # Create engine with SQLite-specific settings
-    if database_url.startswith('sqlite'):
+    if database_url.startswith('sqlite') and get_pool_mode() == 'pooled' and ':memory:' not in database_url:
+        _engine = _create_pooled_engines(database_url, echo)
+    elif database_url.startswith('sqlite'):
         # Enable foreign key constraints for SQLite
         _engine = create_engine(
             database_url,
@@ -130,11 +271,69 @@ def get_session() -> Session:
             Base.metadata.create_all(engine)
             logger.info("✅ Database schema auto-initialized successfully")
         
-        _SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+        _SessionFactory = sessionmaker(bind=engine, class_=RoutingSession, expire_on_commit=False)
     
     return _SessionFactory()
 
 
+def get_read_engine() -> Engine:
+    """
+    Engine for read-only work (e.g. pandas.read_sql).
+
+    Returns the reader pool in pooled mode, the regular engine otherwise.
+    """
+    engine = get_engine()
+    return _read_engine if _read_engine is not None else engine
+
+
+def get_scoped_session() -> Session:
+    """
+    Thread-local session, reused for the current request/thread.
+
+    Call remove_scoped_session() when the request ends (the web app does this
+    on app-context teardown) to return its connections to the pool.
+    """
+    global _scoped_session
+
+    if _scoped_session is None:
+        get_session().close()  # Make sure the engine and session factory exist
+        _scoped_session = scoped_session(_SessionFactory)
+    return _scoped_session()
+
+
+def remove_scoped_session() -> None:
+    """Closes and discards the current thread's scoped session, if any."""
+    if _scoped_session is not None:
+        _scoped_session.remove()
+
+
+def _pool_stats(engine: Optional[Engine]) -> Optional[Dict[str, Any]]:
+    if engine is None:
+        return None
+    pool = engine.pool
+    stats: Dict[str, Any] = {'pool_class': type(pool).__name__, 'status': pool.status()}
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Connection pool statistics.
+
+    Returns:
+        Dictionary with the pool mode and per-engine pool details
+        ('writer' is the main engine, 'reader' is None unless pooled)
+    """
+    return {
+        'mode': 'pooled' if _read_engine is not None else 'static',
+        'writer': _pool_stats(_engine),
+        'reader': _pool_stats(_read_engine),
+    }
+
+
 def init_database(database_url: Optional[str] = None, drop_existing: bool = False) -> None:
     """
     Initialize the database by creating all tables.
@@ -177,11 +376,21 @@ def reset_engine() -> None:
     
     Useful for testing or when switching databases.
     """
-    global _engine, _SessionFactory
+    global _engine, _SessionFactory, _read_engine, _scoped_session
+    
+    if _scoped_session is not None:
+        _scoped_session.remove()
+        _scoped_session = None
+    
+    if _read_engine is not None:
+        _read_engine.dispose()
+        _read_engine = None
     
     if _engine is not None:
         _engine.dispose()
         _engine = None
     
     _SessionFactory = None
+    # Cached frames aren't tagged with the database they came from
+    query_cache.clear()
     logger.info("Database engine reset")
@@ -0,0 +1,230 @@
+# File path: src/database/bulk_sync.py
+"""
+Bulk insert/upsert helpers for syncing DataFrames into the database.
+
+Replaces per-row "query, then add" loops with:
+- one query that preloads the existing business keys
+- chunked executemany INSERT ... ON CONFLICT DO UPDATE / DO NOTHING statements
+  (SQLite and PostgreSQL), or plain executemany INSERT/UPDATE on other backends
+
+Each chunk runs inside a SAVEPOINT of the caller's session. If a chunk fails,
+it is rolled back and replayed row by row so a single bad row is reported as
+an error instead of aborting the whole sync. Committing stays with the caller.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import bindparam, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement; keeps bound parameters below SQLite's variable limit
+DEFAULT_CHUNK_SIZE = 500
+# Keys per IN (...) clause when preloading existing keys
+KEY_LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass
+class BulkSyncResult:
+    """Row counts of a bulk sync."""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: int = 0
+    error_rows: List[Tuple[Dict[str, Any], str]] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {'inserted': self.inserted, 'updated': self.updated, 'skipped': self.skipped, 'errors': self.errors}
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    """Yields consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _row_key(row: Dict[str, Any], key_columns: Sequence[str]) -> Optional[Hashable]:
+    values = tuple(row.get(col) for col in key_columns)
+    if any(value is None for value in values):
+        return None
+    return values[0] if len(values) == 1 else values
+
+
+def preload_existing_keys(
+    session: Session,
+    model,
+    key_columns: Sequence[str],
+    keys: Optional[Iterable[Hashable]] = None,
+    **filters
+) -> Set[Hashable]:
+    """
+    Fetch the business keys already stored for a model.
+
+    Args:
+        session: Active session
+        model: ORM model class
+        key_columns: Column names forming the unique key
+        keys: Restrict the lookup to these keys (chunked IN queries); None loads all
+        **filters: Equality filters applied to the lookup (e.g. snapshot_date=...)
+
+    Returns:
+        Set of existing keys (scalars for single-column keys, tuples otherwise)
+    """
+    columns = [getattr(model, col) for col in key_columns]
+    base = select(*columns).filter_by(**filters)
+
+    def fetch(stmt) -> Set[Hashable]:
+        if len(columns) == 1:
+            return set(session.execute(stmt).scalars())
+        return {tuple(row) for row in session.execute(stmt)}
+
+    if keys is None:
+        return fetch(base)
+
+    target = columns[0] if len(columns) == 1 else tuple_(*columns)
+    existing: Set[Hashable] = set()
+    for key_chunk in chunked(list(keys), KEY_LOOKUP_CHUNK_SIZE):
+        existing |= fetch(base.where(target.in_(key_chunk)))
+    return existing
+
+
+def _dialect_insert(session: Session, table):
+    """Returns a dialect insert() supporting ON CONFLICT, or None if unavailable."""
+    dialect = session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert(table)
+
+
+def bulk_upsert(
+    session: Session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    update_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    existing_keys: Optional[Set[Hashable]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False
+) -> BulkSyncResult:
+    """
+    Insert new rows and update existing ones (matched on key_columns) in bulk.
+
+    Rows with a missing key and repeated keys within rows (after the first
+    occurrence) are skipped. With no update columns, existing rows are skipped
+    too, giving insert-if-missing semantics.
+
+    Args:
+        session: Active session; the caller commits or rolls back
+        model: ORM model class with a unique constraint on key_columns
+        rows: Column-name -> value dicts
+        key_columns: Columns of the unique key used for conflict detection
+        update_columns: Columns overwritten on existing rows (default: none)
+        update_overrides: Column -> fn(excluded) returning the SQL expression to
+                          set on conflict, e.g. to keep the stored value when the
+                          new one is zero. Ignored on backends without ON CONFLICT.
+        existing_keys: Already preloaded keys; looked up in one pass if None
+        chunk_size: Rows per statement / savepoint
+        dry_run: Only classify the rows, without writing anything
+
+    Returns:
+        BulkSyncResult with inserted/updated/skipped/errors counts
+    """
+    result = BulkSyncResult()
+    update_columns = list(update_columns or [])
+    update_overrides = update_overrides or {}
+    updating = bool(update_columns or update_overrides)
+
+    unique_rows: List[Dict[str, Any]] = []
+    seen: Set[Hashable] = set()
+    for row in rows:
+        key = _row_key(row, key_columns)
+        if key is None or key in seen:
+            result.skipped += 1
+            continue
+        seen.add(key)
+        unique_rows.append(row)
+
+    if existing_keys is None:
+        existing_keys = preload_existing_keys(session, model, key_columns, keys=seen) if seen else set()
+
+    table = model.__table__
+    for chunk in chunked(unique_rows, chunk_size):
+        is_existing = [_row_key(row, key_columns) in existing_keys for row in chunk]
+        n_existing = sum(is_existing)
+        if not updating:
+            result.skipped += n_existing
+            chunk = [row for row, exists in zip(chunk, is_existing) if not exists]
+            if not chunk:
+                continue
+
+        if dry_run:
+            result.inserted += len(chunk) - (n_existing if updating else 0)
+            result.updated += n_existing if updating else 0
+            continue
+
+        try:
+            with session.begin_nested():
+                _write_chunk(session, table, chunk, key_columns, update_columns, update_overrides, existing_keys)
+            result.inserted += len(chunk) - (n_existing if updating else 0)
+            result.updated += n_existing if updating else 0
+        except Exception as e:
+            logger.warning(f"Bulk write of {len(chunk)} {table.name} rows failed ({e}); retrying row by row")
+            for row in chunk:
+                exists = _row_key(row, key_columns) in existing_keys
+                try:
+                    with session.begin_nested():
+                        _write_chunk(session, table, [row], key_columns, update_columns, update_overrides, existing_keys)
+                    if exists:
+                        result.updated += 1
+                    else:
+                        result.inserted += 1
+                except Exception as row_error:
+                    result.errors += 1
+                    result.error_rows.append((row, str(row_error)))
+
+    return result
+
+
+def _write_chunk(
+    session: Session,
+    table,
+    chunk: Sequence[Dict[str, Any]],
+    key_columns: Sequence[str],
+    update_columns: Sequence[str],
+    update_overrides: Dict[str, Callable[[Any], Any]],
+    existing_keys: Set[Hashable]
+) -> None:
+    """Writes one chunk with ON CONFLICT where supported, executemany otherwise."""
+    stmt = _dialect_insert(session, table)
+    if stmt is not None:
+        if update_columns or update_overrides:
+            set_ = {col: stmt.excluded[col] for col in update_columns}
+            set_.update({col: fn(stmt.excluded) for col, fn in update_overrides.items()})
+            stmt = stmt.on_conflict_do_update(index_elements=list(key_columns), set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+        session.execute(stmt, list(chunk))
+        return
+
+    # Generic backends: executemany INSERT for new keys, executemany UPDATE for existing ones
+    new_rows = [row for row in chunk if _row_key(row, key_columns) not in existing_keys]
+    old_rows = [row for row in chunk if _row_key(row, key_columns) in existing_keys]
+    if new_rows:
+        session.execute(insert(table), new_rows)
+    if old_rows and update_columns:
+        stmt = update(table).values({col: bindparam(f'u_{col}') for col in update_columns})
+        for col in key_columns:
+            stmt = stmt.where(table.c[col] == bindparam(f'k_{col}'))
+        params = [
+            {**{f'u_{col}': row.get(col) for col in update_columns}, **{f'k_{col}': row[col] for col in key_columns}}
+            for row in old_rows
+        ]
+        session.execute(stmt, params)
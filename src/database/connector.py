@@ -7,14 +7,18 @@ instead of Excel files. Maintains API compatibility with existing DataFrame stru
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
-from typing import Optional, List
-from sqlalchemy import func, select
+from typing import Dict, Optional, List
+from sqlalchemy import func, select, true
 from sqlalchemy.orm import Session
 
-from .base import get_session
+from .base import get_session, get_read_engine, get_scoped_session, pooling_enabled
 from .models import Transaction, Holding, Asset, BalanceSheet
+from .query_cache import (
+    ASSETS, BALANCE_SHEETS, HOLDINGS, TRANSACTIONS, cached_query, query_cache
+)
 
 
 class DatabaseConnector:
@@ -33,11 +37,18 @@ class DatabaseConnector:
             database_path: Path to SQLite database (optional, uses default if None)
         """
         self.logger = logging.getLogger(__name__)
-        self.session = get_session()  # Uses default database path from base.py
-        self.engine = self.session.bind
+        # In pooled mode each thread uses its own scoped session, so a shared
+        # connector does not serialize concurrent requests on one connection
+        self._session = None if pooling_enabled() else get_session()  # Uses default database path from base.py
+        self.engine = get_read_engine()
         
-        # Cache for holdings to avoid repeated queries
-        self._holdings_cache = {}
+        # Query results are cached process-wide until a write bumps the table generation
+        self.use_query_cache = True
+
+    @property
+    def session(self) -> Session:
+        """Session for ORM queries (the calling thread's scoped session in pooled mode)."""
+        return self._session if self._session is not None else get_scoped_session()
 
     def _read_sql(self, statement) -> pd.DataFrame:
         """Execute a SQLAlchemy statement and return a DataFrame."""
@@ -48,12 +59,61 @@ class DatabaseConnector:
             df = pd.read_sql(statement, connection)
 
         return df
+
+    def _read_columns(self, statement, dtypes: Dict[str, str]) -> pd.DataFrame:
+        """
+        Execute a Core SELECT and build the DataFrame column by column.
+
+        Rows are fetched from the DBAPI cursor without SQLAlchemy result
+        processing (no Row/Decimal objects) and each column is converted once
+        into an array of the requested dtype. Numeric columns are rounded to
+        their declared scale.
+
+        Args:
+            statement: SQLAlchemy select() with labelled columns
+            dtypes: Column label -> 'float64', 'datetime64[<unit>]', 'bool' or 'object'
+                    (the default for unlisted columns; SQL NULL stays None)
+
+        Returns:
+            DataFrame with the statement's columns in order (empty if no rows)
+        """
+        if self.engine is None:
+            raise RuntimeError("Database engine is not initialized")
+
+        with self.engine.connect() as connection:
+            result = connection.execute(statement)
+            labels = list(result.keys())
+            rows = result.cursor.fetchall()
+            result.close()
+
+        columns = zip(*rows) if rows else ([] for _ in labels)
+        data = {}
+        for label, values in zip(labels, columns):
+            dtype = dtypes.get(label, 'object')
+            if dtype == 'float64':
+                data[label] = np.array(values, dtype=float)  # None -> NaN
+                # Round to the Numeric scale, as the ORM's Decimal conversion does
+                scale = getattr(statement.selected_columns[label].type, 'scale', None)
+                if scale is not None:
+                    data[label] = np.round(data[label], scale)
+            elif dtype.startswith('datetime64'):
+                data[label] = pd.to_datetime(pd.Series(values, dtype=object)).to_numpy(dtype=dtype)
+            elif dtype == 'bool':
+                data[label] = np.array(values, dtype=bool)
+            else:
+                data[label] = np.array(values, dtype=object)
+        return pd.DataFrame(data, columns=labels)
         
     def clear_cache(self):
-        """Clear internal caches."""
-        self._holdings_cache.clear()
+        """Clear the query result cache (e.g. after another process changed the database)."""
+        query_cache.clear()
         self.logger.debug("DatabaseConnector cache cleared")
+
+    def cache_stats(self) -> dict:
+        """Query cache entries, memory use and hit/miss counts."""
+        return query_cache.stats()
         
+    @cached_query(TRANSACTIONS, ASSETS)
     def get_transactions(self) -> pd.DataFrame:
         """
         Fetch all transactions from database as DataFrame with asset metadata.
@@ -103,6 +163,7 @@ class DatabaseConnector:
             self.logger.error(f"Error fetching transactions from database: {e}")
             raise
     
+    @cached_query(HOLDINGS, ASSETS)
     def get_holdings(self, latest_only: bool = True) -> pd.DataFrame:
         """
         Fetch holdings from database as DataFrame with asset metadata.
@@ -115,10 +176,6 @@ class DatabaseConnector:
         - Columns: Asset_Name, Quantity, Market_Price_Unit, Market_Value_CNY, Cost_Price_Unit, Currency
         - PLUS asset metadata: Asset_Type, Asset_Class, Asset_SubClass, Risk_Level
         """
-        # Check cache first
-        if latest_only in self._holdings_cache:
-            return self._holdings_cache[latest_only].copy()
-            
         self.logger.info(f"Fetching holdings from database with asset metadata (latest_only={latest_only})...")
         
         try:
@@ -155,26 +212,28 @@ class DatabaseConnector:
             else:
                 self.logger.info("Fetching ALL historical holdings")
 
-            df = self._read_sql(statement)
+            df = self._read_columns(statement, {
+                'Date': 'datetime64[ns]',
+                'Quantity': 'float64',
+                'Market_Price_Unit': 'float64',
+                'Market_Value_CNY': 'float64',
+                'Cost_Price_Unit': 'float64',
+            })
 
             if df.empty:
                 self.logger.warning("No holdings found in database")
                 return df
 
-            df['Date'] = pd.to_datetime(df['Date'])
             df = df.set_index(['Date', 'Asset_ID']).sort_index()
 
             self.logger.info("Loaded %s holdings from database", len(df))
-            
-            # Cache the result
-            self._holdings_cache[latest_only] = df.copy()
-            
             return df
 
         except Exception as e:
             self.logger.error(f"Error fetching holdings from database: {e}")
             raise
     
+    @cached_query(ASSETS)
     def get_assets(self) -> pd.DataFrame:
         """
         Fetch asset metadata from database.
@@ -185,25 +244,23 @@ class DatabaseConnector:
         self.logger.info("Fetching assets from database...")
         
         try:
-            assets = self.session.query(Asset).filter_by(is_active=True).all()
+            statement = (
+                select(
+                    Asset.asset_id.label('Asset_ID'),
+                    Asset.asset_name.label('Asset_Name'),
+                    Asset.asset_type.label('Asset_Type'),
+                    Asset.asset_class.label('Asset_Class'),
+                    Asset.asset_subclass.label('Asset_Subclass'),
+                    Asset.is_active.label('Is_Active'),
+                )
+                .where(Asset.is_active == true())
+            )
+            df = self._read_columns(statement, {'Is_Active': 'bool'})
             
-            if not assets:
+            if df.empty:
                 self.logger.warning("No assets found in database")
                 return pd.DataFrame()
             
-            data = []
-            for asset in assets:
-                data.append({
-                    'Asset_ID': asset.asset_id,
-                    'Asset_Name': asset.asset_name,
-                    'Asset_Type': asset.asset_type,
-                    'Asset_Class': asset.asset_class,
-                    'Asset_Subclass': asset.asset_subclass,
-                    'Is_Active': asset.is_active,
-                })
-            
-            df = pd.DataFrame(data)
-            
             self.logger.info(f"Loaded {len(df)} assets from database")
             
             return df
@@ -212,6 +269,7 @@ class DatabaseConnector:
             self.logger.error(f"Error fetching assets from database: {e}")
             raise
     
+    @cached_query(BALANCE_SHEETS)
     def get_balance_sheet(self) -> pd.DataFrame:
         """
         Fetch balance sheet data from database.
@@ -222,24 +280,30 @@ class DatabaseConnector:
         self.logger.info("Fetching balance sheet from database...")
         
         try:
-            balance_sheet_records = self.session.query(BalanceSheet).all()
+            statement = (
+                select(
+                    BalanceSheet.snapshot_date.label('Date'),
+                    BalanceSheet.line_item.label('Line_Item'),
+                    BalanceSheet.amount.label('Amount'),
+                )
+                .order_by(BalanceSheet.id)
+            )
+            records = self._read_columns(statement, {'Date': 'datetime64[ns]', 'Amount': 'float64'})
             
-            if not balance_sheet_records:
+            if records.empty:
                 self.logger.warning("No balance sheet data found in database")
                 return pd.DataFrame()
             
-            # Group by snapshot_date and pivot to wide format
-            data = {}
-            for record in balance_sheet_records:
-                date_key = record.snapshot_date
-                if date_key not in data:
-                    data[date_key] = {}
-                data[date_key][record.line_item] = float(record.amount) if record.amount else 0.0
-            
-            # Convert to DataFrame
-            df = pd.DataFrame.from_dict(data, orient='index')
-            df.index = pd.to_datetime(df.index)
-            df.index.name = 'Date'
+            # Pivot to wide format: one column per line_item in order of first appearance,
+            # the last record winning for duplicate (date, line_item) pairs, NULL amounts as 0
+            # (dates taken in first-seen order, then items within each date)
+            date_rank = pd.factorize(records['Date'])[0]
+            line_items = records['Line_Item'].to_numpy()[np.argsort(date_rank, kind='stable')]
+            records['Amount'] = records['Amount'].fillna(0.0)
+            records = records.drop_duplicates(['Date', 'Line_Item'], keep='last')
+            df = records.pivot(index='Date', columns='Line_Item', values='Amount')
+            df = df.reindex(columns=pd.unique(line_items))
+            df.columns.name = None
             
             # Sort by date
             df = df.sort_index()
@@ -20,6 +20,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from .base import get_session, get_engine
+from .bulk_sync import bulk_upsert
 from .models import (
     Transaction, Holding, Asset, BalanceSheet,
     AssetTaxonomy, AssetMapping, ImportLog, AuditTrail
@@ -240,48 +241,24 @@ class DatabaseMigrator:
         
         self.stats['transactions']['total'] = len(transactions_df_with_date)
         
+        records = []
         for idx, row in transactions_df_with_date.iterrows():
             try:
-                # Generate unique transaction_id
-                transaction_id = self._generate_transaction_id(row)
-                
-                # Check for duplicate
-                existing = session.query(Transaction).filter_by(transaction_id=transaction_id).first()
-                
-                if existing:
-                    self.stats['transactions']['skipped'] += 1
-                    continue
-                
                 # Convert pandas types to Python/SQL types
                 # Date is now accessible as 'Date' column after reset_index()
-                txn_date = self._convert_to_date(row.get('Date'))
-                shares = self._convert_to_decimal(row.get('Quantity'))
-                price = self._convert_to_decimal(row.get('Price_Unit'))
-                amount = self._convert_to_decimal(row.get('Amount_Net'))
-                
-                # Create transaction record
-                transaction = Transaction(
-                    transaction_id=transaction_id,
-                    date=txn_date,
-                    asset_id=self._normalize_asset_id(row.get('Asset_ID')),
-                    asset_name=row.get('Asset_Name'),
-                    transaction_type=row.get('Transaction_Type'),
-                    shares=shares,
-                    price=price,
-                    amount=amount,
-                    currency=row.get('Currency', 'CNY'),
-                    source=self._determine_source(row),
-                    created_by='migration'
-                )
-                
-                if not self.dry_run:
-                    session.add(transaction)
-                
-                self.stats['transactions']['inserted'] += 1
-                
-                if self.stats['transactions']['inserted'] % 100 == 0:
-                    self.logger.info(f"  Processed {self.stats['transactions']['inserted']} transactions...")
-                
+                records.append({
+                    'transaction_id': self._generate_transaction_id(row),
+                    'date': self._convert_to_date(row.get('Date')),
+                    'asset_id': self._normalize_asset_id(row.get('Asset_ID')),
+                    'asset_name': row.get('Asset_Name'),
+                    'transaction_type': row.get('Transaction_Type'),
+                    'shares': self._convert_to_decimal(row.get('Quantity')),
+                    'price': self._convert_to_decimal(row.get('Price_Unit')),
+                    'amount': self._convert_to_decimal(row.get('Amount_Net')),
+                    'currency': row.get('Currency', 'CNY'),
+                    'source': self._determine_source(row),
+                    'created_by': 'migration'
+                })
             except Exception as e:
                 self.stats['transactions']['errors'] += 1
                 self.errors.append({
@@ -291,6 +268,21 @@ class DatabaseMigrator:
                     'error': str(e)
                 })
                 self.logger.error(f"  Error migrating transaction: {str(e)}")
+
+        # Insert-only bulk sync: transaction_ids already in the database (or repeated) are skipped
+        result = bulk_upsert(session, Transaction, records, key_columns=['transaction_id'], dry_run=self.dry_run)
+        for record, error in result.error_rows:
+            self.errors.append({
+                'type': 'transaction',
+                'date': record.get('date'),
+                'asset': record.get('asset_name'),
+                'error': error
+            })
+            self.logger.error(f"  Error migrating transaction {record['transaction_id']}: {error}")
+
+        self.stats['transactions']['inserted'] += result.inserted
+        self.stats['transactions']['skipped'] += result.skipped
+        self.stats['transactions']['errors'] += result.errors
         
         self.logger.info(f"✓ Transactions: {self.stats['transactions']['inserted']} inserted, "
                         f"{self.stats['transactions']['skipped']} skipped, "
@@ -0,0 +1,156 @@
+# File path: src/database/query_cache.py
+"""
+Versioned result cache for DatabaseConnector queries.
+
+Every cached table has a process-wide generation counter. Sessions bump the
+generations of the tables they flushed or bulk-wrote when they commit (see
+database.base); code writing outside a session calls bump_generation(table)
+after committing. Cached frames record the generations of the tables they were
+built from and are discarded as soon as any of them moves on. Entries are
+evicted least-recently-used once the cache exceeds its memory budget.
+
+Only writes made through this process are seen. After changing the database
+from another process, call DatabaseConnector.clear_cache().
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+TRANSACTIONS = 'transactions'
+HOLDINGS = 'holdings'
+ASSETS = 'assets'
+BALANCE_SHEETS = 'balance_sheets'
+CACHED_TABLES = (TRANSACTIONS, HOLDINGS, ASSETS, BALANCE_SHEETS)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_generations: Dict[str, int] = {}
+_generation_lock = threading.Lock()
+
+
+def bump_generation(*tables: str) -> None:
+    """Mark tables as changed, invalidating every cached result built from them."""
+    with _generation_lock:
+        for table in tables:
+            _generations[table] = _generations.get(table, 0) + 1
+
+
+def get_generations(tables: Sequence[str]) -> Tuple[int, ...]:
+    """Current generation of each table."""
+    with _generation_lock:
+        return tuple(_generations.get(table, 0) for table in tables)
+
+
+class QueryCache:
+    """Thread-safe LRU of DataFrames keyed by query, bounded by memory usage."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes: Approximate memory budget (deep memory usage of the frames)
+        """
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, Tuple[Tuple[int, ...], pd.DataFrame, int]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, tables: Sequence[str]) -> Optional[pd.DataFrame]:
+        """
+        Returns a copy of the cached frame, or None if missing or out of date.
+        """
+        generations = get_generations(tables)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generations:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            frame = entry[1]
+        return frame.copy()
+
+    def put(self, key: Hashable, tables: Sequence[str], frame: pd.DataFrame,
+            generations: Optional[Tuple[int, ...]] = None) -> None:
+        """
+        Store a copy of frame.
+
+        Args:
+            key: Query identifier
+            tables: Tables the frame was built from
+            frame: Result to cache
+            generations: Table generations read *before* running the query, so a
+                         write that lands during the query leaves the entry stale
+        """
+        if generations is None:
+            generations = get_generations(tables)
+        frame = frame.copy()
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (generations, frame, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, memory use and hit/miss counters."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+# Shared by all DatabaseConnector instances in the process
+query_cache = QueryCache()
+
+
+def cached_query(*tables: str):
+    """
+    Cache a DataFrame-returning DatabaseConnector method in query_cache.
+
+    Results are keyed by method name and arguments and depend on the given
+    tables. Instances with use_query_cache = False bypass the cache.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not getattr(self, 'use_query_cache', True):
+                return method(self, *args, **kwargs)
+
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            cached = query_cache.get(key, tables)
+            if cached is not None:
+                return cached
+
+            generations = get_generations(tables)
+            df = method(self, *args, **kwargs)
+            if isinstance(df, pd.DataFrame):
+                query_cache.put(key, tables, df, generations)
+            return df
+        return wrapper
+    return decorator
@@ -9,10 +9,18 @@ Key features:
 - Support for buy/sell transactions with proper lot management
 - Average cost and unrealized P&L computation
 - Comprehensive transaction validation and error handling
+- Columnar lot engine: transactions are read as pre-sorted arrays, all assets are
+  processed in one grouped pass, and calculators accept incremental appends
+- Shared content-addressed store, so each asset is replayed once per distinct
+  transaction history across gains, lifetime-performance and holdings consumers
 """
 
+from collections import deque
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Deque, Dict, List, Optional, Tuple, Any
 import logging
 from .performance_calculator import PerformanceCalculator
 
@@ -26,6 +34,91 @@ logger = logging.getLogger(__name__)
 # Cost basis = vest date FMV of retained shares
 # Sell-to-cover transactions on vest date are tax payments, not investment sales.
 
+# Processing order for transactions sharing a date (lower number = process first)
+TRANSACTION_PRIORITY = {
+    'RSU_Grant': 1,
+    'RSU_Vest': 2,
+    'Sell': 3,  # Process sell-to-cover right after vest
+    'Buy': 4,
+    'Dividend_Reinvest': 5
+}
+DEFAULT_TRANSACTION_PRIORITY = 10
+
+
+def _transaction_columns(transactions_df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Extract the fields read by the lot engine as plain columnar arrays.
+    
+    Dates come from the index unless a column carries the index name. The
+    returned 'priority' array gives the within-date processing order.
+    
+    Args:
+        transactions_df: Transactions (Transaction_Type, Quantity, Price_Unit, Amount_Net, Currency)
+        
+    Returns:
+        Dictionary of equal-length arrays, in the frame's original row order
+    """
+    index_name = transactions_df.index.name or 'index'
+    if index_name in transactions_df.columns:
+        dates = transactions_df[index_name]
+    else:
+        dates = transactions_df.index
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    
+    num_rows = len(transactions_df)
+    
+    def numeric(column: str) -> np.ndarray:
+        if column not in transactions_df.columns:
+            return np.zeros(num_rows)
+        return pd.to_numeric(transactions_df[column], errors='coerce').to_numpy(dtype=float)
+    
+    if 'Transaction_Type' in transactions_df.columns:
+        types = transactions_df['Transaction_Type'].map(lambda x: x.strip() if isinstance(x, str) else '')
+    else:
+        types = pd.Series([''] * num_rows, index=transactions_df.index)
+    
+    if 'Currency' in transactions_df.columns:
+        currencies = transactions_df['Currency'].to_numpy(dtype=object)
+    else:
+        currencies = np.full(num_rows, 'CNY', dtype=object)
+    
+    return {
+        'dates': dates,
+        'types': types.to_numpy(dtype=object),
+        'quantity': numeric('Quantity'),
+        'price_unit': numeric('Price_Unit'),
+        'amount_net': numeric('Amount_Net'),
+        'currency': currencies,
+        'priority': types.map(TRANSACTION_PRIORITY).fillna(DEFAULT_TRANSACTION_PRIORITY).to_numpy(dtype=np.int64)
+    }
+
+
+def _take_columns(columns: Dict[str, Any], positions: np.ndarray) -> Dict[str, Any]:
+    """Select rows (in the given order) from a columnar transaction batch."""
+    return {name: values[positions] for name, values in columns.items()}
+
+
+def _columns_digest(columns: Dict[str, Any]) -> str:
+    """
+    Content hash of a sorted columnar transaction slice.
+    
+    USD slices also hash the generation of the active FX rates, so
+    re-initializing the currency service invalidates the assets whose cost
+    basis used them.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(columns['dates'].asi8.tobytes())
+    for name in ('quantity', 'price_unit', 'amount_net'):
+        digest.update(np.ascontiguousarray(columns[name]).tobytes())
+    digest.update('\x1f'.join(map(str, columns['types'])).encode('utf-8'))
+    currencies = '\x1f'.join(map(str, columns['currency']))
+    digest.update(currencies.encode('utf-8'))
+    if 'USD' in currencies:
+        from ..data_manager.currency_converter import get_fx_generation
+        digest.update(str(get_fx_generation()).encode('utf-8'))
+    return digest.hexdigest()
+
+
 class PurchaseLot:
     """
     Represents a single purchase lot with FIFO tracking capabilities.
@@ -34,6 +127,9 @@ class PurchaseLot:
     and manages partial sales using FIFO (First-In, First-Out) methodology.
     """
     
+    __slots__ = ('purchase_date', 'original_quantity', 'remaining_quantity',
+                 'price_per_unit', 'amount_net', 'cost_basis')
+    
     def __init__(self, date: pd.Timestamp, quantity: float, price: float, amount_net: float):
         """
         Initialize a purchase lot.
@@ -105,7 +201,7 @@ class CostBasisCalculator:
         """
         self.asset_id = asset_id
         self.logger = logger or logging.getLogger(__name__)
-        self.lots: List[PurchaseLot] = []
+        self.lots: Deque[PurchaseLot] = deque()
         self.total_shares_sold = 0.0
         self.total_realized_profit = 0.0  # Deprecated, use realized_pnl
         self.total_shares_bought = 0.0
@@ -113,12 +209,15 @@ class CostBasisCalculator:
         self.total_amount_received = 0.0
         self.realized_pnl = 0.0
         self.processed_transactions = 0
+        self.last_transaction_date: Optional[pd.Timestamp] = None
         
         # Detect if this is Employer RSU for special handling
         self.is_employer_rsu = (asset_id == 'Employer_Stock_A')
         
         # Track sell-to-cover transactions to skip in normal sell processing
         self.sell_to_cover_dates: set = set()
+        # {date: (vested_shares, sold_shares, vest_price_cny)} for RSU processing
+        self.rsu_vest_info: Dict[pd.Timestamp, Tuple[float, float, float]] = {}
         
     def process_transactions(self, transactions_df: pd.DataFrame) -> None:
         """
@@ -130,6 +229,9 @@ class CostBasisCalculator:
         - Only the retained shares (typically 55%) are added to cost basis
         - The vest date FMV becomes the cost basis for retained shares
         
+        Calling this again on a calculator that already holds state appends the new
+        transactions (see append_transactions) rather than replaying history.
+        
         Args:
             transactions_df: DataFrame with transaction history (Date, Transaction_Type, Quantity, Price_Unit, Amount_Net)
         """
@@ -137,46 +239,67 @@ class CostBasisCalculator:
             logger.warning(f"No transactions to process for {self.asset_id}")
             return
         
-        # Define transaction priority (lower number = process first within same date)
-        transaction_priority = {
-            'RSU_Grant': 1,
-            'RSU_Vest': 2,
-            'Sell': 3,  # Process sell-to-cover right after vest
-            'Buy': 4,
-            'Dividend_Reinvest': 5
-        }
+        self.append_transactions(transactions_df)
+    
+    def append_transactions(self, transactions_df: pd.DataFrame) -> None:
+        """
+        Incrementally process transactions newer than anything already processed.
         
-        # Add priority column for sorting within same dates
-        transactions_df = transactions_df.copy()
-        transactions_df['_priority'] = transactions_df['Transaction_Type'].map(
-            lambda x: transaction_priority.get(x, 10)
-        )
+        Existing lots and totals are kept, so only the new rows are replayed.
         
+        Args:
+            transactions_df: New transactions, all dated after the last processed transaction
+            
+        Raises:
+            ValueError: If any new transaction is dated on or before the last processed one
+        """
+        if transactions_df.empty:
+            return
+        
+        columns = _transaction_columns(transactions_df)
         # Sort by date first, then by priority within same date
-        index_name = transactions_df.index.name or 'index'
-        if index_name in transactions_df.columns:
-            # Date is a column, sort by it
-            transactions_df = transactions_df.sort_values([index_name, '_priority'])
-        else:
-            # Date is the index, sort by index then priority
-            transactions_df = transactions_df.reset_index().sort_values([index_name, '_priority']).set_index(index_name)
+        order = np.lexsort((columns['priority'], columns['dates'].asi8))
+        self.consume_columns(_take_columns(columns, order))
+    
+    def consume_columns(self, columns: Dict[str, Any]) -> None:
+        """
+        Process a columnar transaction batch already sorted by (date, priority).
+        
+        Args:
+            columns: Arrays as produced by _transaction_columns, pre-sorted
+            
+        Raises:
+            ValueError: If the batch starts on or before the last processed date
+        """
+        dates = columns['dates']
+        if len(dates) == 0:
+            return
+        if self.last_transaction_date is not None and dates[0] <= self.last_transaction_date:
+            # Same-day ordering (e.g. RSU sell-to-cover pairing) cannot be rebuilt from a partial day
+            raise ValueError(
+                f"Cannot append transactions for {self.asset_id} dated {dates[0]} on or before "
+                f"last processed date {self.last_transaction_date}; rebuild the calculator instead"
+            )
         
         # Pre-scan for RSU vest + same-date sell pairs to identify sell-to-cover
         if self.is_employer_rsu:
-            self._identify_sell_to_cover_transactions(transactions_df)
+            self._identify_sell_to_cover_transactions(columns)
         
-        for date, transaction in transactions_df.iterrows():
+        rows = zip(dates, columns['types'], columns['quantity'].tolist(), columns['price_unit'].tolist(),
+                   columns['amount_net'].tolist(), columns['currency'])
+        for date, transaction_type, quantity, price_unit, amount_net, currency in rows:
             try:
-                self._process_single_transaction(date, transaction)
+                self._process_transaction_fields(date, transaction_type, quantity, price_unit, amount_net, currency)
                 self.processed_transactions += 1
             except Exception as e:
                 logger.error(f"Error processing transaction for {self.asset_id} on {date}: {e}")
                 continue
-                
+        
+        self.last_transaction_date = dates[-1]
         logger.info(f"Processed {self.processed_transactions} transactions for {self.asset_id}")
         self._cleanup_empty_lots()
     
-    def _identify_sell_to_cover_transactions(self, transactions_df: pd.DataFrame) -> None:
+    def _identify_sell_to_cover_transactions(self, columns: Dict[str, Any]) -> None:
         """
         Identify sell transactions that are paired with RSU_Vest on the same date.
         These are "sell-to-cover" transactions for tax withholding, not investment sales.
@@ -185,47 +308,46 @@ class CostBasisCalculator:
         create lots with only the retained portion.
         
         Args:
-            transactions_df: Sorted transaction DataFrame
+            columns: Sorted columnar transaction batch
         """
-        # Store {date: (vested_shares, sold_shares, vest_price_cny)} for RSU processing
-        self.rsu_vest_info = {}
-        
-        # Group transactions by date
-        if isinstance(transactions_df.index, pd.DatetimeIndex):
-            grouped = transactions_df.groupby(transactions_df.index.date)
-        else:
-            grouped = transactions_df.groupby('Date')
+        days = columns['dates'].normalize()
+        types = columns['types']
+        vest_mask = types == 'RSU_Vest'
+        sell_mask = types == 'Sell'
+        paired_days = sorted(set(days[vest_mask]) & set(days[sell_mask]))
+        if not paired_days:
+            return
         
         # Import currency converter for USD to CNY conversion
         from ..data_manager.currency_converter import get_currency_service
         converter = get_currency_service()
         
-        for date, group in grouped:
-            vest_txns = group[group['Transaction_Type'] == 'RSU_Vest']
-            sell_txns = group[group['Transaction_Type'] == 'Sell']
+        for date in paired_days:
+            on_date = days == date
+            vest_rows = np.flatnonzero(on_date & vest_mask)
+            sell_rows = np.flatnonzero(on_date & sell_mask)
             
-            if not vest_txns.empty and not sell_txns.empty:
-                # Mark this date's sell as sell-to-cover
-                vest_shares = vest_txns['Quantity'].sum()
-                sell_shares = abs(sell_txns['Quantity'].sum())
-                
-                # Extract vest price from amount_net / quantity
-                vest_amount_usd = abs(vest_txns['Amount_Net'].sum())
-                vest_price_usd = vest_amount_usd / vest_shares if vest_amount_usd > 0 else vest_txns['Price_Unit'].iloc[0]
-                
-                # Convert USD price to CNY
-                currency = vest_txns.iloc[0].get('Currency', 'CNY')
-                if currency == 'USD':
-                    vest_amount_cny = converter.convert_amount(vest_amount_usd, 'USD', 'CNY', pd.Timestamp(date))
-                    vest_price_cny = vest_amount_cny / vest_shares
-                else:
-                    vest_price_cny = vest_price_usd
-                
-                self.sell_to_cover_dates.add(pd.Timestamp(date))
-                self.rsu_vest_info[pd.Timestamp(date)] = (vest_shares, sell_shares, vest_price_cny)
-                
-                retained_shares = vest_shares - sell_shares
-                logger.info(f"RSU {self.asset_id} {date}: Vest+Sell-to-cover detected - {vest_shares:.2f} vested, {sell_shares:.2f} sold, {retained_shares:.2f} retained @ {vest_price_cny:.2f} CNY/share")
+            # Mark this date's sell as sell-to-cover
+            vest_shares = np.nansum(columns['quantity'][vest_rows])
+            sell_shares = abs(np.nansum(columns['quantity'][sell_rows]))
+            
+            # Extract vest price from amount_net / quantity
+            vest_amount_usd = abs(np.nansum(columns['amount_net'][vest_rows]))
+            vest_price_usd = vest_amount_usd / vest_shares if vest_amount_usd > 0 else columns['price_unit'][vest_rows[0]]
+            
+            # Convert USD price to CNY
+            currency = columns['currency'][vest_rows[0]]
+            if currency == 'USD':
+                vest_amount_cny = converter.convert_amount(vest_amount_usd, 'USD', 'CNY', pd.Timestamp(date))
+                vest_price_cny = vest_amount_cny / vest_shares
+            else:
+                vest_price_cny = vest_price_usd
+            
+            self.sell_to_cover_dates.add(pd.Timestamp(date))
+            self.rsu_vest_info[pd.Timestamp(date)] = (vest_shares, sell_shares, vest_price_cny)
+            
+            retained_shares = vest_shares - sell_shares
+            logger.info(f"RSU {self.asset_id} {date.date()}: Vest+Sell-to-cover detected - {vest_shares:.2f} vested, {sell_shares:.2f} sold, {retained_shares:.2f} retained @ {vest_price_cny:.2f} CNY/share")
     
     def _process_single_transaction(self, date: pd.Timestamp, transaction: pd.Series) -> None:
         """
@@ -235,13 +357,30 @@ class CostBasisCalculator:
             date: Transaction date
             transaction: Transaction data series
         """
-        transaction_type = transaction.get('Transaction_Type', '').strip()
-        quantity = float(transaction.get('Quantity', 0))
-        price_unit = float(transaction.get('Price_Unit', 0))
-        amount_net = float(transaction.get('Amount_Net', 0))
+        self._process_transaction_fields(
+            date,
+            transaction.get('Transaction_Type', '').strip(),
+            float(transaction.get('Quantity', 0)),
+            float(transaction.get('Price_Unit', 0)),
+            float(transaction.get('Amount_Net', 0)),
+            transaction.get('Currency', 'CNY')
+        )
+    
+    def _process_transaction_fields(self, date: pd.Timestamp, transaction_type: str, quantity: float,
+                                    price_unit: float, amount_net: float, currency: Any) -> None:
+        """
+        Process a single transaction (buy or sell) from its individual fields.
         
+        Args:
+            date: Transaction date
+            transaction_type: Transaction type (Buy, Sell, RSU_Vest, ...)
+            quantity: Units traded
+            price_unit: Price per unit
+            amount_net: Net amount in the transaction currency
+            currency: Transaction currency
+        """
         # Currency conversion: Convert USD amounts to CNY
-        currency = transaction.get('Currency', 'CNY')
+        original_amount_net = amount_net
         if currency == 'USD' and amount_net != 0:
             # Import currency converter
             from ..data_manager.currency_converter import get_currency_service
@@ -250,7 +389,7 @@ class CostBasisCalculator:
             amount_net_cny = converter.convert_amount(abs(amount_net), 'USD', 'CNY', date)
             # Preserve the sign of the original amount
             amount_net = amount_net_cny if amount_net > 0 else -amount_net_cny
-            logger.debug(f"{self.asset_id} {date.date()}: Converted {transaction.get('Amount_Net', 0):.2f} USD to {amount_net:.2f} CNY")
+            logger.debug(f"{self.asset_id} {date.date()}: Converted {original_amount_net:.2f} USD to {amount_net:.2f} CNY")
         
         # Skip transactions with zero quantity or invalid data
         # EXCEPT for dividend/income transactions with non-zero amount_net
@@ -399,16 +538,19 @@ class CostBasisCalculator:
         if '1856' in str(self.asset_id):
              logger.info(f"DEBUG {self.asset_id} SELL: Qty={quantity}, Price={price_unit}, Net={amount_net}, Proceeds={sale_proceeds}")
 
-        # Sell shares from lots using FIFO
+        # Sell shares from lots using FIFO, dropping exhausted lots from the front
         remaining_to_sell = quantity_to_sell
-        for lot in self.lots:
-            if remaining_to_sell <= 0 or lot.is_empty():
+        lots = self.lots
+        while lots and lots[0].is_empty():
+            lots.popleft()
+        for lot in lots:
+            if remaining_to_sell <= 0:
+                break
+            if lot.is_empty():
                 continue
             quantity_sold, cost_basis_sold = lot.sell_shares(remaining_to_sell)
             total_cost_basis_sold += cost_basis_sold
             remaining_to_sell -= quantity_sold
-            if remaining_to_sell <= 0:
-                break
         
         # Update totals
         self.total_shares_sold += quantity_to_sell
@@ -421,7 +563,7 @@ class CostBasisCalculator:
     
     def _cleanup_empty_lots(self) -> None:
         """Remove lots that have been fully sold."""
-        self.lots = [lot for lot in self.lots if not lot.is_empty()]
+        self.lots = deque(lot for lot in self.lots if not lot.is_empty())
     
     def get_current_position(self) -> float:
         """Get current number of shares held."""
@@ -506,14 +648,132 @@ class CostBasisCalculator:
         return summary
 
 
+class CostBasisStore:
+    """
+    Content-addressed store of processed CostBasisCalculator objects.
+    
+    Holds one entry per asset, tagged with the digest of that asset's sorted
+    transaction slice. A lookup hits only when the digest matches, so an asset
+    is replayed only when its own transactions change. Filtered views of the
+    same transactions (e.g. with insurance assets removed) share entries.
+    
+    Stored calculators are shared between consumers and must be treated as
+    read-only.
+    """
+    
+    def __init__(self):
+        """Initialize an empty store."""
+        self._entries: Dict[Any, Tuple[str, CostBasisCalculator]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, asset_id: Any, digest: str) -> Optional[CostBasisCalculator]:
+        """Return the stored calculator for asset_id if its digest matches."""
+        with self._lock:
+            entry = self._entries.get(asset_id)
+            if entry is not None and entry[0] == digest:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+    
+    def put(self, asset_id: Any, digest: str, calculator: CostBasisCalculator) -> None:
+        """Store (or replace) the calculator for asset_id."""
+        with self._lock:
+            self._entries[asset_id] = (digest, calculator)
+    
+    def invalidate(self, asset_id: Any = None) -> None:
+        """Drop one asset's entry, or every entry when asset_id is None."""
+        with self._lock:
+            if asset_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(asset_id, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Global store shared by all cost basis consumers
+_cost_basis_store = CostBasisStore()
+
+
+def get_cost_basis_store() -> CostBasisStore:
+    """Get the global cost basis store."""
+    return _cost_basis_store
+
+
+def build_cost_basis_calculators(transactions_df: pd.DataFrame,
+                                 use_store: bool = True) -> Dict[str, CostBasisCalculator]:
+    """
+    Run the FIFO lot engine for every asset in one grouped pass.
+    
+    The frame is converted to columnar arrays once and sorted once by
+    (Asset_ID, date, priority); each calculator then consumes its contiguous slice.
+    Assets whose slice is unchanged since the last run are served from the
+    shared CostBasisStore instead of being replayed.
+    
+    Args:
+        transactions_df: DataFrame with all transactions, indexed by date
+        use_store: Read and populate the shared cost basis store
+        
+    Returns:
+        Dictionary mapping asset_id to a processed CostBasisCalculator (sorted by asset_id)
+    """
+    calculators: Dict[str, CostBasisCalculator] = {}
+    if transactions_df is None or transactions_df.empty or 'Asset_ID' not in transactions_df.columns:
+        return calculators
+    
+    asset_codes, asset_ids = pd.factorize(transactions_df['Asset_ID'], sort=True)
+    columns = _transaction_columns(transactions_df)
+    order = np.lexsort((columns['priority'], columns['dates'].asi8, asset_codes))
+    order = order[asset_codes[order] >= 0]  # Drop rows without an Asset_ID
+    if len(order) == 0:
+        return calculators
+    
+    columns = _take_columns(columns, order)
+    sorted_codes = asset_codes[order]
+    boundaries = np.concatenate(([0], np.flatnonzero(np.diff(sorted_codes)) + 1, [len(order)]))
+    
+    store = get_cost_basis_store() if use_store else None
+    
+    for start, end in zip(boundaries[:-1], boundaries[1:]):
+        asset_id = asset_ids[sorted_codes[start]]
+        asset_columns = {name: values[start:end] for name, values in columns.items()}
+        try:
+            digest = None
+            if store is not None:
+                digest = _columns_digest(asset_columns)
+                calculator = store.get(asset_id, digest)
+                if calculator is not None:
+                    calculators[asset_id] = calculator
+                    continue
+            
+            calculator = CostBasisCalculator(asset_id)
+            calculator.consume_columns(asset_columns)
+            calculators[asset_id] = calculator
+            if store is not None:
+                store.put(asset_id, digest, calculator)
+        except Exception as e:
+            logger.error(f"Failed to calculate cost basis for {asset_id}: {e}")
+            continue
+    
+    return calculators
+
+
 def calculate_cost_basis_for_portfolio(transactions_df: pd.DataFrame, 
-                                     current_prices: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
+                                     current_prices: Optional[Dict[str, float]] = None,
+                                     use_store: bool = True) -> Dict[str, Dict[str, Any]]:
     """
     Calculate cost basis for all assets in a portfolio.
     
     Args:
         transactions_df: DataFrame with all transactions, indexed by date
         current_prices: Optional dictionary mapping asset_id to current price
+        use_store: Reuse FIFO results from the shared cost basis store
         
     Returns:
         Dictionary mapping asset_id to cost basis summary
@@ -525,14 +785,8 @@ def calculate_cost_basis_for_portfolio(transactions_df: pd.DataFrame,
     current_prices = current_prices or {}
     results = {}
     
-    # Group transactions by asset
-    asset_groups = transactions_df.groupby('Asset_ID')
-    
-    for asset_id, asset_transactions in asset_groups:
+    for asset_id, calculator in build_cost_basis_calculators(transactions_df, use_store).items():
         try:
-            calculator = CostBasisCalculator(asset_id)
-            calculator.process_transactions(asset_transactions)
-            
             current_price = current_prices.get(asset_id)
             summary = calculator.get_summary(current_price)
             results[asset_id] = summary
@@ -662,6 +916,8 @@ def get_lifetime_asset_performance(transactions_df: pd.DataFrame,
     
     # --- Helper: Initialize unified PerformanceCalculator ---
     performance_calc = PerformanceCalculator()
+    # Lifetime cash flows per asset, solved together after the loop
+    xirr_inputs = {}
 
     for asset_id in unique_assets:
         # Skip insurance assets
@@ -855,9 +1111,8 @@ def get_lifetime_asset_performance(transactions_df: pd.DataFrame,
                         cf_dates.append(pd.Timestamp.now())
                         cf_flows.append(current_info.get('current_market_value', 0.0))
                     
-                    # Use PerformanceCalculator for unified XIRR calculation
-                    xirr_result = performance_calc.calculate_xirr(cf_dates, cf_flows, context_id=str(asset_id))
-                    xirr_pct = xirr_result.get('xirr')  # Extract the XIRR percentage value
+                    # XIRR is filled in below by one batched PerformanceCalculator call
+                    xirr_inputs[str(asset_id)] = (cf_dates, cf_flows)
             except Exception as e:
                 logger.warning(f"Failed to calculate XIRR for {asset_id}: {e}")
                 xirr_pct = None
@@ -895,6 +1150,19 @@ def get_lifetime_asset_performance(transactions_df: pd.DataFrame,
                 
             lifetime_performance.append(performance_record)
     
+    # Use PerformanceCalculator for unified XIRR calculation (all assets in one batch)
+    try:
+        xirr_results = performance_calc.calculate_xirr_batch(xirr_inputs)
+    except Exception as e:
+        logger.warning(f"Failed to calculate batched XIRR: {e}")
+        xirr_results = {}
+    
+    for performance_record in lifetime_performance:
+        xirr_pct = xirr_results.get(str(performance_record['asset_id']), {}).get('xirr')
+        if xirr_pct is not None:
+            performance_record['xirr_pct'] = xirr_pct
+            performance_record['total_return_pct_calc'] = xirr_pct
+    
     # Sort by total return amount descending for better presentation
     lifetime_performance.sort(key=lambda x: x['total_return_amount'], reverse=True)
     
@@ -1125,25 +1393,23 @@ def enrich_holdings_with_cost_basis(holdings_df: pd.DataFrame,
     
     enriched_df = holdings_df.copy()
     
-    # Initialize new columns
-    enriched_df['Cost_Basis_Total'] = 0.0
-    enriched_df['Average_Cost'] = 0.0
-    enriched_df['Unrealized_PnL'] = 0.0
-    enriched_df['Total_Shares_Bought'] = 0.0
-    enriched_df['Total_Shares_Sold'] = 0.0
-    enriched_df['Realized_PnL'] = 0.0
-    
-    # Enrich each holding with cost basis data
-    for idx, holding in enriched_df.iterrows():
-        asset_id = holding.get('Asset_ID')
-        if asset_id in cost_basis_results:
-            cb_data = cost_basis_results[asset_id]
-            
-            enriched_df.loc[idx, 'Cost_Basis_Total'] = cb_data.get('total_cost_basis', 0.0)
-            enriched_df.loc[idx, 'Average_Cost'] = cb_data.get('average_cost', 0.0)
-            enriched_df.loc[idx, 'Unrealized_PnL'] = cb_data.get('unrealized_pnl', 0.0)
-            enriched_df.loc[idx, 'Total_Shares_Bought'] = cb_data.get('total_shares_bought', 0.0)
-            enriched_df.loc[idx, 'Total_Shares_Sold'] = cb_data.get('total_shares_sold', 0.0)
-            enriched_df.loc[idx, 'Realized_PnL'] = cb_data.get('realized_pnl', 0.0)
+    # Map cost basis fields onto holdings by Asset_ID (0.0 where no result exists)
+    field_columns = {
+        'Cost_Basis_Total': 'total_cost_basis',
+        'Average_Cost': 'average_cost',
+        'Unrealized_PnL': 'unrealized_pnl',
+        'Total_Shares_Bought': 'total_shares_bought',
+        'Total_Shares_Sold': 'total_shares_sold',
+        'Realized_PnL': 'realized_pnl'
+    }
+    if 'Asset_ID' not in enriched_df.columns:
+        for column in field_columns:
+            enriched_df[column] = 0.0
+        return enriched_df
+    
+    has_result = enriched_df['Asset_ID'].isin(list(cost_basis_results.keys()))
+    for column, field in field_columns.items():
+        values = {asset_id: cb_data.get(field, 0.0) for asset_id, cb_data in cost_basis_results.items()}
+        enriched_df[column] = enriched_df['Asset_ID'].map(values).where(has_result, 0.0).astype(float)
     
     return enriched_df
@@ -114,6 +114,22 @@ def analyze_asset_performance(holdings_df_mapped: pd.DataFrame, # Expect df with
         portfolio_transaction_dates.extend(liquid_txns.index.tolist())
         portfolio_transaction_flows.extend(liquid_txns['Amount_Net'].tolist())
 
+    # Build cash flows for each asset, then solve every asset's XIRR in one batched call
+    cash_flow_results = {
+        asset_id: performance_calc.build_cash_flows_for_asset(
+            asset_id=asset_id,
+            holdings_df=holdings_df_mapped,
+            transactions_df=transactions_df,
+            latest_date=latest_date
+        )
+        for asset_id in asset_ids
+    }
+    xirr_results = performance_calc.calculate_xirr_batch({
+        asset_id: (cash_flow_result['dates'], cash_flow_result['cash_flows'])
+        for asset_id, cash_flow_result in cash_flow_results.items()
+        if cash_flow_result['status'] in ['success', 'warning'] and cash_flow_result['dates']
+    })
+
     # Now process each individual asset using PerformanceCalculator
     for asset_id in asset_ids:
         # Retrieve data for the asset (already includes Asset_Class)
@@ -129,25 +145,15 @@ def analyze_asset_performance(holdings_df_mapped: pd.DataFrame, # Expect df with
             asset_class = asset_data.get('Asset_Class', 'Unknown')
             allocation_pct = asset_data.get('Allocation_Pct', 0)
 
-        # Use PerformanceCalculator to build cash flows and calculate XIRR
-        cash_flow_result = performance_calc.build_cash_flows_for_asset(
-            asset_id=asset_id,
-            holdings_df=holdings_df_mapped,
-            transactions_df=transactions_df,
-            latest_date=latest_date
-        )
+        cash_flow_result = cash_flow_results[asset_id]
         
         # Extract cash flow data
         total_outflows = cash_flow_result.get('total_outflows', 0.0)
         total_inflows_ex_mv = cash_flow_result.get('total_inflows_ex_mv', 0.0)
         
-        # Calculate XIRR using the unified calculator
-        if cash_flow_result['status'] in ['success', 'warning'] and cash_flow_result['dates']:
-            xirr_result = performance_calc.calculate_xirr(
-                dates=cash_flow_result['dates'],
-                cash_flows=cash_flow_result['cash_flows'],
-                context_id=str(asset_id)
-            )
+        # XIRR from the unified calculator's batched pass
+        if asset_id in xirr_results:
+            xirr_result = xirr_results[asset_id]
         else:
             xirr_result = {
                 'xirr': None, 
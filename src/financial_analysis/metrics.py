@@ -289,7 +289,8 @@ class FinancialMetrics:
         
         return downside_returns.std()
     
-    def calculate_twr(self, price_series: pd.Series, transactions: pd.DataFrame) -> pd.Series:
+    def calculate_twr(self, price_series: pd.Series, transactions: Optional[pd.DataFrame] = None,
+                      daily_flows: Optional[pd.Series] = None) -> pd.Series:
         """
         Calculate Time-Weighted Return (TWR) removing the effect of external cash flows.
         
@@ -303,13 +304,16 @@ class FinancialMetrics:
         Args:
             price_series: Time series of portfolio market values (pandas Series with datetime index)
             transactions: DataFrame with columns ['Date', 'Transaction_Type', 'Amount_Net']
+            daily_flows: Optional precomputed external cash flows per date (e.g. from
+                        calculate_daily_external_flows). Takes precedence over transactions,
+                        so callers evaluating several windows aggregate transactions once.
             
         Returns:
             Series of cumulative TWR indexed by date
         """
         if not isinstance(price_series, pd.Series):
             raise TypeError("price_series must be a pandas Series")
-        if not isinstance(transactions, pd.DataFrame):
+        if daily_flows is None and not isinstance(transactions, pd.DataFrame):
             raise TypeError("transactions must be a pandas DataFrame")
         
         # Clean and prepare price series
@@ -317,8 +321,55 @@ class FinancialMetrics:
         if len(clean_prices) < 2:
             return pd.Series(dtype=float, name='twr')
         
+        if daily_flows is None:
+            daily_flows = self.calculate_daily_external_flows(transactions)
+            if daily_flows is None:
+                return pd.Series(dtype=float, name='twr')
+        
+        # Align price series and cash flows
+        combined_dates = clean_prices.index.union(daily_flows.index).sort_values()
+        aligned_prices = clean_prices.reindex(combined_dates, method='ffill').to_numpy(dtype=float)
+        aligned_flows = daily_flows.reindex(combined_dates, fill_value=0.0).to_numpy(dtype=float)
+        
+        # Holding period returns between consecutive dates
+        begin_values = aligned_prices[:-1]
+        end_values = aligned_prices[1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # HPR = (End_Value - Begin_Value - Cash_Flow) / Begin_Value,
+            # zero where begin_value is zero or negative (would cause division issues)
+            hpr = np.where(
+                begin_values <= 0,
+                0.0,
+                (end_values - begin_values - aligned_flows[1:]) / begin_values
+            )
+        
+        # Cumulative TWR: ∏(1 + HPR) - 1
+        cumulative_twr = np.cumprod(1.0 + hpr) - 1.0
+        
+        # Create result series
+        twr_dates = combined_dates[1:]  # Skip first date since we need pairs
+        result = pd.Series(cumulative_twr, index=twr_dates, name='twr')
+        
+        return result
+    
+    def calculate_daily_external_flows(self, transactions: pd.DataFrame,
+                                       flow_types: Optional[list] = None) -> Optional[pd.Series]:
+        """
+        Aggregate external cash flows (Amount_Net) by transaction date.
+        
+        Args:
+            transactions: DataFrame with Transaction_Type and Amount_Net, dated by a
+                         Transaction_Date/Date column or a datetime index
+            flow_types: Transaction types treated as external flows
+                       (default: Buy, Sell, cash deposits and withdrawals)
+            
+        Returns:
+            Series of summed flows indexed by date, empty if the columns are missing,
+            or None if no date information could be found
+        """
+        external_flow_types = flow_types or ['Buy', 'Sell', 'Cash_Deposit', 'Cash_Withdrawal', 'Deposit', 'Withdrawal']
+        
         # Filter transactions for external cash flows
-        external_flow_types = ['Buy', 'Sell', 'Cash_Deposit', 'Cash_Withdrawal', 'Deposit', 'Withdrawal']
         if 'Transaction_Type' in transactions.columns and 'Amount_Net' in transactions.columns:
             # Filter for external cash flows
             external_flows = transactions[
@@ -354,45 +405,12 @@ class FinancialMetrics:
                     daily_flows = external_flows.groupby(external_flows.index)['Amount_Net'].sum()
                 except Exception:
                     print("Warning: No valid date column found in transactions")
-                    return pd.Series(dtype=float, name='twr')
+                    return None
         else:
             # No external flows data available, assume no cash flows
             daily_flows = pd.Series(dtype=float, name='Amount_Net')
         
-        # Align price series and cash flows
-        combined_dates = clean_prices.index.union(daily_flows.index).sort_values()
-        aligned_prices = clean_prices.reindex(combined_dates, method='ffill')
-        aligned_flows = daily_flows.reindex(combined_dates, fill_value=0.0)
-        
-        # Calculate holding period returns
-        hpr_series = []
-        cumulative_twr = []
-        
-        for i in range(1, len(aligned_prices)):
-            begin_value = aligned_prices.iloc[i-1]
-            end_value = aligned_prices.iloc[i]
-            cash_flow = aligned_flows.iloc[i]
-            
-            # Skip if begin_value is zero or negative (would cause division issues)
-            if begin_value <= 0:
-                hpr = 0.0
-            else:
-                # HPR = (End_Value - Begin_Value - Cash_Flow) / Begin_Value
-                hpr = (end_value - begin_value - cash_flow) / begin_value
-            
-            hpr_series.append(hpr)
-            
-            # Calculate cumulative TWR: ∏(1 + HPR) - 1
-            if len(cumulative_twr) == 0:
-                cumulative_twr.append(hpr)
-            else:
-                cumulative_twr.append((1 + cumulative_twr[-1]) * (1 + hpr) - 1)
-        
-        # Create result series
-        twr_dates = combined_dates[1:]  # Skip first date since we need pairs
-        result = pd.Series(cumulative_twr, index=twr_dates, name='twr')
-        
-        return result
+        return daily_flows
     
     def calculate_max_drawdown(self, price_series: pd.Series) -> Dict[str, Any]:
         """
@@ -13,7 +13,7 @@ import pandas as pd
 import numpy as np
 import logging
 from scipy import optimize
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 try:
     from ..data_manager.currency_converter import get_currency_service
@@ -24,6 +24,12 @@ except ImportError:
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# XIRR search interval: rates below -99.9% are not searched, and the brentq
+# bracket's upper bound doubles from 200% at most XIRR_MAX_EXPANSIONS times
+XIRR_LOWER_BOUND = -0.999
+XIRR_MAX_EXPANSIONS = 8
+XIRR_UPPER_BOUND = 2.0 * 2 ** XIRR_MAX_EXPANSIONS
+
 
 class PerformanceCalculator:
     """
@@ -48,7 +54,8 @@ class PerformanceCalculator:
         """
         Calculate XIRR (Extended Internal Rate of Return) using provided dates and cash flows.
         
-        This is the canonical XIRR implementation with dynamic bracketing and rich metadata.
+        This is the canonical XIRR implementation: Newton's method with the analytic
+        derivative, dynamic bracketing with brentq as fallback, and rich metadata.
         
         Args:
             dates: List of dates (convertible to pandas.Timestamp)
@@ -60,16 +67,82 @@ class PerformanceCalculator:
             - xirr: Annualized XIRR percentage (float) or None if calculation failed
             - status: 'success', 'approx', 'warning', or 'error'
             - reason: Description of calculation result or failure reason
-            - method: Calculation method used ('brentq' or 'approx_ratio')
+            - method: Calculation method used ('newton', 'brentq', or a fallback name)
         """
         self.logger.debug(f"Calculating XIRR for context: {context_id}")
+        inputs, error = self._prepare_xirr_inputs(dates, cash_flows, context_id)
+        if error is not None:
+            return error
+        
+        cash_flows_array, dates_ts, year_fractions = inputs
+        return self._solve_xirr(cash_flows_array, dates_ts, year_fractions, context_id)
+    
+    def calculate_xirr_batch(self, cash_flow_sets: Dict[str, Tuple[List, List]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate XIRR for many cash flow series in one call.
+        
+        Series with a single sign change (one rate in (-100%, inf)) are stacked into
+        zero-padded 2-D arrays and solved together by a vectorized Newton iteration.
+        Series that do not qualify or do not converge go through the same
+        bracketing and fallback path as calculate_xirr.
+        
+        Args:
+            cash_flow_sets: Mapping of context_id (e.g. Asset_ID) to (dates, cash_flows)
+            
+        Returns:
+            Mapping of context_id to the calculate_xirr result dictionary, in input order
+        """
+        results = {}
+        stacked = {}
+        
+        for context_id, (dates, cash_flows) in cash_flow_sets.items():
+            self.logger.debug(f"Calculating XIRR for context: {context_id}")
+            inputs, error = self._prepare_xirr_inputs(dates, cash_flows, str(context_id))
+            if error is not None:
+                results[context_id] = error
+            elif self._has_unique_rate(inputs[0], inputs[2]):
+                stacked[context_id] = inputs
+            else:
+                results[context_id] = self._solve_xirr(*inputs, str(context_id), try_newton=False)
+        
+        if stacked:
+            width = max(len(inputs[0]) for inputs in stacked.values())
+            flows = np.zeros((len(stacked), width))
+            fractions = np.zeros((len(stacked), width))
+            for row, (cash_flows_array, _, year_fractions) in enumerate(stacked.values()):
+                flows[row, :len(cash_flows_array)] = cash_flows_array
+                fractions[row, :len(year_fractions)] = year_fractions
+            
+            rates = self._newton_xirr(flows, fractions)
+            
+            for rate, (context_id, (cash_flows_array, dates_ts, year_fractions)) in zip(rates, stacked.items()):
+                if np.isfinite(rate):
+                    results[context_id] = self._success_xirr_result(
+                        float(rate), 'newton', 'analytic derivative, batched',
+                        cash_flows_array, dates_ts, str(context_id)
+                    )
+                else:
+                    results[context_id] = self._solve_xirr(
+                        cash_flows_array, dates_ts, year_fractions, str(context_id), try_newton=False
+                    )
+        
+        self.logger.info(f"Batch XIRR: {len(stacked)} of {len(cash_flow_sets)} series solved in the stacked pass")
+        return {context_id: results[context_id] for context_id in cash_flow_sets}
+    
+    def _prepare_xirr_inputs(self, dates: List, cash_flows: List, context_id: str):
+        """
+        Validate XIRR inputs and convert them to arrays.
         
+        Returns:
+            Tuple of (inputs, error). inputs is (cash_flows_array, dates_ts, year_fractions)
+            when the series can be solved; otherwise error holds the result dictionary.
+        """
         # Enhanced input validation
         try:
             # Validate that inputs are provided
             if not dates or not cash_flows:
                 self.logger.error(f"Empty inputs for XIRR calculation (context: {context_id})")
-                return {
+                return None, {
                     'xirr': None, 
                     'status': 'error', 
                     'reason': 'Empty dates or cash_flows provided',
@@ -80,7 +153,7 @@ class PerformanceCalculator:
             if len(dates) != len(cash_flows):
                 self.logger.error(f"Mismatched input lengths for XIRR (context: {context_id}): "
                                 f"dates={len(dates)}, cash_flows={len(cash_flows)}")
-                return {
+                return None, {
                     'xirr': None, 
                     'status': 'error', 
                     'reason': 'Mismatched input array lengths',
@@ -91,7 +164,7 @@ class PerformanceCalculator:
             if len(dates) < 2:
                 self.logger.warning(f"Insufficient data points for XIRR calculation (context: {context_id}): "
                                   f"need at least 2, got {len(dates)}")
-                return {
+                return None, {
                     'xirr': None, 
                     'status': 'warning', 
                     'reason': 'Insufficient data points (need at least 2)',
@@ -103,7 +176,7 @@ class PerformanceCalculator:
                 cash_flows_numeric = [float(cf) for cf in cash_flows]
             except (ValueError, TypeError) as ve:
                 self.logger.error(f"Non-numeric cash flows detected for XIRR (context: {context_id}): {ve}")
-                return {
+                return None, {
                     'xirr': None, 
                     'status': 'error', 
                     'reason': f'Non-numeric cash flows: {ve}',
@@ -113,7 +186,7 @@ class PerformanceCalculator:
             # Check for all-zero cash flows
             if all(abs(cf) < 1e-10 for cf in cash_flows_numeric):
                 self.logger.warning(f"All cash flows are zero for XIRR calculation (context: {context_id})")
-                return {
+                return None, {
                     'xirr': None, 
                     'status': 'warning', 
                     'reason': 'All cash flows are effectively zero',
@@ -122,7 +195,7 @@ class PerformanceCalculator:
                 
         except Exception as validation_error:
             self.logger.error(f"Input validation failed for XIRR (context: {context_id}): {validation_error}")
-            return {
+            return None, {
                 'xirr': None, 
                 'status': 'error', 
                 'reason': f'Input validation error: {validation_error}',
@@ -134,7 +207,7 @@ class PerformanceCalculator:
             dates_ts = [pd.Timestamp(d) for d in dates]
         except Exception as e:
             self.logger.error(f"Error converting dates to Timestamps for XIRR (context: {context_id}): {e}")
-            return {
+            return None, {
                 'xirr': None, 
                 'status': 'error', 
                 'reason': 'Date conversion failed',
@@ -148,30 +221,144 @@ class PerformanceCalculator:
         if not ((cash_flows_array > 1e-6).any() and (cash_flows_array < -1e-6).any()):
             self.logger.warning(f"Cash flows for XIRR calculation do not contain both positive and "
                                f"negative values for {context_id}. Cannot calculate XIRR.")
-            return {
+            return None, {
                 'xirr': None, 
                 'status': 'warning', 
                 'reason': 'Cash flows lack both positive and negative values',
                 'method': None
             }
         
-        def xnpv(rate, values, dates_ts):
+        # Year fractions are fixed for the whole solve, so compute them once
+        try:
+            year_fractions = self._year_fractions(dates_ts)
+        except Exception as e:
+            self.logger.error(f"Error computing year fractions for XIRR (context: {context_id}): {e}")
+            return None, {
+                'xirr': None, 
+                'status': 'error', 
+                'reason': 'Date conversion failed',
+                'method': None
+            }
+        
+        return (cash_flows_array, dates_ts, year_fractions), None
+    
+    @staticmethod
+    def _year_fractions(dates_ts: List[pd.Timestamp]) -> np.ndarray:
+        """Years elapsed since the earliest date (actual/365) as a float64 array."""
+        index = pd.DatetimeIndex(dates_ts)
+        return np.asarray((index - index.min()).days, dtype=np.float64) / 365.0
+    
+    @staticmethod
+    def _has_unique_rate(cash_flows_array: np.ndarray, year_fractions: np.ndarray) -> bool:
+        """
+        True if the NPV has exactly one root in (-100%, inf).
+        
+        With x = 1 / (1 + rate) the NPV is a generalized polynomial in x, so by
+        Descartes' rule of signs a single sign change in the time-ordered net
+        flows means a single positive root.
+        """
+        order = np.argsort(year_fractions, kind='stable')
+        times = year_fractions[order]
+        starts = np.flatnonzero(np.r_[True, np.diff(times) > 0])
+        net_flows = np.add.reduceat(cash_flows_array[order], starts)
+        signs = np.sign(net_flows[np.abs(net_flows) > 1e-10])
+        return np.count_nonzero(np.diff(signs)) == 1
+    
+    @staticmethod
+    def _newton_xirr(flows: np.ndarray, year_fractions: np.ndarray,
+                     initial_rate: float = 0.1, max_iter: int = 100) -> np.ndarray:
+        """
+        Vectorized Newton iteration for XIRR on stacked (series, flows) arrays.
+        
+        Zero-padded entries contribute nothing to NPV or its derivative. Steps are
+        damped so rates stay above XIRR_LOWER_BOUND.
+        
+        Returns:
+            Rate per series (decimal), NaN where Newton did not converge inside the
+            interval calculate_xirr searches with brentq.
+        """
+        rates = np.full(flows.shape[0], initial_rate)
+        active = np.ones(flows.shape[0], dtype=bool)
+        
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            for _ in range(max_iter):
+                log_growth = np.log1p(rates[active])[:, np.newaxis]
+                discounted = flows[active] * np.exp(-year_fractions[active] * log_growth)
+                npv = discounted.sum(axis=1)
+                derivative = -(year_fractions[active] * discounted).sum(axis=1) / (1.0 + rates[active])
+                
+                step = npv / derivative
+                current = rates[active]
+                updated = current - step
+                # Never jump past the lower bound; approach it geometrically instead
+                updated = np.where(updated <= XIRR_LOWER_BOUND, (current + XIRR_LOWER_BOUND) / 2.0, updated)
+                rates[active] = updated
+                
+                converged = np.abs(updated - current) <= 1e-10 * (1.0 + np.abs(updated))
+                stalled = ~np.isfinite(updated)
+                indices = np.flatnonzero(active)
+                rates[indices[stalled]] = np.nan
+                active[indices[converged | stalled]] = False
+                if not active.any():
+                    break
+        
+        rates[active] = np.nan
+        rates[(rates < XIRR_LOWER_BOUND) | (rates > XIRR_UPPER_BOUND)] = np.nan
+        return rates
+    
+    def _success_xirr_result(self, xirr_value: float, method: str, detail: str,
+                             cash_flows_array: np.ndarray, dates_ts: List[pd.Timestamp],
+                             context_id: str) -> Dict[str, Any]:
+        """Build and validate the result dictionary for a solved rate."""
+        annualized_xirr = xirr_value * 100.0
+        
+        self.logger.info(f"XIRR calculation successful for {context_id}: "
+                        f"{annualized_xirr:.2f}% (method={method}, {detail})")
+        
+        # Validate result and apply corrections if needed
+        initial_result = {
+            'xirr': annualized_xirr, 
+            'status': 'success', 
+            'reason': None, 
+            'method': method
+        }
+        
+        return self._validate_and_correct_xirr_result(
+            initial_result, cash_flows_array, dates_ts, context_id
+        )
+    
+    def _solve_xirr(self, cash_flows_array: np.ndarray, dates_ts: List[pd.Timestamp],
+                    year_fractions: np.ndarray, context_id: str,
+                    try_newton: bool = True) -> Dict[str, Any]:
+        """
+        Solve XIRR for validated inputs: Newton, then brentq, then MWRR and
+        simple annualized approximations.
+        
+        Args:
+            cash_flows_array: Cash flows as float64 array
+            dates_ts: Matching dates as Timestamps
+            year_fractions: Output of _year_fractions(dates_ts)
+            context_id: Identifier for logging context
+            try_newton: Skip Newton when the caller already tried it
+            
+        Returns:
+            Result dictionary as described in calculate_xirr
+        """
+        def xnpv(rate, values):
             """Calculate net present value with given rate."""
             if rate <= -1.0:
                 return float('inf')
-            min_date = min(dates_ts)
-            time_diff = np.array([(date - min_date).days / 365.0 for date in dates_ts])
-            return np.sum(values / (1 + rate)**time_diff)
+            return np.sum(values / (1 + rate)**year_fractions)
         
-        def xirr_objective_np(rate, values, dates_ts):
+        def objective(rate):
             """Objective function for XIRR optimization."""
             try:
-                return xnpv(rate, values, dates_ts)
+                return xnpv(rate, cash_flows_array)
             except Exception as e:
                 self.logger.debug(f"xnpv calculation error at rate {rate} for {context_id}: {e}")
                 return float('inf')
         
-        def bracket_root(func, lower=-0.999, upper=2.0, max_expansions=8):
+        def bracket_root(func, lower=XIRR_LOWER_BOUND, upper=2.0, max_expansions=XIRR_MAX_EXPANSIONS):
             """
             Attempt to expand the upper bound until a sign change is detected or limits reached.
             
@@ -190,39 +377,33 @@ class PerformanceCalculator:
             
             if f_low * f_up > 0:
                 return None  # Failed to bracket
-            return (-0.999, upper)
+            return (lower, upper)
         
         # Main XIRR calculation
         try:
-            def objective(r):
-                return xirr_objective_np(r, cash_flows_array, dates_ts)
-            
-            # Try to bracket the root
-            bracket = bracket_root(objective, lower=-0.999, upper=2.0)
-            
-            if bracket is not None:
+            xirr_value = None
+            if try_newton and self._has_unique_rate(cash_flows_array, year_fractions):
+                xirr_value = self._newton_xirr(
+                    cash_flows_array[np.newaxis, :], year_fractions[np.newaxis, :]
+                )[0]
+            
+            if xirr_value is not None and np.isfinite(xirr_value):
+                method = 'newton'
+                detail = 'analytic derivative'
+            else:
+                # Try to bracket the root
+                bracket = bracket_root(objective, lower=XIRR_LOWER_BOUND, upper=2.0)
+                if bracket is None:
+                    raise ValueError("Could not bracket root for XIRR")
+                
                 a, b = bracket
-                result = optimize.brentq(objective, a=a, b=b, xtol=1e-6, maxiter=200)
-                xirr_value = float(result)
-                annualized_xirr = xirr_value * 100.0
+                xirr_value = optimize.brentq(objective, a=a, b=b, xtol=1e-6, maxiter=200)
                 method = 'brentq'
-                
-                self.logger.info(f"XIRR calculation successful for {context_id}: "
-                                f"{annualized_xirr:.2f}% (method={method}, bracket=({a},{b}))")
-                
-                # Validate result and apply corrections if needed
-                initial_result = {
-                    'xirr': annualized_xirr, 
-                    'status': 'success', 
-                    'reason': None, 
-                    'method': method
-                }
-                
-                return self._validate_and_correct_xirr_result(
-                    initial_result, cash_flows_array, dates_ts, context_id
-                )
-            else:
-                raise ValueError("Could not bracket root for XIRR")
+                detail = f'bracket=({a},{b})'
+            
+            return self._success_xirr_result(
+                float(xirr_value), method, detail, cash_flows_array, dates_ts, context_id
+            )
                 
         except Exception as e:
             # Fallback: approximate IRR using simplified annualized return
@@ -524,43 +705,49 @@ class PerformanceCalculator:
                 self.logger.warning(f"Failed to initialize currency service: {e}")
                 currency_service = None
         
-        # Helper function for currency conversion with enhanced error handling
-        def convert_amount(amount: float, source_currency: str, date: pd.Timestamp) -> float:
-            """Convert amount to target currency if needed with comprehensive error handling."""
+        # Helper for batch currency conversion with enhanced error handling
+        def convert_amounts(amounts: pd.Series, source_currencies, conversion_dates) -> np.ndarray:
+            """Convert amounts to target currency in one batch (rates resolved once per currency/date)."""
             nonlocal currency_conversions
             
-            try:
-                # Handle edge cases
-                if amount == 0:
-                    return 0.0
-                    
-                if pd.isna(amount) or not isinstance(amount, (int, float, np.integer, np.floating)):
-                    self.logger.warning(f"Invalid amount for conversion: {amount} (type: {type(amount)}), using 0.0")
-                    return 0.0
+            raw = pd.Series(amounts)
+            values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+            invalid = np.isnan(values)
+            if invalid.any():
+                self.logger.warning(f"Invalid amounts for conversion: {raw[invalid].tolist()[:5]}, using 0.0")
+                values[invalid] = 0.0
+            
+            if isinstance(source_currencies, str):
+                currencies = pd.Series(source_currencies, index=raw.index, dtype=object)
+            else:
+                currencies = pd.Series(np.asarray(source_currencies, dtype=object), index=raw.index)
+            needs_conversion = (currencies != target_currency).to_numpy() & (values != 0)
+            if not needs_conversion.any():
+                return values
                 
-                if source_currency == target_currency:
-                    return float(amount)
-                    
-                if not CURRENCY_CONVERSION_AVAILABLE or currency_service is None:
-                    self.logger.warning(f"Currency conversion not available, keeping original amount in {source_currency}")
-                    return float(amount)
-                    
-                try:
-                    converted = currency_service.convert_amount(amount, source_currency, target_currency, date)
-                    if converted is not None:
-                        currency_conversions += 1
-                        self.logger.debug(f"Converted {amount:.2f} {source_currency} to {converted:.2f} {target_currency}")
-                        return float(converted)
-                    else:
-                        self.logger.warning(f"Failed to convert {amount} from {source_currency} to {target_currency}, using original")
-                        return float(amount)
-                except Exception as conv_error:
-                    self.logger.warning(f"Currency conversion error: {conv_error}, using original amount")
-                    return float(amount)
-                    
-            except Exception as e:
-                self.logger.error(f"Critical error in currency conversion helper: {e}, returning 0.0")
-                return 0.0
+            if not CURRENCY_CONVERSION_AVAILABLE or currency_service is None:
+                self.logger.warning(f"Currency conversion not available, keeping original amounts in "
+                                    f"{sorted(map(str, currencies[needs_conversion].unique()))}")
+                return values
+                
+            try:
+                converted = currency_service.convert_series(
+                    pd.Series(values[needs_conversion]),
+                    currencies.to_numpy(dtype=object)[needs_conversion],
+                    pd.DatetimeIndex(conversion_dates)[needs_conversion],
+                    target_currency
+                ).to_numpy()
+            except Exception as conv_error:
+                self.logger.warning(f"Currency conversion error: {conv_error}, using original amounts")
+                return values
+            
+            failed = np.isnan(converted)
+            if failed.any():
+                self.logger.warning(f"Failed to convert {int(failed.sum())} amounts to {target_currency}, using original")
+            currency_conversions += int((~failed).sum())
+            result = values.copy()
+            result[np.flatnonzero(needs_conversion)[~failed]] = converted[~failed]
+            return result
         
         # Validate inputs
         if holdings_df is None or holdings_df.empty:
@@ -641,7 +828,7 @@ class PerformanceCalculator:
                 # It's a pandas array, get the first value
                 market_value_raw = market_value_raw.values[0] if len(market_value_raw.values) > 0 else 0.0
             
-            market_value = convert_amount(market_value_raw, 'CNY', latest_date)
+            market_value = float(convert_amounts(pd.Series([market_value_raw]), 'CNY', [latest_date])[0])
             
         except Exception as e:
             self.logger.error(f"Error extracting market value for asset {asset_id}: {e}")
@@ -689,37 +876,30 @@ class PerformanceCalculator:
                 failed_conversions = 0
                 
                 try:
-                    for txn_date, row in asset_txns.iterrows():
-                        try:
-                            original_amount = row['Amount_Net']
-                            
-                            # Validate transaction amount
-                            if pd.isna(original_amount):
-                                self.logger.warning(f"NaN amount in transaction for {asset_id} on {txn_date}, skipping")
-                                continue
-                                
-                            # Determine source currency (default to CNY if not specified)
-                            source_currency = row.get('Currency', 'CNY') if 'Currency' in asset_txns.columns else 'CNY'
-                            
-                            # Convert to target currency
-                            converted_amount = convert_amount(original_amount, source_currency, txn_date)
-                            
-                            processed_dates.append(txn_date)
-                            processed_cash_flows.append(converted_amount)
-                            
-                        except Exception as txn_error:
-                            failed_conversions += 1
-                            self.logger.warning(f"Failed to process transaction for {asset_id} on {txn_date}: {txn_error}")
-                            continue
+                    # Skip transactions without an amount
+                    missing = asset_txns['Amount_Net'].isna().to_numpy()
+                    for txn_date in asset_txns.index[missing]:
+                        self.logger.warning(f"NaN amount in transaction for {asset_id} on {txn_date}, skipping")
+                    valid_txns = asset_txns[~missing]
+                    
+                    # Determine source currency (default to CNY if not specified)
+                    source_currencies = valid_txns['Currency'] if 'Currency' in valid_txns.columns else 'CNY'
                     
-                    # Log processing summary
-                    if failed_conversions > 0:
-                        self.logger.warning(f"Failed to process {failed_conversions} transactions for {asset_id}")
+                    # Convert to target currency in one batch
+                    converted_amounts = convert_amounts(valid_txns['Amount_Net'], source_currencies, valid_txns.index)
+                    
+                    processed_dates = list(valid_txns.index)
+                    processed_cash_flows = converted_amounts.tolist()
                     
                 except Exception as processing_error:
+                    failed_conversions = len(asset_txns)
                     self.logger.error(f"Critical error processing transactions for {asset_id}: {processing_error}")
                     # Continue with whatever data we have
                 
+                # Log processing summary
+                if failed_conversions > 0:
+                    self.logger.warning(f"Failed to process {failed_conversions} transactions for {asset_id}")
+                
                 # Update cash flows
                 dates.extend(processed_dates)
                 cash_flows.extend(processed_cash_flows)
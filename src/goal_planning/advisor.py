@@ -167,24 +167,24 @@ class GoalAdvisor:
         
         logger.info(f"Analyzing savings increase scenario for goal: {goal.name}")
         
+        # Simulate return paths once; every contribution level is evaluated on them
+        value_factors = self._goal_value_factors(goal_id)
+        
         # Get baseline probability
-        baseline_result = self.monte_carlo_engine.run_simulation(
-            initial_portfolio_value=portfolio_value,
-            annual_contribution=current_annual_contribution
+        base_probability = self._success_probability(
+            value_factors, portfolio_value, current_annual_contribution, goal.target_amount
         )
-        base_probability = baseline_result.goal_probabilities.get(goal_id, 0.0)
         
-        # Binary search for required contribution increase
+        # Solve for required contribution increase
         required_contribution = self._find_required_contribution(
-            goal_id, portfolio_value, current_annual_contribution, target_probability
+            goal_id, portfolio_value, current_annual_contribution, target_probability,
+            value_factors=value_factors
         )
         
-        # Run simulation with required contribution
-        modified_result = self.monte_carlo_engine.run_simulation(
-            initial_portfolio_value=portfolio_value,
-            annual_contribution=required_contribution
+        # Probability with required contribution
+        modified_probability = self._success_probability(
+            value_factors, portfolio_value, required_contribution, goal.target_amount
         )
-        modified_probability = modified_result.goal_probabilities.get(goal_id, 0.0)
         
         # Calculate impact
         contribution_increase = required_contribution - current_annual_contribution
@@ -254,86 +254,75 @@ class GoalAdvisor:
         
         logger.info(f"Analyzing timeline adjustment scenarios for goal: {goal.name}")
         
+        original_target_date = goal.target_date
+        base_horizon = self.monte_carlo_engine.get_projection_years()
+        
+        # Resolve each adjusted target date and the horizon it would simulate over
+        adjusted_timelines = []
+        for year_adjustment in timeline_adjustments:
+            new_target_date = date(
+                original_target_date.year + year_adjustment,
+                original_target_date.month,
+                original_target_date.day
+            )
+            new_years_remaining = (new_target_date - date.today()).days / 365.25
+            other_years = [g.years_remaining for gid, g in goals.items() if gid != goal_id]
+            horizon = max(int(np.ceil(max(other_years + [new_years_remaining]))), 1)
+            adjusted_timelines.append((year_adjustment, new_target_date, new_years_remaining, horizon))
+        
+        # One set of paths covers every timeline: draws are year-major, so each
+        # shorter horizon sees exactly the paths a standalone simulation would
+        max_horizon = max([base_horizon] + [timeline[3] for timeline in adjusted_timelines])
+        growth_factors, annuity_factors = self.monte_carlo_engine.simulate_growth_paths(max_horizon)
+        
+        def probability_at(years_remaining: float, horizon: int) -> float:
+            year_idx = self.monte_carlo_engine.goal_year_index(years_remaining, horizon)
+            return self._success_probability(
+                (growth_factors[year_idx], annuity_factors[year_idx]),
+                portfolio_value, annual_contribution, goal.target_amount
+            )
+        
         # Get baseline probability
-        baseline_result = self.monte_carlo_engine.run_simulation(
-            initial_portfolio_value=portfolio_value,
-            annual_contribution=annual_contribution
-        )
-        base_probability = baseline_result.goal_probabilities.get(goal_id, 0.0)
+        base_probability = probability_at(goal.years_remaining, base_horizon)
         
         scenarios = []
-        original_target_date = goal.target_date
         
-        for year_adjustment in timeline_adjustments:
-            try:
-                # Temporarily modify goal timeline
-                new_target_date = date(
-                    original_target_date.year + year_adjustment,
-                    original_target_date.month,
-                    original_target_date.day
-                )
-                
-                # Create modified goal for simulation
-                modified_goals = goals.copy()
-                modified_goal = Goal(
-                    name=goal.name,
-                    target_amount=goal.target_amount,
-                    target_date=new_target_date,
-                    priority=goal.priority,
-                    category=goal.category,
-                    current_progress=goal.current_progress,
-                    description=goal.description
-                )
-                modified_goals[goal_id] = modified_goal
-                
-                # Temporarily update goal manager
-                original_goals = self.goal_manager.goals
-                self.goal_manager.goals = modified_goals
-                
-                # Run simulation with modified timeline
-                modified_result = self.monte_carlo_engine.run_simulation(
-                    initial_portfolio_value=portfolio_value,
-                    annual_contribution=annual_contribution
-                )
-                modified_probability = modified_result.goal_probabilities.get(goal_id, 0.0)
-                
-                # Generate recommendations
-                recommendations = []
-                probability_change = modified_probability - base_probability
+        for year_adjustment, new_target_date, new_years_remaining, horizon in adjusted_timelines:
+            modified_probability = probability_at(new_years_remaining, horizon)
+            
+            # Generate recommendations
+            recommendations = []
+            probability_change = modified_probability - base_probability
+            
+            if abs(probability_change) > 0.05:  # Significant change
+                if year_adjustment > 0:
+                    action = f"Extend {goal.name} timeline by {year_adjustment} year{'s' if year_adjustment > 1 else ''}"
+                    impact = f"Moving target date from {original_target_date} to {new_target_date}"
+                else:
+                    action = f"Accelerate {goal.name} timeline by {abs(year_adjustment)} year{'s' if abs(year_adjustment) > 1 else ''}"
+                    impact = f"Moving target date from {original_target_date} to {new_target_date}"
                 
-                if abs(probability_change) > 0.05:  # Significant change
-                    if year_adjustment > 0:
-                        action = f"Extend {goal.name} timeline by {year_adjustment} year{'s' if year_adjustment > 1 else ''}"
-                        impact = f"Moving target date from {original_target_date} to {new_target_date}"
-                    else:
-                        action = f"Accelerate {goal.name} timeline by {abs(year_adjustment)} year{'s' if abs(year_adjustment) > 1 else ''}"
-                        impact = f"Moving target date from {original_target_date} to {new_target_date}"
-                    
-                    priority = (RecommendationPriority.HIGH if abs(probability_change) > 0.15 
-                              else RecommendationPriority.MEDIUM)
-                    
-                    recommendations.append(Recommendation(
-                        title=f"Timeline Adjustment for {goal.name}",
-                        description=f"Adjusting timeline by {year_adjustment} years changes success probability by {probability_change:+.1%}",
-                        action_required=action,
-                        priority=priority,
-                        recommendation_type=RecommendationType.TIMELINE_ADJUSTMENT,
-                        impact_description=impact,
-                        probability_improvement=probability_change
-                    ))
+                priority = (RecommendationPriority.HIGH if abs(probability_change) > 0.15 
+                          else RecommendationPriority.MEDIUM)
                 
-                scenarios.append(ScenarioAnalysis(
-                    scenario_name=f"{goal.name} Timeline {year_adjustment:+d} Years",
-                    base_probability=base_probability,
-                    modified_probability=modified_probability,
-                    parameter_changed="target_date",
-                    parameter_value=new_target_date,
-                    recommendations=recommendations
+                recommendations.append(Recommendation(
+                    title=f"Timeline Adjustment for {goal.name}",
+                    description=f"Adjusting timeline by {year_adjustment} years changes success probability by {probability_change:+.1%}",
+                    action_required=action,
+                    priority=priority,
+                    recommendation_type=RecommendationType.TIMELINE_ADJUSTMENT,
+                    impact_description=impact,
+                    probability_improvement=probability_change
                 ))
-                
-            finally:
-                # Restore original goals
-                self.goal_manager.goals = original_goals
+            
+            scenarios.append(ScenarioAnalysis(
+                scenario_name=f"{goal.name} Timeline {year_adjustment:+d} Years",
+                base_probability=base_probability,
+                modified_probability=modified_probability,
+                parameter_changed="target_date",
+                parameter_value=new_target_date,
+                recommendations=recommendations
+            ))
         
         return scenarios
     
@@ -376,73 +365,51 @@ class GoalAdvisor:
         scenarios = []
         original_target_amount = goal.target_amount
         
+        # Target amount does not change the return paths, so every variant is
+        # read from the baseline simulation at the goal's target year
+        projection_years = len(baseline_result.years) - 1
+        year_idx = self.monte_carlo_engine.goal_year_index(goal.years_remaining, projection_years)
+        goal_year_values = baseline_result.simulations[:, year_idx]
+        
         for amount_adjustment in amount_adjustments:
-            try:
-                # Calculate new target amount
-                new_target_amount = original_target_amount * (1 + amount_adjustment)
-                
-                # Create modified goal for simulation
-                modified_goals = goals.copy()
-                modified_goal = Goal(
-                    name=goal.name,
-                    target_amount=new_target_amount,
-                    target_date=goal.target_date,
-                    priority=goal.priority,
-                    category=goal.category,
-                    current_progress=goal.current_progress,
-                    description=goal.description
-                )
-                modified_goals[goal_id] = modified_goal
-                
-                # Temporarily update goal manager
-                original_goals = self.goal_manager.goals
-                self.goal_manager.goals = modified_goals
-                
-                # Run simulation with modified amount
-                modified_result = self.monte_carlo_engine.run_simulation(
-                    initial_portfolio_value=portfolio_value,
-                    annual_contribution=annual_contribution
-                )
-                modified_probability = modified_result.goal_probabilities.get(goal_id, 0.0)
-                
-                # Generate recommendations
-                recommendations = []
-                probability_change = modified_probability - base_probability
-                amount_change = new_target_amount - original_target_amount
+            # Calculate new target amount
+            new_target_amount = original_target_amount * (1 + amount_adjustment)
+            modified_probability = float(np.mean(goal_year_values >= new_target_amount))
+            
+            # Generate recommendations
+            recommendations = []
+            probability_change = modified_probability - base_probability
+            amount_change = new_target_amount - original_target_amount
+            
+            if abs(probability_change) > 0.05:  # Significant change
+                if amount_adjustment < 0:
+                    action = f"Reduce {goal.name} target by ${abs(amount_change):,.0f} ({abs(amount_adjustment):.0%})"
+                else:
+                    action = f"Increase {goal.name} target by ${amount_change:,.0f} ({amount_adjustment:.0%})"
                 
-                if abs(probability_change) > 0.05:  # Significant change
-                    if amount_adjustment < 0:
-                        action = f"Reduce {goal.name} target by ${abs(amount_change):,.0f} ({abs(amount_adjustment):.0%})"
-                    else:
-                        action = f"Increase {goal.name} target by ${amount_change:,.0f} ({amount_adjustment:.0%})"
-                    
-                    priority = (RecommendationPriority.MEDIUM if abs(probability_change) > 0.10 
-                              else RecommendationPriority.LOW)
-                    
-                    recommendations.append(Recommendation(
-                        title=f"Goal Amount Adjustment for {goal.name}",
-                        description=f"Adjusting target amount by {amount_adjustment:+.0%} changes success probability by {probability_change:+.1%}",
-                        action_required=action,
-                        priority=priority,
-                        recommendation_type=RecommendationType.GOAL_MODIFICATION,
-                        impact_description=f"Target changes from ${original_target_amount:,.0f} to ${new_target_amount:,.0f}",
-                        current_value=original_target_amount,
-                        recommended_value=new_target_amount,
-                        probability_improvement=probability_change
-                    ))
+                priority = (RecommendationPriority.MEDIUM if abs(probability_change) > 0.10 
+                          else RecommendationPriority.LOW)
                 
-                scenarios.append(ScenarioAnalysis(
-                    scenario_name=f"{goal.name} Amount {amount_adjustment:+.0%}",
-                    base_probability=base_probability,
-                    modified_probability=modified_probability,
-                    parameter_changed="target_amount",
-                    parameter_value=new_target_amount,
-                    recommendations=recommendations
+                recommendations.append(Recommendation(
+                    title=f"Goal Amount Adjustment for {goal.name}",
+                    description=f"Adjusting target amount by {amount_adjustment:+.0%} changes success probability by {probability_change:+.1%}",
+                    action_required=action,
+                    priority=priority,
+                    recommendation_type=RecommendationType.GOAL_MODIFICATION,
+                    impact_description=f"Target changes from ${original_target_amount:,.0f} to ${new_target_amount:,.0f}",
+                    current_value=original_target_amount,
+                    recommended_value=new_target_amount,
+                    probability_improvement=probability_change
                 ))
-                
-            finally:
-                # Restore original goals
-                self.goal_manager.goals = original_goals
+            
+            scenarios.append(ScenarioAnalysis(
+                scenario_name=f"{goal.name} Amount {amount_adjustment:+.0%}",
+                base_probability=base_probability,
+                modified_probability=modified_probability,
+                parameter_changed="target_amount",
+                parameter_value=new_target_amount,
+                recommendations=recommendations
+            ))
         
         return scenarios
     
@@ -625,52 +592,85 @@ class GoalAdvisor:
         
         return recommendations
     
+    def _goal_value_factors(self, goal_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate default-assumption return paths and extract the per-path growth
+        and contribution annuity factors at the goal's target year.
+        
+        Args:
+            goal_id: Goal to analyze
+            
+        Returns:
+            Tuple of (growth_factors, annuity_factors), one entry per simulated path
+        """
+        projection_years = self.monte_carlo_engine.get_projection_years()
+        years_remaining = self.goal_manager.get_goal(goal_id).years_remaining
+        
+        year_idx = self.monte_carlo_engine.goal_year_index(years_remaining, projection_years)
+        if year_idx is None:
+            raise ValueError(f"Goal {goal_id} is beyond the {projection_years}-year simulation horizon")
+        
+        growth_factors, annuity_factors = self.monte_carlo_engine.simulate_growth_paths(projection_years)
+        return growth_factors[year_idx], annuity_factors[year_idx]
+    
+    @staticmethod
+    def _success_probability(
+        value_factors: Tuple[np.ndarray, np.ndarray],
+        portfolio_value: float,
+        annual_contribution: float,
+        target_amount: float
+    ) -> float:
+        """
+        Share of simulated paths whose value at the target year reaches target_amount.
+        """
+        growth_factors, annuity_factors = value_factors
+        terminal_values = portfolio_value * growth_factors + annual_contribution * annuity_factors
+        return float(np.mean(terminal_values >= target_amount))
+    
     def _find_required_contribution(
         self,
         goal_id: str,
         portfolio_value: float,
         current_contribution: float,
         target_probability: float,
-        max_iterations: int = 20
+        value_factors: Optional[Tuple[np.ndarray, np.ndarray]] = None
     ) -> float:
         """
-        Use binary search to find required contribution for target probability.
+        Find the smallest contribution reaching the target probability.
+        
+        The terminal value of each path is linear in the annual contribution, so
+        each path's break-even contribution is solved directly and the answer is
+        the target_probability quantile across paths. The result is bounded to
+        [current contribution, 5x current contribution].
         """
-        # Set search bounds
+        if value_factors is None:
+            value_factors = self._goal_value_factors(goal_id)
+        growth_factors, annuity_factors = value_factors
+        target_amount = self.goal_manager.get_goal(goal_id).target_amount
+        
         low_contribution = current_contribution
-        high_contribution = current_contribution * 5  # Start with 5x current contribution
-        tolerance = 0.01  # 1% tolerance for probability
+        high_contribution = current_contribution * 5  # Cap at 5x current contribution
+        
+        # Per-path contribution needed to reach the target; paths without
+        # contribution exposure either always or never succeed
+        shortfall = target_amount - portfolio_value * growth_factors
+        with np.errstate(divide='ignore', invalid='ignore'):
+            break_even = np.where(
+                annuity_factors > 0,
+                shortfall / annuity_factors,
+                np.where(shortfall <= 0, -np.inf, np.inf)
+            )
         
-        # First check if even 5x contribution achieves target
-        test_result = self.monte_carlo_engine.run_simulation(
-            initial_portfolio_value=portfolio_value,
-            annual_contribution=high_contribution
-        )
-        test_probability = test_result.goal_probabilities.get(goal_id, 0.0)
+        # Smallest contribution covering at least target_probability of paths
+        num_paths = len(break_even)
+        required_paths = min(max(int(np.ceil(target_probability * num_paths - 1e-9)), 1), num_paths)
+        required_contribution = float(np.partition(break_even, required_paths - 1)[required_paths - 1])
         
-        if test_probability < target_probability:
-            # Even 5x doesn't work, return the high value
+        if required_contribution > high_contribution:
             logger.warning(f"Target probability {target_probability:.1%} may not be achievable even with 5x contribution")
             return high_contribution
         
-        # Binary search
-        for _ in range(max_iterations):
-            mid_contribution = (low_contribution + high_contribution) / 2
-            
-            test_result = self.monte_carlo_engine.run_simulation(
-                initial_portfolio_value=portfolio_value,
-                annual_contribution=mid_contribution
-            )
-            test_probability = test_result.goal_probabilities.get(goal_id, 0.0)
-            
-            if abs(test_probability - target_probability) < tolerance:
-                return mid_contribution
-            elif test_probability < target_probability:
-                low_contribution = mid_contribution
-            else:
-                high_contribution = mid_contribution
-        
-        return (low_contribution + high_contribution) / 2
+        return max(required_contribution, low_contribution)
 
     def format_recommendations_report(
         self,
@@ -448,8 +448,7 @@ class MonteCarloSimulation:
         if not goals:
             raise ValueError("No goals defined for simulation")
         
-        max_years = max(goal.years_remaining for goal in goals.values())
-        projection_years = max(int(np.ceil(max_years)), 1)
+        projection_years = self.get_projection_years()
         
         # Generate date sequence
         start_date = date.today()
@@ -460,50 +459,32 @@ class MonteCarloSimulation:
             dates.append(year_date)
             years.append(year)
         
-        # Run Monte Carlo simulations
-        simulations = np.zeros((num_simulations, len(years)))
-        simulations[:, 0] = initial_portfolio_value  # Set initial value
-        
-        # Set random seed for reproducible results
-        np.random.seed(42)
-        
-        for sim in range(num_simulations):
-            portfolio_value = initial_portfolio_value
-            contribution = annual_contribution
-            
-            for year_idx in range(1, len(years)):
-                # Generate random annual return
-                annual_return = np.random.normal(expected_annual_return, market_volatility)
-                
-                # Apply investment growth
-                portfolio_value = portfolio_value * (1 + annual_return)
-                
-                # Add annual contribution
-                portfolio_value += contribution
-                
-                # Store result
-                simulations[sim, year_idx] = portfolio_value
-                
-                # Grow contribution for next year
-                contribution *= (1 + contribution_growth_rate)
-        
-        # Calculate percentiles
-        percentiles = {}
-        for confidence_level in confidence_levels:
-            percentile = confidence_level * 100
-            percentile_values = []
-            for year_idx in range(len(years)):
-                value = np.percentile(simulations[:, year_idx], percentile)
-                percentile_values.append(value)
-            percentiles[f"p{int(percentile)}"] = percentile_values
+        # Run Monte Carlo simulations: portfolio value is linear in the contribution
+        # for a fixed return path, so build both factors once and combine them
+        growth_factors, annuity_factors = self.simulate_growth_paths(
+            projection_years=projection_years,
+            expected_annual_return=expected_annual_return,
+            market_volatility=market_volatility,
+            contribution_growth_rate=contribution_growth_rate,
+            num_simulations=num_simulations
+        )
+        annuity_factors *= annual_contribution
+        annuity_factors += initial_portfolio_value * growth_factors
+        simulations = annuity_factors.T  # Shape: (num_simulations, num_years)
+        
+        # Calculate all percentiles in a single pass over the year axis
+        percentile_points = [confidence_level * 100 for confidence_level in confidence_levels]
+        percentile_matrix = np.percentile(annuity_factors, percentile_points, axis=1)
+        percentiles = {
+            f"p{int(percentile)}": percentile_matrix[i].tolist()
+            for i, percentile in enumerate(percentile_points)
+        }
         
         # Calculate goal success probabilities
         goal_probabilities = {}
         for goal_id, goal in goals.items():
-            if goal.years_remaining <= projection_years:
-                year_idx = min(int(np.ceil(goal.years_remaining)), projection_years)
-                year_idx = max(year_idx, 0)  # Ensure non-negative
-                
+            year_idx = self.goal_year_index(goal.years_remaining, projection_years)
+            if year_idx is not None:
                 # Count simulations where goal is achieved
                 achieved_count = np.sum(simulations[:, year_idx] >= goal.target_amount)
                 probability = achieved_count / num_simulations
@@ -538,6 +519,100 @@ class MonteCarloSimulation:
             assumptions=simulation_assumptions
         )
     
+    def get_projection_years(self) -> int:
+        """
+        Number of simulated years needed to cover every defined goal.
+        
+        Returns:
+            Projection horizon in whole years (at least 1)
+        """
+        goals = self.goal_manager.list_goals()
+        if not goals:
+            raise ValueError("No goals defined for simulation")
+        
+        max_years = max(goal.years_remaining for goal in goals.values())
+        return max(int(np.ceil(max_years)), 1)
+    
+    @staticmethod
+    def goal_year_index(years_remaining: float, projection_years: int) -> Optional[int]:
+        """
+        Map a goal's remaining years onto a simulated year index.
+        
+        Args:
+            years_remaining: Years until the goal's target date
+            projection_years: Simulated horizon in years
+            
+        Returns:
+            Year index into the simulation matrix, or None if beyond the horizon
+        """
+        if years_remaining > projection_years:
+            return None
+        year_idx = min(int(np.ceil(years_remaining)), projection_years)
+        return max(year_idx, 0)  # Ensure non-negative
+    
+    def simulate_growth_paths(
+        self,
+        projection_years: int,
+        expected_annual_return: Optional[float] = None,
+        market_volatility: Optional[float] = None,
+        contribution_growth_rate: float = 0.0,
+        num_simulations: Optional[int] = None,
+        seed: int = 42
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate random return paths and reduce them to per-path value factors.
+        
+        For a fixed return path the portfolio value in year t is
+        ``initial_value * growth[t] + annual_contribution * annuity[t]``, so any
+        combination of starting value and contribution can be evaluated on the
+        same paths without redrawing.
+        
+        Draws are laid out year-major, so a shorter horizon with the same seed
+        reuses exactly the leading years of a longer one.
+        
+        Args:
+            projection_years: Number of years to simulate
+            expected_annual_return: Expected annual return (uses config default if None)
+            market_volatility: Annual volatility (uses config default if None)
+            contribution_growth_rate: Annual growth rate for contributions
+            num_simulations: Number of paths (uses config default if None)
+            seed: Random seed for reproducible results
+            
+        Returns:
+            Tuple of (growth_factors, annuity_factors), each shaped
+            (projection_years + 1, num_simulations) with year 0 in the first row
+        """
+        assumptions = self.planning_config['assumptions']
+        simulation_config = self.planning_config['simulation']
+        if expected_annual_return is None:
+            expected_annual_return = assumptions['default_investment_return']
+        if market_volatility is None:
+            market_volatility = simulation_config['market_volatility']
+        if num_simulations is None:
+            num_simulations = simulation_config['num_simulations']
+        
+        rng = np.random.default_rng(seed)
+        
+        # Cumulative growth of one unit invested at year 0
+        growth_factors = np.empty((projection_years + 1, num_simulations))
+        growth_factors[0] = 1.0
+        annual_growth = growth_factors[1:]
+        rng.standard_normal(out=annual_growth)
+        annual_growth *= market_volatility
+        annual_growth += 1.0 + expected_annual_return
+        
+        # Value of a unit contribution stream, paid at the end of each year and
+        # growing at contribution_growth_rate: annuity[t] = annuity[t-1] * (1 + r_t) + g^(t-1)
+        contribution_schedule = (1.0 + contribution_growth_rate) ** np.arange(projection_years)
+        annuity_factors = np.zeros_like(growth_factors)
+        for year_idx in range(1, projection_years + 1):
+            np.multiply(annuity_factors[year_idx - 1], annual_growth[year_idx - 1], out=annuity_factors[year_idx])
+            annuity_factors[year_idx] += contribution_schedule[year_idx - 1]
+        
+        np.cumprod(growth_factors, axis=0, out=growth_factors)
+        
+        return growth_factors, annuity_factors
+    
     def analyze_scenario_probabilities(
         self,
         initial_portfolio_value: float,
@@ -0,0 +1,201 @@
+"""
+Per-indicator cache for MacroAnalyzer (stale-while-revalidate).
+
+Each market indicator is cached on its own with its own time-to-live: slow
+moving series such as Shiller P/E are kept for a month, quotes such as VIX for
+an hour. An expired value is still served while a background refresh runs, so
+a page only waits for the network when an indicator has never been fetched.
+
+Entries record the last fetch latency and status. A failed refresh keeps the
+last good value and is retried after ERROR_RETRY_SECONDS. Entries remember the
+manual input override they were computed with, so editing one manual indicator
+only invalidates that indicator.
+
+The cache is a single JSON file written atomically; it is reloaded when another
+process has written it.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Seconds before a cached indicator is refreshed
+INDICATOR_TTLS = {
+    'shiller_pe': 30 * DAY,
+    'buffett_us': 7 * DAY,
+    'buffett_china': 7 * DAY,
+    'buffett_japan': 7 * DAY,
+    'buffett_europe': 7 * DAY,
+    'fear_greed': 6 * HOUR,
+    'vix': HOUR,
+    'gvz': HOUR,
+    'gold_silver_ratio': HOUR,
+    'sp500_gold_ratio': HOUR,
+    'btc_volatility': HOUR,
+    'eth_volatility': HOUR,
+    'btc_eth_ratio': HOUR,
+    'btc_dominance': HOUR,
+    'crypto_fear_greed': 6 * HOUR,
+}
+# Retry delay after a fetch that did not succeed
+ERROR_RETRY_SECONDS = 10 * 60
+
+
+class IndicatorCache:
+    """Thread-safe JSON-backed cache of indicator results."""
+
+    def __init__(self, path: Path, default_ttl: float = DAY):
+        """
+        Args:
+            path: JSON file holding the cache
+            default_ttl: TTL in seconds for indicators missing from INDICATOR_TTLS
+        """
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def ttl(self, key: str) -> float:
+        return INDICATOR_TTLS.get(key, self.default_ttl)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cache entry for an indicator (result, fetched_at, checked_at, latency_s, status, manual), or None."""
+        with self._lock:
+            self._reload_if_changed()
+            entry = self._entries.get(key)
+            return dict(entry) if entry is not None else None
+
+    def is_fresh(self, key: str, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """True if the entry's last fetch attempt is within its TTL (the retry delay after a failure)."""
+        ttl = self.ttl(key) if entry.get('status') == 'success' else ERROR_RETRY_SECONDS
+        return (now if now is not None else time.time()) - entry.get('checked_at', 0) < ttl
+
+    def put(self, key: str, result: Dict[str, Any], latency_s: float, manual: Any = None) -> None:
+        """
+        Record a fetch of an indicator.
+
+        A failed fetch does not replace a previously successful result (only the
+        attempt time, status and latency are updated).
+
+        Args:
+            key: Indicator key
+            result: Indicator result dictionary
+            latency_s: Fetch duration in seconds
+            manual: Manual input override the result was computed with
+        """
+        now = time.time()
+        status = result.get('status')
+        with self._lock:
+            self._reload_if_changed()
+            previous = self._entries.get(key)
+            keep_previous = (status != 'success' and previous is not None
+                             and previous['result'].get('status') == 'success'
+                             and previous.get('manual') == manual)
+            self._entries[key] = {
+                'result': previous['result'] if keep_previous else result,
+                'fetched_at': previous['fetched_at'] if keep_previous else now,
+                'checked_at': now,
+                'latency_s': round(latency_s, 3),
+                'status': status,
+                'manual': manual,
+            }
+            self._write()
+
+    def claim_refresh(self, keys: Iterable[str]) -> List[str]:
+        """Mark indicators as being refreshed; returns those not already in flight."""
+        with self._lock:
+            claimed = [key for key in keys if key not in self._refreshing]
+            self._refreshing.update(claimed)
+            return claimed
+
+    def release_refresh(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._refreshing.difference_update(keys)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-indicator age, TTL, last fetch latency and status."""
+        now = time.time()
+        with self._lock:
+            self._reload_if_changed()
+            return {
+                key: {
+                    'age_s': round(now - entry['fetched_at'], 1),
+                    'ttl_s': self.ttl(key),
+                    'latency_s': entry.get('latency_s'),
+                    'status': entry.get('status'),
+                    'fresh': self.is_fresh(key, entry, now),
+                    'refreshing': key in self._refreshing,
+                }
+                for key, entry in self._entries.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._write()
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            self._entries = entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load indicator cache {self.path}: {e}")
+            self._entries = {}
+        self._mtime = mtime
+
+    def _write(self) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f, indent=2, default=_json_default)
+            os.replace(tmp_path, self.path)
+            self._mtime = self.path.stat().st_mtime
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save indicator cache {self.path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars and datetimes found in indicator results."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+_caches: Dict[Path, IndicatorCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_indicator_cache(path: Path, default_ttl: float = DAY) -> IndicatorCache:
+    """Shared cache for a file, so in-flight refreshes are tracked across MacroAnalyzer instances."""
+    path = Path(path).resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = IndicatorCache(path, default_ttl)
+        return cache
@@ -8,16 +8,23 @@ import os
 import json
 import logging
 import requests
+import threading
+import time
 import pandas as pd
 import numpy as np
 import yaml
 import re
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Callable, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 from time import sleep
 from io import BytesIO
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from src.investment_optimization.indicator_cache import get_indicator_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +38,8 @@ class MacroAnalyzer:
     - CNN Fear & Greed Index
     - Buffett Indicator (Total Market Cap / GDP)
     
-    Implements 24-hour caching to minimize API calls.
+    Each indicator is cached separately with its own TTL and served stale while
+    it is refreshed in the background (see indicator_cache).
     """
     
     # Data source URLs
@@ -65,15 +73,22 @@ class MacroAnalyzer:
     # Timeout for API requests (seconds)
     REQUEST_TIMEOUT = 10
     
-    def __init__(self, cache_path: str = 'data/macro_cache.json', cache_ttl_hours: int = 24,
+    # Indicators are fetched concurrently: worker threads (also the HTTP connection pool size)
+    # and the time each indicator gets, including its fallbacks, before it is reported as timed out
+    MAX_FETCH_WORKERS = 8
+    INDICATOR_DEADLINE = 30
+    # Buffett indicators chain FRED, World Bank (with retries) and GuruFocus
+    BUFFETT_DEADLINE = 45
+    
+    def __init__(self, cache_path: str = 'data/macro_indicator_cache.json', cache_ttl_hours: int = 24,
                  config_path: str = 'config/settings.yaml',
                  manual_inputs_path: str = 'config/manual_indicators.json'):
         """
         Initialize MacroAnalyzer with caching configuration.
         
         Args:
-            cache_path: Path to cache file (default: 'data/macro_cache.json')
-            cache_ttl_hours: Cache time-to-live in hours (default: 24)
+            cache_path: Path to the per-indicator cache file (default: 'data/macro_indicator_cache.json')
+            cache_ttl_hours: TTL in hours for indicators without their own TTL (default: 24)
             config_path: Path to settings.yaml file (default: 'config/settings.yaml')
             manual_inputs_path: Path to manual indicator overrides (default: 'config/manual_indicators.json')
         """
@@ -81,15 +96,14 @@ class MacroAnalyzer:
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
         self.manual_inputs_path = Path(manual_inputs_path)
         
-        # Additional cache paths for gold and crypto analysis (same TTL)
-        self.gold_cache_path = Path('data/gold_cache.json')
-        self.crypto_cache_path = Path('data/crypto_cache.json')
+        # Per-indicator cache (stale-while-revalidate), shared with other instances using the same file
+        self.indicator_cache = get_indicator_cache(self.cache_path, default_ttl=self.cache_ttl.total_seconds())
         
         # Load FRED API key from config or environment
         self.fred_api_key = self._load_fred_api_key(config_path)
         
-        # Ensure cache directory exists
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # One pooled HTTP session shared by all indicator fetches
+        self.http = self._create_http_session()
         
         logger.info(f"MacroAnalyzer initialized with cache at {self.cache_path}, TTL={cache_ttl_hours}h")
     
@@ -137,6 +151,181 @@ class MacroAnalyzer:
         logger.warning("FRED API key not found in environment or config - Buffett Indicator will be unavailable")
         return None
     
+    def _create_http_session(self) -> requests.Session:
+        """HTTP session with a connection pool sized for concurrent indicator fetches."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.MAX_FETCH_WORKERS, pool_maxsize=self.MAX_FETCH_WORKERS)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _fetch_concurrently(self, tasks: Dict[str, Callable[[], Dict[str, Any]]],
+                            deadlines: Optional[Dict[str, float]] = None,
+                            on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run independent indicator fetches in a thread pool.
+        
+        Results are collected as they complete. An indicator still running at its
+        deadline is reported as a timed-out error and its thread is abandoned (it
+        stops at its own HTTP timeout); a fetch raising an exception becomes an error result.
+        
+        Args:
+            tasks: Indicator key -> zero-argument fetch function
+            deadlines: Indicator key -> seconds allowed (default: INDICATOR_DEADLINE)
+            on_result: Called with (key, result) as each indicator finishes
+            
+        Returns:
+            Dictionary mapping each indicator key to its result
+        """
+        deadlines = deadlines or {}
+        results: Dict[str, Dict[str, Any]] = {}
+        start = time.monotonic()
+        
+        executor = ThreadPoolExecutor(max_workers=min(self.MAX_FETCH_WORKERS, len(tasks)) or 1,
+                                      thread_name_prefix='macro-fetch')
+        futures = {executor.submit(fetch): key for key, fetch in tasks.items()}
+        due = {future: start + deadlines.get(key, self.INDICATOR_DEADLINE) for future, key in futures.items()}
+        pending = set(futures)
+        try:
+            while pending:
+                timeout = max(0.0, min(due[future] for future in pending) - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = futures[future]
+                    try:
+                        results[key] = future.result()
+                    except Exception as e:
+                        logger.error(f"Fetching {key} failed: {e}")
+                        results[key] = self._fetch_error_result(str(e))
+                    if on_result:
+                        on_result(key, results[key])
+                
+                now = time.monotonic()
+                for future in [future for future in pending if due[future] <= now]:
+                    key = futures[future]
+                    pending.discard(future)
+                    future.cancel()
+                    seconds = deadlines.get(key, self.INDICATOR_DEADLINE)
+                    logger.warning(f"Fetching {key} timed out after {seconds}s")
+                    results[key] = self._fetch_error_result(f"Timed out after {seconds}s")
+                    if on_result:
+                        on_result(key, results[key])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        logger.info(f"Fetched {len(tasks)} indicators concurrently in {time.monotonic() - start:.1f}s")
+        return {key: results[key] for key in tasks}
+    
+    @staticmethod
+    def _fetch_error_result(message: str) -> Dict[str, Any]:
+        """Error result carrying the fields used by thermometer, gold and crypto indicators."""
+        return {
+            'value': None,
+            'zone': 'Unknown',
+            'level': -1,
+            'zone_level': 0,
+            'interpretation': f"Data unavailable: {message}",
+            'status': 'error',
+            'error_message': message,
+            'source': None
+        }
+    
+    def _get_indicators(self, tasks: Dict[str, Callable[[], Dict[str, Any]]],
+                        deadlines: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Indicator results from the per-indicator cache, fetching only what is needed.
+        
+        - fresh entries are returned as is
+        - expired entries are returned immediately (marked stale) and refreshed in
+          a background thread
+        - indicators never fetched (or whose manual override was just enabled or
+          changed) are fetched concurrently before returning
+        
+        Args:
+            tasks: Indicator key -> zero-argument fetch function
+            deadlines: Indicator key -> seconds allowed for a blocking fetch
+            
+        Returns:
+            Dictionary mapping each indicator key to its result, with 'fetched_at'
+            (ISO timestamp) and 'stale' added
+        """
+        manual_inputs = self._load_manual_inputs()
+        now = time.time()
+        served: Dict[str, Dict[str, Any]] = {}
+        missing, stale = [], []
+        
+        for key in tasks:
+            manual = manual_inputs.get(key)
+            entry = self.indicator_cache.get(key)
+            if entry is None:
+                missing.append(key)
+                continue
+            if entry.get('manual') != manual:
+                # A newly enabled override resolves locally, so it is cheap to apply right away
+                if isinstance(manual, dict) and manual.get('enabled'):
+                    missing.append(key)
+                    continue
+                stale.append(key)
+            elif not self.indicator_cache.is_fresh(key, entry, now):
+                stale.append(key)
+            served[key] = self._served_result(entry, stale=key in stale)
+        
+        if missing:
+            logger.info(f"Fetching uncached indicators: {', '.join(missing)}")
+            fetched = self._fetch_concurrently(
+                {key: partial(self._timed_fetch, key, tasks[key], manual_inputs.get(key)) for key in missing},
+                deadlines
+            )
+            for key in missing:
+                entry = self.indicator_cache.get(key)
+                served[key] = (self._served_result(entry, stale=False) if entry is not None
+                               else dict(fetched[key], fetched_at=None, stale=False))
+        
+        if stale:
+            self._refresh_in_background({key: tasks[key] for key in stale}, deadlines, manual_inputs)
+        
+        return {key: served[key] for key in tasks}
+    
+    @staticmethod
+    def _served_result(entry: Dict[str, Any], stale: bool) -> Dict[str, Any]:
+        result = dict(entry['result'])
+        result['fetched_at'] = datetime.fromtimestamp(entry['fetched_at']).isoformat()
+        result['stale'] = stale
+        return result
+    
+    def _timed_fetch(self, key: str, fetch: Callable[[], Dict[str, Any]], manual: Any) -> Dict[str, Any]:
+        """Run one fetch and record its result and latency in the indicator cache."""
+        start = time.monotonic()
+        try:
+            result = fetch()
+        except Exception as e:
+            logger.error(f"Fetching {key} failed: {e}")
+            result = self._fetch_error_result(str(e))
+        latency = time.monotonic() - start
+        self.indicator_cache.put(key, result, latency, manual)
+        logger.debug(f"Fetched {key} in {latency:.2f}s ({result.get('status')})")
+        return result
+    
+    def _refresh_in_background(self, tasks: Dict[str, Callable[[], Dict[str, Any]]],
+                               deadlines: Optional[Dict[str, float]],
+                               manual_inputs: Dict[str, Any]) -> None:
+        """Refresh stale indicators in a daemon thread (skipping those already being refreshed)."""
+        keys = self.indicator_cache.claim_refresh(tasks)
+        if not keys:
+            return
+        logger.info(f"Refreshing stale indicators in background: {', '.join(keys)}")
+        
+        def refresh():
+            try:
+                self._fetch_concurrently(
+                    {key: partial(self._timed_fetch, key, tasks[key], manual_inputs.get(key)) for key in keys},
+                    deadlines
+                )
+            finally:
+                self.indicator_cache.release_refresh(keys)
+        
+        threading.Thread(target=refresh, name='macro-refresh', daemon=True).start()
+    
     def get_market_thermometer(self) -> Dict[str, Any]:
         """
         Main public method - orchestrates fetching all indicators.
@@ -158,39 +347,23 @@ class MacroAnalyzer:
         """
         logger.info("Starting market thermometer data fetch")
         
-        # Check if manual inputs have been updated (check file modification time)
-        manual_inputs_modified = False
-        if self.manual_inputs_path.exists():
-            manual_mtime = self.manual_inputs_path.stat().st_mtime
-            cache_path = Path(self.cache_path)
-            if cache_path.exists():
-                cache_mtime = cache_path.stat().st_mtime
-                if manual_mtime > cache_mtime:
-                    manual_inputs_modified = True
-                    logger.info("Manual inputs file is newer than cache - cache will be refreshed")
-        
-        # Check cache first (but skip if manual inputs were updated)
-        if not manual_inputs_modified:
-            cached_data = self._load_cache()
-            if cached_data:
-                logger.info("Using cached market thermometer data")
-                return cached_data
-        
-        # Fetch all indicators
-        results = {
-            'shiller_pe': self._fetch_shiller_pe(),
-            'fear_greed': self._fetch_fear_greed(),
-            'vix': self._fetch_vix(),
+        # Cached indicators, fetching only the ones never fetched
+        buffett = {
             # For Buffett indicators, use FRED primary and World Bank as fallback (more up-to-date)
-            'buffett_us': self._fetch_buffett_indicator('DDDM01USA156NWDB', 'United States', 'USA'),
-            'buffett_china': self._fetch_buffett_indicator('DDDM01CNA156NWDB', 'China', 'CHN'),
-            'buffett_japan': self._fetch_buffett_indicator('DDDM01JPA156NWDB', 'Japan', 'JPN'),
-            'buffett_europe': self._fetch_buffett_indicator('DDDM01GBA156NWDB', 'United Kingdom', 'GBR'),
-            'last_updated': datetime.now().isoformat()
+            'buffett_us': ('DDDM01USA156NWDB', 'United States', 'USA'),
+            'buffett_china': ('DDDM01CNA156NWDB', 'China', 'CHN'),
+            'buffett_japan': ('DDDM01JPA156NWDB', 'Japan', 'JPN'),
+            'buffett_europe': ('DDDM01GBA156NWDB', 'United Kingdom', 'GBR'),
         }
-        
-        # Save to cache
-        self._save_cache(results)
+        tasks = {
+            'shiller_pe': self._fetch_shiller_pe,
+            'fear_greed': self._fetch_fear_greed,
+            'vix': self._fetch_vix,
+        }
+        tasks.update({key: partial(self._fetch_buffett_indicator, *args) for key, args in buffett.items()})
+        results = self._get_indicators(tasks, deadlines={key: self.BUFFETT_DEADLINE for key in buffett})
+        results['last_updated'] = max((result['fetched_at'] for result in results.values() if result.get('fetched_at')),
+                                      default=datetime.now().isoformat())
         
         # Log summary
         total_indicators = 7
@@ -210,7 +383,7 @@ class MacroAnalyzer:
         - S&P 500/Gold ratio
         
         Then uses AltAssetsAdvisor to generate a scored recommendation.
-        Uses 24h cache to avoid repeated API calls.
+        Indicators come from the per-indicator cache.
         
         Returns:
             Dictionary with:
@@ -219,22 +392,21 @@ class MacroAnalyzer:
             - status: 'success' or 'error'
             - error_message: Optional error details
         """
-        # Check cache first
-        cached_gold = self._load_gold_cache()
-        if cached_gold:
-            logger.info("Using cached gold analysis data")
-            return cached_gold
-        
-        logger.info("Starting gold indicators analysis (cache miss or expired)")
+        logger.info("Starting gold indicators analysis")
         
         try:
             # Import advisor (lazy import to avoid circular dependencies)
             from src.investment_optimization.alt_assets_advisor import AltAssetsAdvisor
             
-            # Fetch all 3 indicators
-            gvz_result = self._fetch_gvz()
-            gold_silver_result = self._fetch_gold_silver_ratio()
-            sp500_gold_result = self._fetch_sp500_gold_ratio()
+            # All 3 indicators (cached, missing ones fetched concurrently)
+            fetched = self._get_indicators({
+                'gvz': self._fetch_gvz,
+                'gold_silver_ratio': self._fetch_gold_silver_ratio,
+                'sp500_gold_ratio': self._fetch_sp500_gold_ratio,
+            })
+            gvz_result = fetched['gvz']
+            gold_silver_result = fetched['gold_silver_ratio']
+            sp500_gold_result = fetched['sp500_gold_ratio']
             
             # Extract values (None if fetch failed)
             gvz = gvz_result.get('value') if gvz_result.get('status') == 'success' else None
@@ -266,9 +438,6 @@ class MacroAnalyzer:
             
             logger.info(f"Gold analysis complete - Recommendation: {recommendation.get('recommendation')}, Score: {recommendation.get('total_score')}")
             
-            # Save to cache for future requests
-            self._save_gold_cache(result)
-            
             return result
             
         except Exception as e:
@@ -304,26 +473,27 @@ class MacroAnalyzer:
             - status: 'success' or 'error'
             - error_message: Optional error details
         """
-        # Check cache first
-        cached_crypto = self._load_crypto_cache()
-        if cached_crypto:
-            logger.info("Using cached crypto analysis data")
-            return cached_crypto
-        
-        logger.info("Starting crypto indicators analysis (cache miss or expired)")
+        logger.info("Starting crypto indicators analysis")
         
         try:
             # Import advisor (lazy import to avoid circular dependencies)
             from src.investment_optimization.alt_assets_advisor import AltAssetsAdvisor
             
-            # Fetch all 6 indicators (Phase 2 adds 2 new ones)
-            btc_vol_result = self._fetch_btc_volatility()
-            eth_vol_result = self._fetch_eth_volatility()
-            btc_eth_ratio_result = self._fetch_btc_eth_ratio()
-            btc_dominance_result = self._fetch_btc_dominance()
+            # All 6 indicators (Phase 2 adds 2 new ones; cached, missing ones fetched concurrently)
+            fetched = self._get_indicators({
+                'btc_volatility': self._fetch_btc_volatility,
+                'eth_volatility': self._fetch_eth_volatility,
+                'btc_eth_ratio': self._fetch_btc_eth_ratio,
+                'btc_dominance': self._fetch_btc_dominance,
+                'crypto_fear_greed': self._fetch_crypto_fear_greed,  # **NEW Phase 2**
+            })
+            btc_vol_result = fetched['btc_volatility']
+            eth_vol_result = fetched['eth_volatility']
+            btc_eth_ratio_result = fetched['btc_eth_ratio']
+            btc_dominance_result = fetched['btc_dominance']
             # DISABLED FOR PERFORMANCE: btc_qqq_ratio_result = self._fetch_btc_qqq_ratio()
             btc_qqq_ratio_result = {'status': 'disabled', 'value': None, 'message': 'Disabled for performance'}
-            crypto_fng_result = self._fetch_crypto_fear_greed()  # **NEW Phase 2**
+            crypto_fng_result = fetched['crypto_fear_greed']
             
             # Extract values (None if fetch failed)
             btc_volatility = btc_vol_result.get('value') if btc_vol_result.get('status') == 'success' else None
@@ -382,9 +552,6 @@ class MacroAnalyzer:
             
             logger.info(f"Crypto analysis complete - Market: {market_sentiment['overall']}, BTC: {btc_recommendation.get('recommendation')}, ETH: {eth_recommendation.get('recommendation')}")
             
-            # Save to cache for future requests
-            self._save_crypto_cache(result)
-            
             return result
             
         except Exception as e:
@@ -428,7 +595,7 @@ class MacroAnalyzer:
         # Fallback to Yale data
         try:
             # Download Excel file
-            response = requests.get(self.SHILLER_URL, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.SHILLER_URL, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse Excel file
@@ -537,7 +704,7 @@ class MacroAnalyzer:
         try:
             # Try JSON API first (primary source)
             # Fetch JSON data
-            response = requests.get(self.FEAR_GREED_URL, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.FEAR_GREED_URL, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -623,7 +790,7 @@ class MacroAnalyzer:
                 'sort_order': 'desc',
                 'limit': 1
             }
-            response = requests.get(self.FRED_API_BASE, params=params, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.FRED_API_BASE, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -744,7 +911,7 @@ class MacroAnalyzer:
                 'sort_order': 'desc',
                 'limit': 1
             }
-            response = requests.get(self.FRED_API_BASE, params=params, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.FRED_API_BASE, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -820,7 +987,7 @@ class MacroAnalyzer:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
-            response = requests.get(self.GURUFOCUS_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.GURUFOCUS_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse HTML
@@ -913,7 +1080,7 @@ class MacroAnalyzer:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
-            response = requests.get(self.GURUFOCUS_SHILLER_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.GURUFOCUS_SHILLER_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse HTML
@@ -995,7 +1162,7 @@ class MacroAnalyzer:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
-            response = requests.get(self.FEAR_GREED_WEBPAGE_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.FEAR_GREED_WEBPAGE_URL, headers=headers, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse HTML - the index value is typically in a prominent display element
@@ -1083,7 +1250,7 @@ class MacroAnalyzer:
                 'Accept-Language': 'en-US,en;q=0.5',
             }
             
-            response = requests.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -1145,7 +1312,7 @@ class MacroAnalyzer:
             
             # Use GoldPrice.org JSON API - provides XAU (gold) and XAG (silver) spot prices
             api_url = 'https://data-asg.goldprice.org/dbXRates/USD'
-            response = requests.get(api_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(api_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -1347,7 +1514,7 @@ class MacroAnalyzer:
             
             # FALLBACK: Try Cboe JSON API (often blocked with 403)
             try:
-                response = requests.get(self.CBOE_GVZ_URL, timeout=self.REQUEST_TIMEOUT)
+                response = self.http.get(self.CBOE_GVZ_URL, timeout=self.REQUEST_TIMEOUT)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -1402,7 +1569,7 @@ class MacroAnalyzer:
         try:
             import numpy as np
             
-            response = requests.get(self.COINGECKO_BTC_HISTORY_URL, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.COINGECKO_BTC_HISTORY_URL, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -1465,7 +1632,7 @@ class MacroAnalyzer:
         try:
             import numpy as np
             
-            response = requests.get(self.COINGECKO_ETH_HISTORY_URL, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.COINGECKO_ETH_HISTORY_URL, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -1532,7 +1699,7 @@ class MacroAnalyzer:
             # makes it easier to do separate calls for clarity
             
             # Fetch BTC price
-            btc_response = requests.get(self.COINGECKO_BTC_URL, timeout=self.REQUEST_TIMEOUT)
+            btc_response = self.http.get(self.COINGECKO_BTC_URL, timeout=self.REQUEST_TIMEOUT)
             btc_response.raise_for_status()
             btc_data = btc_response.json()
             btc_price = btc_data['bitcoin']['usd']
@@ -1541,7 +1708,7 @@ class MacroAnalyzer:
             sleep(0.2)
             
             # Fetch ETH price
-            eth_response = requests.get(self.COINGECKO_ETH_URL, timeout=self.REQUEST_TIMEOUT)
+            eth_response = self.http.get(self.COINGECKO_ETH_URL, timeout=self.REQUEST_TIMEOUT)
             eth_response.raise_for_status()
             eth_data = eth_response.json()
             eth_price = eth_data['ethereum']['usd']
@@ -1593,7 +1760,7 @@ class MacroAnalyzer:
         logger.info("Fetching BTC dominance from CoinGecko API...")
         
         try:
-            response = requests.get(self.COINGECKO_GLOBAL_URL, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(self.COINGECKO_GLOBAL_URL, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -1767,7 +1934,7 @@ class MacroAnalyzer:
         try:
             # Alternative.me Free API - no auth required
             url = "https://api.alternative.me/fng/?limit=1"
-            response = requests.get(url, timeout=self.REQUEST_TIMEOUT)
+            response = self.http.get(url, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -2751,7 +2918,7 @@ class MacroAnalyzer:
             for attempt in range(5):
                 try:
                     timeout = self.REQUEST_TIMEOUT + attempt * 5
-                    response = requests.get(url, timeout=timeout)
+                    response = self.http.get(url, timeout=timeout)
                     response.raise_for_status()
                     payload = response.json()
                     break
@@ -2881,104 +3048,6 @@ class MacroAnalyzer:
             return ("Modestly Overvalued", 3)
         else:
             return ("Significantly Overvalued", 4)
-    
-    def _load_cache(self) -> Optional[Dict[str, Any]]:
-        """
-        Load cached data if file exists and is within TTL.
-        
-        Returns:
-            Cached data dictionary or None if cache invalid/expired
-        """
-        if not self.cache_path.exists():
-            logger.debug("Cache file does not exist")
-            return None
-        
-        try:
-            with open(self.cache_path, 'r') as f:
-                cached = json.load(f)
-            
-            # Check timestamp
-            last_updated = datetime.fromisoformat(cached['last_updated'])
-            if datetime.now() - last_updated > self.cache_ttl:
-                logger.info("Cache expired, will fetch fresh data")
-                return None
-            
-            logger.debug(f"Cache valid (age: {datetime.now() - last_updated})")
-            return cached
-            
-        except Exception as e:
-            logger.warning(f"Failed to load cache: {str(e)}")
-            return None
-    
-    def _save_cache(self, data: Dict[str, Any]) -> None:
-        """
-        Save fetched data to cache file.
-        
-        Args:
-            data: Market thermometer data dictionary
-        """
-        try:
-            with open(self.cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Cache saved to {self.cache_path}")
-        except Exception as e:
-            logger.warning(f"Failed to save cache: {str(e)}")
-    
-    def _load_gold_cache(self) -> Optional[Dict[str, Any]]:
-        """Load cached gold analysis data if file exists and is within TTL."""
-        if not self.gold_cache_path.exists():
-            return None
-        
-        try:
-            with open(self.gold_cache_path, 'r') as f:
-                cached = json.load(f)
-            
-            last_updated = datetime.fromisoformat(cached.get('last_updated', ''))
-            if datetime.now() - last_updated > self.cache_ttl:
-                logger.debug("Gold cache expired")
-                return None
-            
-            return cached
-        except Exception as e:
-            logger.warning(f"Failed to load gold cache: {str(e)}")
-            return None
-    
-    def _save_gold_cache(self, data: Dict[str, Any]) -> None:
-        """Save gold analysis data to cache file."""
-        try:
-            with open(self.gold_cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Gold cache saved to {self.gold_cache_path}")
-        except Exception as e:
-            logger.warning(f"Failed to save gold cache: {str(e)}")
-    
-    def _load_crypto_cache(self) -> Optional[Dict[str, Any]]:
-        """Load cached crypto analysis data if file exists and is within TTL."""
-        if not self.crypto_cache_path.exists():
-            return None
-        
-        try:
-            with open(self.crypto_cache_path, 'r') as f:
-                cached = json.load(f)
-            
-            last_updated = datetime.fromisoformat(cached.get('last_updated', ''))
-            if datetime.now() - last_updated > self.cache_ttl:
-                logger.debug("Crypto cache expired")
-                return None
-            
-            return cached
-        except Exception as e:
-            logger.warning(f"Failed to load crypto cache: {str(e)}")
-            return None
-    
-    def _save_crypto_cache(self, data: Dict[str, Any]) -> None:
-        """Save crypto analysis data to cache file."""
-        try:
-            with open(self.crypto_cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Crypto cache saved to {self.crypto_cache_path}")
-        except Exception as e:
-            logger.warning(f"Failed to save crypto cache: {str(e)}")
 
 
 # Convenience function for direct usage
@@ -15,6 +15,7 @@ from .core.asset_mapper import (
 # Phase 6: System Unification - Holdings Calculator & Price Service
 from .holdings_calculator import HoldingsCalculator
 from .price_service import PriceService
+from .price_cache import PriceCache, get_price_cache
 
 # You can add other key imports from other modules here as needed
 # Example:
@@ -30,6 +31,8 @@ __all__ = [
     'create_asset_class_mapper',
     'HoldingsCalculator',
     'PriceService',
+    'PriceCache',
+    'get_price_cache',
 ]
 
 print("portfolio_lib package initialized.")
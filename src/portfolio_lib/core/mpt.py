@@ -5,13 +5,19 @@ Handles calculations for efficient frontier, optimal portfolios based on
 various objectives (Sharpe ratio, min volatility), and risk profile portfolios.
 Filters out assets with near-zero standard deviation before calculations.
 Includes debugging prints for min_volatility optimization.
+Objectives supply analytic gradients to SLSQP; SLSQP frontier solves are
+warm-started point to point.
+Long-only problems without custom constraints use the active-set QP solver in
+qp_solver.py and fall back to SLSQP otherwise.
 """
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize
+from scipy.optimize import minimize, OptimizeResult
 from typing import Dict, Any, Tuple, Optional, List
 
+from .qp_solver import min_variance_weights, max_sharpe_weights
+
 class AssetAllocationModel:
     """
     Modern Portfolio Theory (MPT) core model class.
@@ -72,6 +78,10 @@ class AssetAllocationModel:
         self.mean_returns_annualized: pd.Series = self.mean_returns * self.annualization_factor
         self.cov_matrix_annualized: pd.DataFrame = self.cov_matrix * self.annualization_factor
 
+        # Plain arrays for the optimizer objectives and their gradients
+        self._mean_returns_arr: np.ndarray = self.mean_returns_annualized.to_numpy(dtype=float)
+        self._cov_arr: np.ndarray = self.cov_matrix_annualized.to_numpy(dtype=float)
+
         # Cache for calculated results
         self.efficient_frontier: Optional[pd.DataFrame] = None
         self.risk_profiles: Optional[Dict[str, Dict[str, Any]]] = None
@@ -104,9 +114,9 @@ class AssetAllocationModel:
         if len(weights) != self.num_assets:
              raise ValueError(f"Length of weights ({len(weights)}) must match number of included assets ({self.num_assets})")
 
-        annualized_return = np.sum(self.mean_returns_annualized * weights)
+        annualized_return = float(self._mean_returns_arr @ weights)
         # Use the annualized covariance matrix
-        variance = np.dot(weights.T, np.dot(self.cov_matrix_annualized, weights))
+        variance = float(weights @ (self._cov_arr @ weights))
         annualized_volatility = np.sqrt(max(0, variance)) # Ensure non-negative
 
         denominator = annualized_volatility
@@ -136,7 +146,25 @@ class AssetAllocationModel:
     def _portfolio_return(self, weights: np.ndarray) -> float:
          """Calculates portfolio return (used for constraints)."""
          # Uses annualized mean returns for consistency with target return definition
-         return np.sum(self.mean_returns_annualized * weights)
+         return float(self._mean_returns_arr @ weights)
+
+    def _portfolio_volatility_grad(self, weights: np.ndarray) -> np.ndarray:
+        """Analytic gradient of portfolio volatility: (Cov @ w) / vol."""
+        cov_w = self._cov_arr @ weights
+        volatility = np.sqrt(max(0.0, float(weights @ cov_w)))
+        if volatility < 1e-9:
+            return np.zeros_like(cov_w)
+        return cov_w / volatility
+
+    def _neg_sharpe_grad(self, weights: np.ndarray) -> np.ndarray:
+        """Analytic gradient of the negative Sharpe ratio."""
+        cov_w = self._cov_arr @ weights
+        volatility = np.sqrt(max(0.0, float(weights @ cov_w)))
+        if volatility < 1e-9:
+            # _neg_sharpe is flat (0 or 1e9) in this region
+            return np.zeros_like(cov_w)
+        excess_return = float(self._mean_returns_arr @ weights) - self.risk_free_rate
+        return -(self._mean_returns_arr / volatility - excess_return * cov_w / volatility ** 3)
 
     # --- Core Optimization ---
     def optimize_portfolio(
@@ -144,7 +172,10 @@ class AssetAllocationModel:
         objective: str = 'sharpe',
         target_return: Optional[float] = None,
         constraints: Tuple = (),
-        bounds: Optional[Tuple[Tuple[float, float], ...]] = None
+        bounds: Optional[Tuple[Tuple[float, float], ...]] = None,
+        init_guess: Optional[np.ndarray] = None,
+        verbose: bool = True,
+        solver: str = 'auto'
     ) -> Dict[str, Any]:
         """
         Optimizes portfolio weights for the included assets based on the specified objective.
@@ -154,11 +185,15 @@ class AssetAllocationModel:
             target_return: Required for 'min_volatility' when a specific return is targeted (annualized).
             constraints: Additional constraints for the optimizer (SLSQP format).
             bounds: Bounds for asset weights (default is 0 to 1 for all).
+            init_guess: Starting weights for the optimizer (default is equal weights).
+            verbose: Print min_volatility debug diagnostics.
+            solver: 'auto' uses the active-set QP for long-only problems without custom
+                    constraints and SLSQP otherwise; 'slsqp' always uses SLSQP.
 
         Returns:
             Dictionary containing optimal weights and portfolio performance metrics.
         """
-        cache_key = f"{objective}_{target_return}_{constraints}_{bounds}"
+        cache_key = f"{objective}_{target_return}_{constraints}_{bounds}_{solver}"
         if cache_key in self._optimization_cache:
             # print(f"Using cached result for {cache_key}") # Optional debug
             return self._optimization_cache[cache_key]
@@ -175,20 +210,33 @@ class AssetAllocationModel:
 
         args = ()
         if bounds is None: bounds = tuple((0.0, 1.0) for _ in range(num_assets))
-        base_constraints = ({'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0})
+        base_constraints = ({'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0, 'jac': lambda w: np.ones_like(w)})
         all_constraints = list(constraints) + [base_constraints]
-        init_guess = np.array([1.0 / num_assets] * num_assets)
+        if init_guess is None:
+            init_guess = np.array([1.0 / num_assets] * num_assets)
+        else:
+            init_guess = np.array(init_guess, dtype=float)
 
         # Select objective function and add target return constraint if needed
         if objective == 'min_volatility':
             opt_func = self._portfolio_volatility
+            opt_jac = self._portfolio_volatility_grad
+            if target_return is not None:
+                return_constraint = ({'type': 'eq', 'fun': lambda w: self._portfolio_return(w) - target_return,
+                                      'jac': lambda w: self._mean_returns_arr})
+                all_constraints.append(return_constraint)
+        elif objective == 'sharpe':
+            opt_func = self._neg_sharpe
+            opt_jac = self._neg_sharpe_grad
+        else:
+            raise ValueError("Objective must be 'sharpe' or 'min_volatility'")
+
+        if objective == 'min_volatility' and verbose:
             # --- Add Debug Prints Here ---
             print(f"\n--- Debug: Optimizing for Min Volatility ---")
             print(f"Target Return Constraint: {'Yes' if target_return is not None else 'No'}")
             if target_return is not None:
                 print(f"  Target Return Value: {target_return:.4%}")
-                return_constraint = ({'type': 'eq', 'fun': lambda w: self._portfolio_return(w) - target_return})
-                all_constraints.append(return_constraint)
             print(f"  Included Assets ({num_assets}): {self.assets}")
             print(f"  Initial Guess: {[f'{x:.2f}' for x in init_guess]}")
             # print(f"Bounds: {bounds}") # Can be verbose
@@ -199,18 +247,26 @@ class AssetAllocationModel:
             print(f"  Initial Guess Performance: Ret={init_ret:.2%}, Vol={init_vol:.2%}, Sharpe={init_sharpe:.2f}")
             print(f"--- End Debug: Optimizing for Min Volatility ---")
             # --- End Debug Prints ---
-        elif objective == 'sharpe':
-            opt_func = self._neg_sharpe
-        else:
-            raise ValueError("Objective must be 'sharpe' or 'min_volatility'")
+
+        # Long-only problems without custom constraints have a dedicated QP path
+        qp_weights = None
+        long_only = all(low == 0.0 and (high is None or high >= 1.0) for low, high in bounds)
+        if solver == 'auto' and not constraints and long_only:
+            if objective == 'min_volatility':
+                qp_weights = min_variance_weights(self._cov_arr, self._mean_returns_arr, target_return)
+            else:
+                qp_weights = max_sharpe_weights(self._cov_arr, self._mean_returns_arr, self.risk_free_rate)
 
         # Perform optimization
         try:
-            result = minimize(
-                opt_func, init_guess, method='SLSQP', args=args,
-                bounds=bounds, constraints=tuple(all_constraints),
-                options={'ftol': 1e-9, 'disp': False} # Set disp=True for detailed optimizer output
-            )
+            if qp_weights is not None:
+                result = OptimizeResult(x=qp_weights, success=True, message='Solved by active-set QP.')
+            else:
+                result = minimize(
+                    opt_func, init_guess, method='SLSQP', args=args, jac=opt_jac,
+                    bounds=bounds, constraints=tuple(all_constraints),
+                    options={'ftol': 1e-9, 'disp': False} # Set disp=True for detailed optimizer output
+                )
         except ValueError as ve:
              # Catch potential issues like inconsistent bounds/constraints
              print(f"Error during optimization call for objective '{objective}': {ve}")
@@ -256,8 +312,22 @@ class AssetAllocationModel:
         return optimal_portfolio
 
     # --- Efficient Frontier Calculation ---
-    def calculate_efficient_frontier(self, points: int = 50) -> Optional[pd.DataFrame]:
-        """Calculates points along the efficient frontier for included assets."""
+    def calculate_efficient_frontier(
+        self,
+        points: int = 50,
+        warm_start: bool = True,
+        solver: str = 'auto'
+    ) -> Optional[pd.DataFrame]:
+        """
+        Calculates points along the efficient frontier for included assets.
+
+        Args:
+            points: Number of target returns between the min-volatility and max-Sharpe returns.
+            warm_start: Start each SLSQP solve from the previous point's weights. Only used
+                        when SLSQP runs (solver='slsqp', or the QP path failing); the
+                        active-set QP needs no starting point.
+            solver: Passed to optimize_portfolio for every frontier point.
+        """
         print(f"Calculating Efficient Frontier ({points} points) for {self.num_assets} included assets...")
         if self.num_assets <= 1:
              print("Cannot calculate frontier with one or zero assets.")
@@ -268,8 +338,8 @@ class AssetAllocationModel:
              return None
         try:
             # Use optimize_portfolio which includes error handling/warnings
-            min_vol_portfolio = self.optimize_portfolio(objective='min_volatility')
-            max_sharpe_portfolio = self.optimize_portfolio(objective='sharpe')
+            min_vol_portfolio = self.optimize_portfolio(objective='min_volatility', solver=solver)
+            max_sharpe_portfolio = self.optimize_portfolio(objective='sharpe', solver=solver)
 
             # Proceed only if base optimizations were somewhat successful
             if not min_vol_portfolio or not max_sharpe_portfolio:
@@ -307,9 +377,15 @@ class AssetAllocationModel:
             frontier_volatility = []
             frontier_returns = [] # Store actual returns achieved
 
+            guess = np.array(list(min_vol_portfolio['weights'].values()), dtype=float) if warm_start else None
             for target in target_returns:
                 # Find the portfolio with minimum volatility for this target return
-                portfolio = self.optimize_portfolio(objective='min_volatility', target_return=target)
+                portfolio = self.optimize_portfolio(
+                    objective='min_volatility', target_return=target, init_guess=guess,
+                    verbose=False, solver=solver
+                )
+                if warm_start and portfolio.get('weights'):
+                    guess = np.array(list(portfolio['weights'].values()), dtype=float)
                 # Include the point even if optimization didn't fully succeed, but check for NaNs
                 if portfolio and pd.notna(portfolio['volatility']) and pd.notna(portfolio['returns']):
                     frontier_volatility.append(portfolio['volatility'])
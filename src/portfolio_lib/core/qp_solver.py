@@ -0,0 +1,176 @@
+# portfolio_lib/core/qp_solver.py
+"""
+Dense active-set quadratic programming for long-only MPT problems.
+
+Solves  min 1/2 x'Qx  subject to  Ax = b,  x >= 0  with a primal active-set
+method written in NumPy. Ties are always broken by the lowest asset index, so
+the same inputs produce bit-identical weights on every run.
+
+Used by AssetAllocationModel for long-only min-variance, target-return and
+max-Sharpe portfolios. Problems with custom constraints or bounds go through
+SLSQP instead.
+"""
+
+import numpy as np
+from typing import Optional
+
+# Relative ridge added to the covariance diagonal so short return histories
+# (more assets than observations) still give a strictly convex problem
+RIDGE_FACTOR = 1e-10
+STEP_TOLERANCE = 1e-12
+MULTIPLIER_TOLERANCE = 1e-12
+
+
+def _regularize(cov: np.ndarray) -> np.ndarray:
+    """Returns a copy of cov with a tiny ridge on the diagonal."""
+    n = cov.shape[0]
+    scale = max(float(np.trace(cov)) / n, 1e-12)
+    return cov + np.eye(n) * scale * RIDGE_FACTOR
+
+
+def _solve_kkt(q_free: np.ndarray, a_free: np.ndarray, b: np.ndarray):
+    """Solves the equality-constrained subproblem on the free variables."""
+    k = q_free.shape[0]
+    m = a_free.shape[0]
+    kkt = np.zeros((k + m, k + m))
+    kkt[:k, :k] = q_free
+    kkt[:k, k:] = -a_free.T
+    kkt[k:, :k] = a_free
+    rhs = np.concatenate([np.zeros(k), b])
+    try:
+        solution = np.linalg.solve(kkt, rhs)
+    except np.linalg.LinAlgError:
+        # Dependent equality rows on a small free set; the system is consistent
+        solution = np.linalg.lstsq(kkt, rhs, rcond=None)[0]
+    return solution[:k], solution[k:]
+
+
+def solve_nonnegative_qp(
+    q: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    x0: np.ndarray,
+    max_iter: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """
+    Primal active-set solver for  min 1/2 x'Qx  s.t.  Ax = b, x >= 0.
+
+    Args:
+        q: Positive definite (n, n) matrix.
+        a: Equality constraint matrix (m, n).
+        b: Equality constraint values (m,).
+        x0: Feasible starting point (Ax0 = b, x0 >= 0).
+        max_iter: Iteration cap (default 10n + 50).
+
+    Returns:
+        Optimal x, or None if the iteration cap was reached.
+    """
+    n = q.shape[0]
+    x = np.array(x0, dtype=float)
+    fixed = x <= 0.0  # Working set: variables held at zero
+    x[fixed] = 0.0
+    if max_iter is None:
+        max_iter = 10 * n + 50
+
+    for _ in range(max_iter):
+        free = np.flatnonzero(~fixed)
+        x_free, multipliers = _solve_kkt(q[np.ix_(free, free)], a[:, free], b)
+        step = x_free - x[free]
+
+        if np.abs(step).max(initial=0.0) <= STEP_TOLERANCE:
+            # Stationary on the working set: release the most negative bound multiplier
+            held = np.flatnonzero(fixed)
+            if held.size == 0:
+                return x
+            bound_multipliers = (q @ x - a.T @ multipliers)[held]
+            gradient_scale = max(1.0, float(np.abs(q @ x).max()))
+            worst = int(np.argmin(bound_multipliers))
+            if bound_multipliers[worst] >= -MULTIPLIER_TOLERANCE * gradient_scale:
+                return x
+            fixed[held[worst]] = False
+            continue
+
+        # Move toward the subproblem solution, stopping at the first bound hit
+        alpha = 1.0
+        blocking = None
+        decreasing = np.flatnonzero(step < 0)
+        if decreasing.size:
+            ratios = -x[free[decreasing]] / step[decreasing]
+            first = int(np.argmin(ratios))
+            if ratios[first] < 1.0:
+                alpha = float(ratios[first])
+                blocking = free[decreasing[first]]
+
+        x[free] += alpha * step
+        if blocking is not None:
+            x[blocking] = 0.0
+            fixed[blocking] = True
+
+    return None
+
+
+def min_variance_weights(
+    cov: np.ndarray,
+    mean_returns: Optional[np.ndarray] = None,
+    target_return: Optional[float] = None
+) -> Optional[np.ndarray]:
+    """
+    Long-only, fully invested minimum-variance weights, optionally at a target return.
+
+    Returns:
+        Weight array, or None if the target return is outside the achievable range
+        or the solver did not converge.
+    """
+    n = cov.shape[0]
+    q = _regularize(cov)
+
+    if target_return is None:
+        a = np.ones((1, n))
+        b = np.array([1.0])
+        x0 = np.full(n, 1.0 / n)
+    else:
+        a = np.vstack([np.ones(n), mean_returns])
+        b = np.array([1.0, target_return])
+        # Feasible start: mix of the lowest- and highest-return assets
+        low, high = int(np.argmin(mean_returns)), int(np.argmax(mean_returns))
+        spread = mean_returns[high] - mean_returns[low]
+        tolerance = 1e-12 * max(1.0, abs(target_return))
+        if target_return < mean_returns[low] - tolerance or target_return > mean_returns[high] + tolerance:
+            return None
+        x0 = np.zeros(n)
+        if spread <= tolerance:
+            x0[:] = 1.0 / n
+        else:
+            mix = min(max((target_return - mean_returns[low]) / spread, 0.0), 1.0)
+            x0[low] = 1.0 - mix
+            x0[high] += mix
+
+    return solve_nonnegative_qp(q, a, b, x0)
+
+
+def max_sharpe_weights(
+    cov: np.ndarray,
+    mean_returns: np.ndarray,
+    risk_free_rate: float
+) -> Optional[np.ndarray]:
+    """
+    Long-only maximum Sharpe ratio weights.
+
+    Uses the standard homogenisation: minimise y'Cov y subject to
+    (mu - rf)'y = 1, y >= 0, then rescale y to sum to one.
+
+    Returns:
+        Weight array, or None if no asset beats the risk-free rate or the solver
+        did not converge.
+    """
+    excess = mean_returns - risk_free_rate
+    best = int(np.argmax(excess))
+    if excess[best] <= 0:
+        return None
+
+    y0 = np.zeros(cov.shape[0])
+    y0[best] = 1.0 / excess[best]
+    y = solve_nonnegative_qp(_regularize(cov), excess[np.newaxis, :], np.array([1.0]), y0)
+    if y is None or y.sum() <= 0:
+        return None
+    return y / y.sum()
@@ -14,6 +14,7 @@ Key features:
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from datetime import date
 from decimal import Decimal
@@ -24,6 +25,19 @@ from src.database.base import get_session
 from src.database.models import Transaction, Asset
 from .price_service import PriceService
 
+# Transaction types that add or remove FIFO lots
+ACQUISITION_TYPES = ('Buy', 'RSU_Vest', 'Dividend_Reinvest', 'Adjustment_Buy')
+DISPOSAL_TYPES = ('Sell', 'Transfer_Out', 'Adjustment_Sell')
+# Types processed before same-day disposals (vests land before same-day sells)
+SAME_DAY_FIRST_TYPES = ACQUISITION_TYPES + ('Transfer_In',)
+
+
+def _to_decimal(value, default) -> Decimal:
+    """Convert a numeric cell to Decimal, using default for NULL/NaN/zero."""
+    if value is None or pd.isna(value):
+        value = default
+    return Decimal(str(value or default))
+
 
 class HoldingsCalculator:
     """
@@ -77,16 +91,19 @@ class HoldingsCalculator:
             self.logger.warning("No transactions found")
             return pd.DataFrame()
         
+        # Partition once: positional row indices per asset, in first-appearance order
+        asset_rows = transactions_df.groupby('Asset_ID', sort=False).indices
+        
         # Batch fetch prices to optimize performance and avoid API rate limits
-        unique_assets = transactions_df['Asset_ID'].unique().tolist()
+        unique_assets = list(asset_rows)
         self.logger.info(f"Fetching prices for {len(unique_assets)} assets...")
         self.price_service.get_batch_latest_prices(unique_assets, as_of_date)
         
         # 2. Calculate holdings per asset with FIFO cost basis
         holdings_data = []
         
-        for asset_id in unique_assets:
-            asset_txns = transactions_df[transactions_df['Asset_ID'] == asset_id].copy()
+        for asset_id, rows in asset_rows.items():
+            asset_txns = transactions_df.iloc[rows]
             
             holding = self._calculate_asset_holding(asset_id, asset_txns, as_of_date)
             
@@ -97,6 +114,44 @@ class HoldingsCalculator:
         current_holdings_map = {h['Asset_ID']: h for h in holdings_data}
 
         # 3. Balance Sheet Sync (Manual Assets)
+        self._sync_balance_sheet_holdings(current_holdings_map)
+
+        return self._build_holdings_frame(current_holdings_map)
+
+    def _build_holdings_frame(self, current_holdings_map: Dict[str, Dict]) -> pd.DataFrame:
+        """
+        Create the holdings DataFrame and portfolio weights from combined holdings.
+
+        Args:
+            current_holdings_map: Asset_ID -> holding record (transactions + balance sheet)
+
+        Returns:
+            Holdings DataFrame with a Weight column, or an empty DataFrame
+        """
+        # Create holdings DataFrame from the combined data
+        if not current_holdings_map:
+            self.logger.warning("No active holdings found after transaction and balance sheet sync.")
+            return pd.DataFrame()
+        
+        holdings_df = pd.DataFrame(list(current_holdings_map.values()))
+        
+        # Calculate total portfolio value
+        total_value = holdings_df['Market_Value'].sum()
+        holdings_df['Weight'] = holdings_df['Market_Value'] / total_value
+        
+        self.logger.info(f"Calculated {len(holdings_df)} holdings with total value: ¥{total_value:,.2f}")
+        
+        return holdings_df
+    
+    def _sync_balance_sheet_holdings(self, current_holdings_map: Dict[str, Dict]) -> None:
+        """
+        Add manually tracked assets (deposits, property, pension) from the latest
+        balance sheet snapshot into current_holdings_map, replacing any
+        transaction-based entry for the same asset.
+
+        Args:
+            current_holdings_map: Asset_ID -> holding record, updated in place
+        """
         # Map Asset_ID to Balance Sheet Line Item
         bs_mapping = {
             'BankWealth_招行': ('Asset_Invest_BankWealth_Value', 'CNY'),
@@ -188,21 +243,6 @@ class HoldingsCalculator:
         except Exception as e:
             self.logger.error(f"Error syncing with Balance Sheet/Holdings: {e}")
 
-        # 6. Create holdings DataFrame from the combined data
-        if not current_holdings_map:
-            self.logger.warning("No active holdings found after transaction and balance sheet sync.")
-            return pd.DataFrame()
-        
-        holdings_df = pd.DataFrame(list(current_holdings_map.values()))
-        
-        # 7. Calculate total portfolio value
-        total_value = holdings_df['Market_Value'].sum()
-        holdings_df['Weight'] = holdings_df['Market_Value'] / total_value
-        
-        self.logger.info(f"Calculated {len(holdings_df)} holdings with total value: ¥{total_value:,.2f}")
-        
-        return holdings_df
-    
     def _get_transactions_up_to_date(self, as_of_date: date) -> pd.DataFrame:
         """
         Fetch all transactions from database up to a specific date.
@@ -282,11 +322,28 @@ class HoldingsCalculator:
         if transactions.empty:
             return None
         
-        # Get asset metadata from first transaction
-        asset_name = transactions.iloc[0]['Asset_Name']
-        asset_type = transactions.iloc[0].get('Asset_Type', 'Unknown')
-        asset_class = transactions.iloc[0].get('Asset_Class', 'Unknown')
-        currency = transactions.iloc[0].get('Currency', 'CNY')
+        metadata = self._resolve_asset_metadata(asset_id, transactions.iloc[0])
+        
+        # Calculate FIFO cost basis
+        quantity, cost_basis = self._calculate_fifo_cost_basis(transactions)
+        
+        return self._build_holding_record(asset_id, metadata, quantity, cost_basis, as_of_date)
+    
+    def _resolve_asset_metadata(self, asset_id: str, first_txn: pd.Series) -> Tuple[str, str, str, str]:
+        """
+        Get asset metadata from the asset's first transaction.
+        
+        Args:
+            asset_id: Asset identifier
+            first_txn: Earliest transaction row for this asset
+            
+        Returns:
+            Tuple of (asset_name, asset_type, asset_class, currency)
+        """
+        asset_name = first_txn['Asset_Name']
+        asset_type = first_txn.get('Asset_Type', 'Unknown')
+        asset_class = first_txn.get('Asset_Class', 'Unknown')
+        currency = first_txn.get('Currency', 'CNY')
         
         # Enrich Asset_Type using taxonomy if database value is None/Unknown
         if not asset_type or asset_type == 'Unknown' or pd.isna(asset_type):
@@ -300,8 +357,30 @@ class HoldingsCalculator:
             except Exception as e:
                 self.logger.warning(f"Could not enrich Asset_Type for {asset_id}: {e}")
         
-        # Calculate FIFO cost basis
-        quantity, cost_basis = self._calculate_fifo_cost_basis(transactions)
+        return asset_name, asset_type, asset_class, currency
+    
+    def _build_holding_record(
+        self,
+        asset_id: str,
+        metadata: Tuple[str, str, str, str],
+        quantity: Decimal,
+        cost_basis: Decimal,
+        as_of_date: date
+    ) -> Optional[Dict]:
+        """
+        Value a FIFO position at as_of_date and build its holding record.
+        
+        Args:
+            asset_id: Asset identifier
+            metadata: Tuple from _resolve_asset_metadata
+            quantity: Net quantity held
+            cost_basis: Remaining FIFO cost basis in CNY
+            as_of_date: Date to price the holding at
+            
+        Returns:
+            Dictionary with holding details, or None if no holding
+        """
+        asset_name, asset_type, asset_class, currency = metadata
         
         if quantity <= 0:
             return None
@@ -349,6 +428,126 @@ class HoldingsCalculator:
             'Exchange_Rate': float(exchange_rate)
         }
     
+    @staticmethod
+    def _sort_for_fifo(transactions: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sort transactions by date, then buys before sells on the same day.
+        
+        The sort is stable, so same-day transactions of the same priority keep
+        their query order.
+        """
+        sort_priority = np.where(transactions['Transaction_Type'].isin(SAME_DAY_FIRST_TYPES), 0, 1)
+        order = np.lexsort((sort_priority, transactions['date'].values))
+        return transactions.iloc[order]
+    
+    def _apply_fifo_transaction(
+        self,
+        fifo_queue: deque,
+        asset_id: str,
+        txn_date,
+        txn_type: str,
+        quantity,
+        amount,
+        exchange_rate
+    ) -> None:
+        """
+        Apply one transaction to an asset's FIFO queue of (quantity, unit_cost) lots.
+        
+        Args:
+            fifo_queue: Lots for this asset, oldest first (updated in place)
+            asset_id: Asset identifier (for warnings)
+            txn_date: Transaction date (for warnings)
+            txn_type: Transaction_Type value
+            quantity, amount, exchange_rate: Raw Quantity, Amount_Net and Exchange_Rate values
+        """
+        if txn_type in ACQUISITION_TYPES:
+            quantity = _to_decimal(quantity, 0)
+            # Add to FIFO queue
+            if quantity > 0:
+                # Normalize to CNY if needed
+                amount_cny = _to_decimal(amount, 0) * _to_decimal(exchange_rate, 1)
+                unit_cost = abs(amount_cny) / quantity
+                fifo_queue.append((quantity, unit_cost))
+                
+        elif txn_type in DISPOSAL_TYPES:
+            # Remove from FIFO queue
+            remaining_to_sell = abs(_to_decimal(quantity, 0))
+            
+            while remaining_to_sell > 0 and fifo_queue:
+                lot_qty, lot_cost = fifo_queue[0]
+                
+                if lot_qty <= remaining_to_sell:
+                    # Sell entire lot
+                    fifo_queue.popleft()
+                    remaining_to_sell -= lot_qty
+                else:
+                    # Partial sell
+                    fifo_queue[0] = (lot_qty - remaining_to_sell, lot_cost)
+                    remaining_to_sell = Decimal(0)
+            
+            if remaining_to_sell > 0:
+                self.logger.warning(
+                    f"Sell quantity exceeds available shares for {asset_id} on {txn_date}"
+                )
+        
+        # Ignore other transaction types (Dividend_Cash, etc.)
+    
+    @staticmethod
+    def _fifo_position(fifo_queue: deque) -> Tuple[Decimal, Decimal]:
+        """Returns (net_quantity, total_cost_basis) of the remaining lots."""
+        net_quantity = sum(qty for qty, _ in fifo_queue)
+        cost_basis = sum(qty * cost for qty, cost in fifo_queue)
+        return net_quantity, cost_basis
+    
+    @staticmethod
+    def _fifo_columns(transactions: pd.DataFrame) -> Tuple[list, ...]:
+        """Extract the columns the FIFO walk needs as plain Python lists."""
+        n = len(transactions)
+        
+        def column(name, default):
+            if name in transactions.columns:
+                return transactions[name].tolist()
+            return [default] * n
+        
+        return (
+            column('Asset_ID', None),
+            transactions['date'].tolist(),
+            column('Transaction_Type', None),
+            column('Quantity', 0),
+            column('Amount_Net', 0),
+            column('Exchange_Rate', 1),
+        )
+    
+    @staticmethod
+    def _sum_acquisitions(transactions: pd.DataFrame) -> Tuple[Decimal, Decimal]:
+        """
+        Vectorized FIFO position for an asset with no disposals.
+        
+        Every acquisition lot is still held in full, so the position is the sum
+        of acquired quantities and the cost basis is the sum of their CNY amounts.
+        
+        Args:
+            transactions: DataFrame with Transaction_Type, Quantity, Amount_Net
+                (and optionally Exchange_Rate)
+            
+        Returns:
+            Tuple of (net_quantity, total_cost_basis)
+        """
+        def numeric(name, default):
+            if name not in transactions.columns:
+                return np.full(len(transactions), float(default))
+            values = pd.to_numeric(transactions[name], errors='coerce').to_numpy(dtype=float)
+            # Same fallback as _to_decimal: NULL, NaN and zero take the default
+            return np.where(np.isnan(values) | (values == 0), float(default), values)
+        
+        quantity = numeric('Quantity', 0)
+        amount_cny = numeric('Amount_Net', 0) * numeric('Exchange_Rate', 1)
+        lots = transactions['Transaction_Type'].isin(ACQUISITION_TYPES).to_numpy() & (quantity > 0)
+        
+        net_quantity = Decimal(str(quantity[lots].sum()))
+        cost_basis = Decimal(str(np.abs(amount_cny[lots]).sum()))
+        return net_quantity, cost_basis
+    
     def _calculate_fifo_cost_basis(self, transactions: pd.DataFrame) -> Tuple[Decimal, Decimal]:
         """
         Calculate FIFO cost basis from transaction history.
@@ -364,66 +563,21 @@ class HoldingsCalculator:
         Returns:
             Tuple of (net_quantity, total_cost_basis)
         """
+        # Without disposals every lot survives, so the queue can be skipped
+        if not transactions['Transaction_Type'].isin(DISPOSAL_TYPES).any():
+            return self._sum_acquisitions(transactions)
+        
         # Initialize FIFO queue: each entry is (quantity, unit_cost)
         fifo_queue: deque = deque()
         
-        # Sort transactions: by date, then buys before sells (on same day)
-        # This ensures vests are processed before same-day sells
-        def txn_sort_key(row):
-            txn_type = row['Transaction_Type']
-            # Buys/Vests get priority 0, Sells get priority 1
-            type_priority = 0 if txn_type in ['Buy', 'RSU_Vest', 'Dividend_Reinvest', 'Transfer_In', 'Adjustment_Buy'] else 1
-            return (row['date'], type_priority)
-        
-        sorted_txns = transactions.sort_values(by=['date'], key=lambda x: x)
-        sorted_txns = sorted_txns.assign(_sort_priority=sorted_txns['Transaction_Type'].apply(
-            lambda t: 0 if t in ['Buy', 'RSU_Vest', 'Dividend_Reinvest', 'Transfer_In', 'Adjustment_Buy'] else 1
-        )).sort_values(by=['date', '_sort_priority']).drop(columns=['_sort_priority'])
-        
         # Process transactions in chronological order (buys before sells on same day)
-        for _, txn in sorted_txns.iterrows():
-            txn_type = txn['Transaction_Type']
-            quantity = Decimal(str(txn.get('Quantity', 0) or 0))
-            amount = Decimal(str(txn.get('Amount_Net', 0) or 0))
-            
-            # Normalize to CNY if needed
-            exchange_rate = Decimal(str(txn.get('Exchange_Rate', 1) or 1))
-            amount_cny = amount * exchange_rate
-            
-            if txn_type in ['Buy', 'RSU_Vest', 'Dividend_Reinvest', 'Adjustment_Buy']:
-                # Add to FIFO queue
-                if quantity > 0:
-                    unit_cost = abs(amount_cny) / quantity
-                    fifo_queue.append((quantity, unit_cost))
-                    
-            elif txn_type in ['Sell', 'Transfer_Out', 'Adjustment_Sell']:
-                # Remove from FIFO queue
-                remaining_to_sell = abs(quantity)
-                
-                while remaining_to_sell > 0 and fifo_queue:
-                    lot_qty, lot_cost = fifo_queue[0]
-                    
-                    if lot_qty <= remaining_to_sell:
-                        # Sell entire lot
-                        fifo_queue.popleft()
-                        remaining_to_sell -= lot_qty
-                    else:
-                        # Partial sell
-                        fifo_queue[0] = (lot_qty - remaining_to_sell, lot_cost)
-                        remaining_to_sell = Decimal(0)
-                
-                if remaining_to_sell > 0:
-                    self.logger.warning(
-                        f"Sell quantity exceeds available shares for {txn['Asset_ID']} on {txn['date']}"
-                    )
-            
-            # Ignore other transaction types (Dividend_Cash, etc.)
-        
-        # Calculate final position
-        net_quantity = sum(qty for qty, _ in fifo_queue)
-        cost_basis = sum(qty * cost for qty, cost in fifo_queue)
+        sorted_txns = self._sort_for_fifo(transactions)
+        for asset_id, txn_date, txn_type, quantity, amount, exchange_rate in zip(*self._fifo_columns(sorted_txns)):
+            self._apply_fifo_transaction(
+                fifo_queue, asset_id, txn_date, txn_type, quantity, amount, exchange_rate
+            )
         
-        return net_quantity, cost_basis
+        return self._fifo_position(fifo_queue)
     
     def calculate_historical_holdings(
         self, 
@@ -432,6 +586,10 @@ class HoldingsCalculator:
         """
         Calculate holdings for multiple historical dates (batch operation).
         
+        Transactions are loaded once and swept forward in date order. Each
+        asset's FIFO queue carries over from one requested date to the next,
+        so the whole history costs a single pass over the transaction log.
+        
         Args:
             dates: List of dates to calculate holdings for
             
@@ -439,10 +597,69 @@ class HoldingsCalculator:
             Dictionary mapping date to holdings DataFrame
         """
         holdings_history = {}
+        target_dates = sorted(set(dates))
+        if not target_dates:
+            return holdings_history
         
-        for target_date in sorted(dates):
-            self.logger.info(f"Calculating holdings for {target_date}...")
-            holdings_df = self.calculate_current_holdings(target_date)
-            holdings_history[target_date] = holdings_df
+        self.logger.info(
+            f"Calculating holdings for {len(target_dates)} dates "
+            f"({target_dates[0]} to {target_dates[-1]})..."
+        )
+        transactions_df = self._get_transactions_up_to_date(target_dates[-1])
+        
+        if transactions_df.empty:
+            self.logger.warning("No transactions found")
+            return {target_date: pd.DataFrame() for target_date in target_dates}
+        
+        # Assets in order of first appearance, as calculate_current_holdings lists them
+        first_txns = transactions_df.drop_duplicates(subset='Asset_ID')
+        first_dates = first_txns['date'].values
+        asset_order = first_txns['Asset_ID'].tolist()
+        asset_metadata = {}
+        
+        sorted_txns = self._sort_for_fifo(transactions_df)
+        txn_dates = sorted_txns['date'].values
+        columns = self._fifo_columns(sorted_txns)
+        fifo_queues: Dict[str, deque] = {asset_id: deque() for asset_id in asset_order}
+        
+        # Manual balance sheet assets come from the latest snapshot, same for every date
+        balance_sheet_holdings: Dict[str, Dict] = {}
+        self._sync_balance_sheet_holdings(balance_sheet_holdings)
+        
+        position = 0
+        for target_date in target_dates:
+            cutoff = np.datetime64(pd.Timestamp(target_date))
+            
+            # Advance the sweep line through transactions dated on or before target_date
+            end = int(np.searchsorted(txn_dates, cutoff, side='right'))
+            for i in range(position, end):
+                self._apply_fifo_transaction(
+                    fifo_queues[columns[0][i]], columns[0][i], columns[1][i],
+                    columns[2][i], columns[3][i], columns[4][i], columns[5][i]
+                )
+            position = end
+            
+            active_assets = asset_order[:int(np.searchsorted(first_dates, cutoff, side='right'))]
+            if not active_assets:
+                holdings_history[target_date] = pd.DataFrame()
+                continue
+            
+            self.price_service.get_batch_latest_prices(active_assets, target_date)
+            
+            current_holdings_map = {}
+            for index, asset_id in enumerate(active_assets):
+                if asset_id not in asset_metadata:
+                    asset_metadata[asset_id] = self._resolve_asset_metadata(
+                        asset_id, first_txns.iloc[index]
+                    )
+                quantity, cost_basis = self._fifo_position(fifo_queues[asset_id])
+                holding = self._build_holding_record(
+                    asset_id, asset_metadata[asset_id], quantity, cost_basis, target_date
+                )
+                if holding and holding['Quantity'] > 0:
+                    current_holdings_map[asset_id] = holding
+            
+            current_holdings_map.update(balance_sheet_holdings)
+            holdings_history[target_date] = self._build_holdings_frame(current_holdings_map)
         
         return holdings_history
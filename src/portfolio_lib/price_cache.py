@@ -0,0 +1,301 @@
+# File path: src/portfolio_lib/price_cache.py
+"""
+Price Cache - Shared, bounded price cache for PriceService.
+
+Entries are keyed by (asset_id, as_of_date) and remember the source they were
+resolved from. Only sources that resolve the same way for every caller belong
+here (NAV, holdings, live quotes); prices read from a caller's own files stay
+with that caller. Each source has its own time-to-live: NAV and holdings prices
+for a date rarely change, live quotes go stale within minutes. The in-memory
+cache is an LRU bounded by entry count.
+
+With PRICE_CACHE_PATH set, entries are also written to a small SQLite side
+database, so restarts and other processes (web workers, scripts) start warm.
+Only resolved prices are cached; "no price" results stay with the caller.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src.database.bulk_sync import KEY_LOOKUP_CHUNK_SIZE, chunked
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Seconds a price stays valid, by source (matched on prefix, e.g. google_finance_NASDAQ)
+SOURCE_TTLS = {
+    'market_data_nav': 24 * 3600,
+    'holdings_table': 24 * 3600,
+    'yfinance_api': 15 * 60,
+    'google_finance': 15 * 60,
+}
+DEFAULT_TTL = 3600
+
+CacheKey = Tuple[str, date]
+
+_STORE_COLUMNS = ['asset_id', 'as_of_date', 'price', 'source', 'stored_at']
+
+
+def source_ttl(source: str) -> float:
+    """Time-to-live in seconds for prices from a source."""
+    for prefix, ttl in SOURCE_TTLS.items():
+        if source.startswith(prefix):
+            return ttl
+    return DEFAULT_TTL
+
+
+@dataclass
+class CachedPrice:
+    """A resolved price and where/when it came from."""
+    price: Decimal
+    source: str
+    stored_at: float
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) - self.stored_at < source_ttl(self.source)
+
+
+class PriceCache:
+    """Thread-safe LRU of prices with per-source TTLs and optional SQLite persistence."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, persist_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Maximum number of prices kept in memory
+            persist_path: SQLite file for the on-disk copy (None keeps the cache in memory only)
+        """
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._entries: 'OrderedDict[CacheKey, CachedPrice]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        if persist_path:
+            self._open_store(persist_path)
+
+    def _open_store(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            columns = [row[1] for row in self._db.execute('PRAGMA table_info(price_cache)')]
+            if columns and columns != _STORE_COLUMNS:
+                self._db.execute('DROP TABLE price_cache')  # Written with another layout
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS price_cache ('
+                ' asset_id TEXT NOT NULL, as_of_date TEXT NOT NULL, price TEXT NOT NULL,'
+                ' source TEXT NOT NULL, stored_at REAL NOT NULL,'
+                ' PRIMARY KEY (asset_id, as_of_date))'
+            )
+            # Nothing outlives the longest TTL
+            self._db.execute('DELETE FROM price_cache WHERE stored_at < ?',
+                             (time.time() - max(SOURCE_TTLS.values()),))
+            logger.info(f"Price cache persisted to {path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Price cache persistence disabled ({path}): {e}")
+            self._db = None
+
+    def get(self, asset_id: str, as_of_date: date) -> Optional[CachedPrice]:
+        """Returns the cached price if present and fresh, otherwise None."""
+        return self.get_many([(asset_id, as_of_date)]).get((asset_id, as_of_date))
+
+    def get_many(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, CachedPrice]:
+        """
+        Fresh cached prices for the given (asset_id, as_of_date) keys.
+
+        Keys missing from memory are looked up on disk in one query per date.
+
+        Returns:
+            Dictionary of the keys that were found (missing keys are omitted)
+        """
+        now = time.time()
+        found: Dict[CacheKey, CachedPrice] = {}
+        missing: List[CacheKey] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and not entry.is_fresh(now):
+                    del self._entries[key]
+                    self.expired += 1
+                    entry = None
+                if entry is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry
+            self.hits += len(found)
+
+            if missing and self._db is not None:
+                for key, entry in self._load(missing).items():
+                    if entry.is_fresh(now):
+                        found[key] = entry
+                        self._store(key, entry)
+                        self.disk_hits += 1
+                missing = [key for key in missing if key not in found]
+            self.misses += len(missing)
+        return found
+
+    def put(self, asset_id: str, as_of_date: date, price: Decimal, source: str) -> None:
+        """Cache one resolved price."""
+        self.put_many({(asset_id, as_of_date): (price, source)})
+
+    def put_many(self, prices: Dict[CacheKey, Tuple[Decimal, str]]) -> None:
+        """
+        Cache resolved prices (one disk transaction for all of them).
+
+        Args:
+            prices: (asset_id, as_of_date) -> (price, source)
+        """
+        if not prices:
+            return
+        now = time.time()
+        entries = {key: CachedPrice(price, source, now) for key, (price, source) in prices.items()}
+        with self._lock:
+            for key, entry in entries.items():
+                self._store(key, entry)
+            if self._db is not None:
+                try:
+                    with self._transaction():
+                        self._db.executemany(
+                            'INSERT OR REPLACE INTO price_cache VALUES (?, ?, ?, ?, ?)',
+                            [(aid, d.isoformat(), str(e.price), e.source, e.stored_at) for (aid, d), e in entries.items()]
+                        )
+                except sqlite3.Error as e:
+                    logger.debug(f"Error persisting prices: {e}")
+
+    def invalidate(self, asset_ids: Optional[Iterable[str]] = None, sources: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop cached prices for some assets and/or sources (both None clears everything).
+
+        Args:
+            asset_ids: Only drop prices of these assets
+            sources: Only drop prices from these sources (prefix match)
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        asset_ids = set(asset_ids) if asset_ids is not None else None
+        sources = tuple(sources) if sources is not None else None
+
+        def matches(asset_id: str, source: str) -> bool:
+            return ((asset_ids is None or asset_id in asset_ids) and
+                    (sources is None or source.startswith(sources)))
+
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if matches(key[0], entry.source)]
+            for key in stale:
+                del self._entries[key]
+            if self._db is not None:
+                try:
+                    with self._transaction():
+                        if asset_ids is None and sources is None:
+                            self._db.execute('DELETE FROM price_cache')
+                        else:
+                            rows = self._db.execute('SELECT asset_id, as_of_date, source FROM price_cache').fetchall()
+                            self._db.executemany(
+                                'DELETE FROM price_cache WHERE asset_id = ? AND as_of_date = ?',
+                                [(aid, d) for aid, d, source in rows if matches(aid, source)]
+                            )
+                except sqlite3.Error as e:
+                    logger.debug(f"Error invalidating persisted prices: {e}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached price (memory and disk)."""
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss/expiry/eviction counters."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'persistent': self._db is not None,
+            }
+
+    def _store(self, key: CacheKey, entry: CachedPrice) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, keys: List[CacheKey]) -> Dict[CacheKey, CachedPrice]:
+        by_date: Dict[date, List[str]] = {}
+        for asset_id, as_of_date in keys:
+            by_date.setdefault(as_of_date, []).append(asset_id)
+
+        loaded = {}
+        try:
+            for as_of_date, asset_ids in by_date.items():
+                for chunk in chunked(asset_ids, KEY_LOOKUP_CHUNK_SIZE):
+                    rows = self._db.execute(
+                        'SELECT asset_id, price, source, stored_at FROM price_cache'
+                        f' WHERE as_of_date = ? AND asset_id IN ({",".join("?" * len(chunk))})',
+                        [as_of_date.isoformat(), *chunk]
+                    )
+                    for asset_id, price, source, stored_at in rows:
+                        loaded[(asset_id, as_of_date)] = CachedPrice(Decimal(price), source, stored_at)
+        except sqlite3.Error as e:
+            logger.debug(f"Error reading persisted prices: {e}")
+        return loaded
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN/COMMIT (ROLLBACK on error) around a block of statements."""
+        self._db.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except Exception:
+            self._db.execute('ROLLBACK')
+            raise
+        self._db.execute('COMMIT')
+
+
+_price_cache: Optional[PriceCache] = None
+_price_cache_lock = threading.Lock()
+
+
+def get_price_cache() -> PriceCache:
+    """
+    Process-wide cache shared by all PriceService instances.
+
+    Configured from the environment on first use:
+    PRICE_CACHE_PATH (SQLite file, relative to the project root; unset keeps it in
+    memory only) and PRICE_CACHE_MAX_ENTRIES.
+    """
+    global _price_cache
+    with _price_cache_lock:
+        if _price_cache is None:
+            path = os.getenv('PRICE_CACHE_PATH') or None
+            if path and not os.path.isabs(path):
+                project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+                path = os.path.join(project_root, path)
+            max_entries = int(os.getenv('PRICE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+            _price_cache = PriceCache(max_entries=max_entries, persist_path=path)
+        return _price_cache
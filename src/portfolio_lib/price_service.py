@@ -17,10 +17,18 @@ import pandas as pd
 import time
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, Set
+
+from sqlalchemy import func, select
 
 from src.database.base import get_session
+from src.database.bulk_sync import KEY_LOOKUP_CHUNK_SIZE, chunked
 from src.database.models import Holding
+from src.portfolio_lib.price_cache import PriceCache, get_price_cache
+
+# Sources read from the DataManager's own files: these prices are never put in the
+# shared cache, so a new CSV or Excel file is picked up by the next PriceService
+INSTANCE_PRICE_SOURCES = ('schwab_csv_fallback', 'excel_fallback')
 
 
 class PriceService:
@@ -35,22 +43,30 @@ class PriceService:
     5. None (if unavailable)
     """
     
-    def __init__(self, db_session=None, data_manager=None):
+    def __init__(self, db_session=None, data_manager=None, price_cache: Optional[PriceCache] = None):
         """
         Initialize price service.
         
         Args:
             db_session: SQLAlchemy session (optional, creates new if None)
             data_manager: DataManager instance for Excel fallback (optional)
+            price_cache: Price cache to use (optional, defaults to the shared process-wide cache)
         """
         self.logger = logging.getLogger(__name__)
         self.session = db_session or get_session()
         self.data_manager = data_manager
         
-        # Cache for prices to avoid repeated queries
-        self._price_cache: Dict[Tuple[str, date], Optional[Decimal]] = {}
+        # Resolved prices, shared between instances (TTL per source, LRU bounded).
+        # Prices from INSTANCE_PRICE_SOURCES are only kept in _instance_prices.
+        self._price_cache = price_cache or get_price_cache()
+        self._instance_prices: Dict[Tuple[str, date], Decimal] = {}
+        # Assets without a price from this instance's sources (not shared: they depend on data_manager)
+        self._unavailable: Set[Tuple[str, date]] = set()
         # Cache for assets where API fetch failed (to avoid retries)
         self._api_unavailable_cache = set()
+        # Per-asset latest prices from DataManager sources, indexed on first use
+        self._schwab_prices: Optional[Dict[str, Decimal]] = None
+        self._excel_prices: Optional[Dict[str, Decimal]] = None
         
     def get_latest_price(self, asset_id: str, as_of_date: Optional[date] = None) -> Optional[Decimal]:
         """
@@ -68,8 +84,18 @@ class PriceService:
             
         # Check cache first
         cache_key = (asset_id, as_of_date)
-        if cache_key in self._price_cache:
-            return self._price_cache[cache_key]
+        cached = self._price_cache.get(asset_id, as_of_date)
+        if cached is not None:
+            # Only a NAV price outranks this instance's Schwab CSV price
+            if self.data_manager and cached.source != 'market_data_nav':
+                schwab_price, _ = self._get_price_from_schwab_csv(asset_id, as_of_date)
+                if schwab_price is not None:
+                    return schwab_price
+            return cached.price
+        if cache_key in self._instance_prices:
+            return self._instance_prices[cache_key]
+        if cache_key in self._unavailable:
+            return None
         
         # Try each source in priority order
         price = None
@@ -104,11 +130,14 @@ class PriceService:
             price, source = self._get_price_from_excel(asset_id)
         
         # Cache the result
-        self._price_cache[cache_key] = price
-        
         if price is not None:
+            if source.startswith(INSTANCE_PRICE_SOURCES):
+                self._instance_prices[cache_key] = price
+            else:
+                self._price_cache.put(asset_id, as_of_date, price, source)
             self.logger.debug(f"Price for {asset_id} on {as_of_date}: {price} (source: {source})")
         else:
+            self._unavailable.add(cache_key)
             # Only log warning if it's not a known manual asset (like Insurance/Gold which might not have prices yet)
             self.logger.debug(f"No price available for {asset_id} on {as_of_date}")
         
@@ -118,6 +147,12 @@ class PriceService:
         """
         Get latest prices for multiple assets (batch operation for efficiency).
         
+        Resolves all uncached assets source by source with the same priority as
+        get_latest_price: one windowed query on market_data_nav, the indexed
+        Schwab CSV table, Google Finance (US stocks only), one windowed query on
+        holdings, then the indexed Excel holdings table. Resolved prices are
+        stored in the price cache in one step (except INSTANCE_PRICE_SOURCES).
+        
         Args:
             asset_ids: List of asset identifiers
             as_of_date: Date to get prices for (defaults to today)
@@ -128,49 +163,164 @@ class PriceService:
         if as_of_date is None:
             as_of_date = date.today()
         
-        prices = {}
-        
-        # 1. Identify US stocks for batch API fetch
-        us_stocks = [aid for aid in asset_ids if self._is_us_stock(aid)]
-        other_assets = [aid for aid in asset_ids if aid not in us_stocks]
-        
-        # 2. Batch fetch US stocks
-        if us_stocks:
-            self.logger.info(f"Batch fetching prices for {len(us_stocks)} US stocks...")
+        keys = [(aid, as_of_date) for aid in dict.fromkeys(asset_ids)]
+        schwab_prices = self._get_schwab_price_table() if self.data_manager else {}
+        prices = {
+            # Only a NAV price outranks this instance's Schwab CSV price
+            aid: schwab_prices[aid] if aid in schwab_prices and cached.source != 'market_data_nav' else cached.price
+            for (aid, _), cached in self._price_cache.get_many(keys).items()
+        }
+        prices.update({aid: self._instance_prices[(aid, d)] for aid, d in keys
+                       if aid not in prices and (aid, d) in self._instance_prices})
+        pending = [aid for aid, _ in keys if aid not in prices and (aid, as_of_date) not in self._unavailable]
+        if pending:
+            self.logger.debug(f"Batch resolving prices for {len(pending)} assets as of {as_of_date}")
+            resolved: Dict[str, Tuple[Decimal, str]] = {}
+            
+            def unresolved() -> List[str]:
+                return [aid for aid in pending if aid not in resolved]
+            
+            # 1. market_data_nav table (CN funds with API)
+            nav_prices = self._get_batch_prices_from_nav_table(pending, as_of_date)
+            resolved.update({aid: (price, "market_data_nav") for aid, price in nav_prices.items()})
             
-            # Check cache first to avoid re-fetching known assets
-            uncached_stocks = [aid for aid in us_stocks if (aid, as_of_date) not in self._price_cache and (aid, as_of_date) not in self._api_unavailable_cache]
+            # 2. Schwab CSV fallback
+            if self.data_manager:
+                resolved.update({aid: (schwab_prices[aid], "schwab_csv_fallback") for aid in unresolved() if aid in schwab_prices})
             
-            # DISABLED API batch fetch
-            # if uncached_stocks:
-            #     api_prices = self._get_batch_prices_from_api(uncached_stocks, as_of_date)
-            #     prices.update(api_prices)
-            #     
-            #     # Update caches
-            #     for aid in uncached_stocks:
-            #         price = api_prices.get(aid)
-            #         if price is not None:
-            #             self._price_cache[(aid, as_of_date)] = price
-            #         else:
-            #             # Mark as unavailable in API so we don't retry individually
-            #             self._api_unavailable_cache.add((aid, as_of_date))
+            # 3. External API disabled (rate limits); 4. Google Finance scraper for US stocks
+            for aid in unresolved():
+                if self._is_us_stock(aid):
+                    price, source = self._get_price_from_google_finance(aid)
+                    if price is not None:
+                        resolved[aid] = (price, source)
             
-            # Retrieve from cache for all US stocks
-            for aid in us_stocks:
-                if (aid, as_of_date) in self._price_cache:
-                    prices[aid] = self._price_cache[(aid, as_of_date)]
+            # 5. Latest holdings table
+            remaining = unresolved()
+            if remaining:
+                holdings_prices = self._get_batch_prices_from_holdings(remaining, as_of_date)
+                resolved.update({aid: (price, "holdings_table") for aid, price in holdings_prices.items()})
+            
+            # 6. Excel fallback (via DataManager general holdings)
+            if self.data_manager:
+                excel_prices = self._get_excel_price_table()
+                resolved.update({aid: (excel_prices[aid], "excel_fallback") for aid in unresolved() if aid in excel_prices})
+            
+            self._price_cache.put_many({
+                (aid, as_of_date): (price, source) for aid, (price, source) in resolved.items()
+                if not source.startswith(INSTANCE_PRICE_SOURCES)
+            })
+            self._unavailable.update((aid, as_of_date) for aid in unresolved())
+            self._instance_prices.update({
+                (aid, as_of_date): price for aid, (price, source) in resolved.items()
+                if source.startswith(INSTANCE_PRICE_SOURCES)
+            })
+            prices.update({aid: price for aid, (price, _) in resolved.items()})
+            self.logger.debug(f"Resolved {len(resolved)}/{len(pending)} prices as of {as_of_date}")
+        
+        return {aid: prices.get(aid) for aid in asset_ids}
+
+    def _get_batch_prices_from_nav_table(self, asset_ids: List[str], as_of_date: date) -> Dict[str, Decimal]:
+        """
+        Latest NAV <= as_of_date for each asset, one windowed query per chunk of IDs.
         
-        # 3. Fetch others one by one (will use cache if available)
-        for asset_id in other_assets:
-            prices[asset_id] = self.get_latest_price(asset_id, as_of_date)
+        Returns:
+            Dictionary mapping asset_id to NAV (assets without NAV are omitted)
+        """
+        try:
+            from ..database.models import MarketDataNAV
             
-        # 4. Fill in missing US stocks (fallback to other sources)
-        # get_latest_price will skip API check because we added to _api_unavailable_cache
-        for asset_id in us_stocks:
-            if asset_id not in prices or prices[asset_id] is None:
-                prices[asset_id] = self.get_latest_price(asset_id, as_of_date)
-                
-        return prices
+            prices = {}
+            for chunk in chunked(asset_ids, KEY_LOOKUP_CHUNK_SIZE):
+                prices.update(self._latest_values(
+                    MarketDataNAV.asset_id, MarketDataNAV.date, MarketDataNAV.nav,
+                    MarketDataNAV.asset_id.in_(chunk),
+                    MarketDataNAV.date <= as_of_date
+                ))
+            return prices
+        except ImportError:
+            self.logger.debug("market_data_nav table not found in models")
+        except Exception as e:
+            self.logger.debug(f"Error batch fetching prices from NAV table: {e}")
+        return {}
+
+    def _get_batch_prices_from_holdings(self, asset_ids: List[str], as_of_date: date) -> Dict[str, Decimal]:
+        """
+        Latest non-null holdings price <= as_of_date for each asset (windowed query per chunk).
+        
+        Returns:
+            Dictionary mapping asset_id to price (assets without a price are omitted)
+        """
+        prices = {}
+        try:
+            for chunk in chunked(asset_ids, KEY_LOOKUP_CHUNK_SIZE):
+                prices.update(self._latest_values(
+                    Holding.asset_id, Holding.snapshot_date, Holding.current_price,
+                    Holding.asset_id.in_(chunk),
+                    Holding.snapshot_date <= as_of_date,
+                    Holding.current_price.isnot(None)
+                ))
+        except Exception as e:
+            self.logger.debug(f"Error batch fetching prices from holdings: {e}")
+        # A zero price is treated as missing, as in _get_price_from_holdings
+        return {aid: price for aid, price in prices.items() if price}
+
+    def _latest_values(self, key_col, date_col, value_col, *conditions) -> Dict[str, Decimal]:
+        """Value of the most recent row per key (ROW_NUMBER() window over date_col desc)."""
+        rank = func.row_number().over(partition_by=key_col, order_by=date_col.desc()).label('rank')
+        ranked = select(key_col.label('key'), value_col.label('value'), rank).where(*conditions).subquery()
+        rows = self.session.execute(select(ranked.c.key, ranked.c.value).where(ranked.c.rank == 1))
+        return {key: Decimal(str(value)) for key, value in rows if value is not None}
+
+    def _get_schwab_price_table(self) -> Dict[str, Decimal]:
+        """
+        Latest Market_Price_Unit per Asset_ID from the cleaned Schwab CSV data.
+        
+        Built once from DataManager and kept until clear_cache().
+        """
+        if self._schwab_prices is None:
+            self._schwab_prices = {}
+            try:
+                schwab_df = self.data_manager.cleaned_data.get('schwab_holdings') if self.data_manager else None
+                if schwab_df is not None and not schwab_df.empty and 'Market_Price_Unit' in schwab_df.columns:
+                    if 'Snapshot_Date' in schwab_df.columns:
+                        schwab_df = schwab_df.sort_values('Snapshot_Date', kind='stable')
+                    latest = schwab_df.drop_duplicates('Asset_ID', keep='last')
+                    self._schwab_prices = {
+                        aid: Decimal(str(price))
+                        for aid, price in zip(latest['Asset_ID'], latest['Market_Price_Unit'])
+                        if pd.notna(price)
+                    }
+            except Exception as e:
+                self.logger.debug(f"Error indexing Schwab CSV prices: {e}")
+        return self._schwab_prices
+
+    def _get_excel_price_table(self) -> Dict[str, Decimal]:
+        """
+        Most recent price per Asset_ID from the Excel holdings (DataManager).
+        
+        Built once from DataManager and kept until clear_cache().
+        """
+        if self._excel_prices is None:
+            self._excel_prices = {}
+            try:
+                holdings_df = self.data_manager.get_holdings() if self.data_manager else None
+                if holdings_df is not None and not holdings_df.empty:
+                    if 'Asset_ID' in holdings_df.index.names:
+                        asset_ids = holdings_df.index.get_level_values('Asset_ID')
+                    else:
+                        asset_ids = pd.Index(holdings_df['Asset_ID'])
+                    price_col = 'Market_Price_Unit' if 'Market_Price_Unit' in holdings_df.columns else 'current_price'
+                    if price_col in holdings_df.columns:
+                        latest = ~asset_ids.duplicated(keep='last')
+                        self._excel_prices = {
+                            aid: Decimal(str(price))
+                            for aid, price in zip(asset_ids[latest], holdings_df[price_col].to_numpy()[latest])
+                            if pd.notna(price)
+                        }
+            except Exception as e:
+                self.logger.debug(f"Error indexing Excel holdings prices: {e}")
+        return self._excel_prices
 
     def _is_us_stock(self, asset_id: str) -> bool:
         """Check if asset ID looks like a US stock ticker (alphabetic, 1-5 chars)."""
@@ -350,35 +500,12 @@ class PriceService:
         Fetch price directly from cleaned Schwab CSV data in DataManager.
         This is a robust fallback when API fails.
         """
-        try:
-            if self.data_manager is None:
-                return None, "unavailable"
-                
-            # Access cleaned Schwab holdings directly
-            schwab_df = self.data_manager.cleaned_data.get('schwab_holdings')
-            
-            if schwab_df is None or schwab_df.empty:
-                return None, "unavailable"
-                
-            # Filter for asset
-            asset_rows = schwab_df[schwab_df['Asset_ID'] == asset_id]
-            
-            if asset_rows.empty:
-                return None, "unavailable"
-                
-            # Sort by date if available, otherwise take the first one
-            # Schwab CSV usually represents a single snapshot
-            if 'Snapshot_Date' in asset_rows.columns:
-                asset_rows = asset_rows.sort_values('Snapshot_Date')
-                
-            latest_row = asset_rows.iloc[-1]
-            
-            if 'Market_Price_Unit' in latest_row and pd.notna(latest_row['Market_Price_Unit']):
-                return Decimal(str(latest_row['Market_Price_Unit'])), "schwab_csv_fallback"
-                
-        except Exception as e:
-            self.logger.debug(f"Error fetching price from Schwab CSV for {asset_id}: {e}")
-            
+        if self.data_manager is None:
+            return None, "unavailable"
+        
+        price = self._get_schwab_price_table().get(asset_id)
+        if price is not None:
+            return price, "schwab_csv_fallback"
         return None, "unavailable"
     
     def _get_price_from_holdings(self, asset_id: str, as_of_date: date) -> Tuple[Optional[Decimal], str]:
@@ -410,39 +537,29 @@ class PriceService:
         Returns:
             Tuple of (price, source_name)
         """
-        try:
-            if self.data_manager is None:
-                return None, "unavailable"
-            
-            # Get latest holdings from Excel
-            holdings_df = self.data_manager.get_holdings()
-            
-            if holdings_df.empty:
-                return None, "unavailable"
-            
-            # Filter for the specific asset
-            if 'Asset_ID' in holdings_df.index.names:
-                # MultiIndex: (Date, Asset_ID)
-                asset_holdings = holdings_df.xs(asset_id, level='Asset_ID', drop_level=False)
-            else:
-                # Single index
-                asset_holdings = holdings_df[holdings_df.get('Asset_ID') == asset_id]
-            
-            if asset_holdings.empty:
-                return None, "unavailable"
-            
-            # Get the most recent price
-            latest = asset_holdings.iloc[-1]
-            price_col = 'Market_Price_Unit' if 'Market_Price_Unit' in latest else 'current_price'
-            
-            if price_col in latest and pd.notna(latest[price_col]):
-                return Decimal(str(latest[price_col])), "excel_fallback"
-        except Exception as e:
-            self.logger.debug(f"Error fetching price from Excel for {asset_id}: {e}")
+        if self.data_manager is None:
+            return None, "unavailable"
         
+        price = self._get_excel_price_table().get(asset_id)
+        if price is not None:
+            return price, "excel_fallback"
         return None, "unavailable"
     
-    def clear_cache(self):
-        """Clear the price cache (useful when data is updated)."""
-        self._price_cache.clear()
+    def clear_cache(self, asset_ids: Optional[List[str]] = None, sources: Optional[List[str]] = None):
+        """
+        Clear cached prices and indexed source tables (useful when data is updated).
+        
+        Args:
+            asset_ids: Only drop prices of these assets (default: all)
+            sources: Only drop prices from these sources, e.g. ['market_data_nav'] (default: all)
+        """
+        self._price_cache.invalidate(asset_ids=asset_ids, sources=sources)
+        self._unavailable.clear()
+        self._instance_prices.clear()
+        self._schwab_prices = None
+        self._excel_prices = None
         self.logger.debug("Price cache cleared")
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss/expiry counters of the price cache."""
+        return self._price_cache.stats()
@@ -315,55 +315,38 @@ def build_twr_data(data_manager: 'DataManager') -> str:
         if len(portfolio_series) < 2:
             return '{"dates": [], "twr_values": [], "message": "Insufficient data for TWR calculation"}'
         
-        # Identify cash flow dates (transactions that affect portfolio value)
-        cash_flow_dates = set()
+        # Aggregate cash flows by month once (transactions that affect portfolio value)
+        monthly_flows = pd.Series(dtype=float)
         if transactions is not None and not transactions.empty:
             # Filter for transactions that represent cash flows (Buy/Sell but not dividends reinvested)
             cash_flow_transactions = transactions[
                 transactions['Transaction_Type'].isin(['Buy', 'Sell', 'RSU_Vest', 'Premium_Payment'])
-            ].copy()
-            
-            # Get dates and aggregate by month-end
+            ]
             if not cash_flow_transactions.empty:
-                cash_flow_dates = set(pd.to_datetime(cash_flow_transactions.index).to_period('M').to_timestamp('M'))
+                monthly_flows = cash_flow_transactions.groupby(
+                    pd.to_datetime(cash_flow_transactions.index).to_period('M')
+                )['Amount_Net'].sum()
         
-        logger.info(f"Identified {len(cash_flow_dates)} cash flow periods for TWR calculation")
+        logger.info(f"Identified {len(monthly_flows)} cash flow periods for TWR calculation")
         
-        # Calculate sub-period returns
-        dates = []
-        twr_values = []
-        cumulative_twr = 1.0
+        # Negative Amount_Net = outflow (investment), positive = inflow (sale), so the
+        # external flow into the portfolio for each period is -Amount_Net
+        period_flows = pd.Series(
+            -portfolio_series.index.to_period('M').map(monthly_flows).fillna(0.0).to_numpy(dtype=float),
+            index=portfolio_series.index
+        )
         
-        for i in range(1, len(portfolio_series)):
-            curr_date = portfolio_series.index[i]
-            prev_value = portfolio_series.iloc[i-1]
-            curr_value = portfolio_series.iloc[i]
-            
-            # Calculate holding period return
-            if prev_value > 0:
-                # If there was a cash flow in this period, adjust for it
-                if curr_date in cash_flow_dates:
-                    # Get cash flows for this period
-                    period_flows = transactions[
-                        (transactions.index.to_period('M') == pd.Period(curr_date, 'M')) &
-                        (transactions['Transaction_Type'].isin(['Buy', 'Sell', 'RSU_Vest', 'Premium_Payment']))
-                    ]['Amount_Net'].sum() if transactions is not None else 0.0
-                    
-                    # Adjust return for cash flows: HPR = (End_Value - Cash_Flow) / Start_Value - 1
-                    # Negative Amount_Net = outflow (investment), positive = inflow (sale)
-                    adjusted_end_value = curr_value + period_flows  # Add back outflows, subtract inflows
-                    hpr = (adjusted_end_value / prev_value) - 1
-                else:
-                    # No cash flow, simple return
-                    hpr = (curr_value / prev_value) - 1
-                
-                # Accumulate TWR
-                cumulative_twr *= (1 + hpr)
-            
-            date_str = curr_date.strftime('%Y-%m') if hasattr(curr_date, 'strftime') else str(curr_date)[:7]
-            dates.append(date_str)
-            # Convert to percentage
-            twr_values.append(float((cumulative_twr - 1) * 100))
+        # Calculate sub-period returns and link them geometrically
+        from src.financial_analysis.metrics import FinancialMetrics
+        twr_series = FinancialMetrics().calculate_twr(portfolio_series, daily_flows=period_flows)
+        
+        dates = [
+            curr_date.strftime('%Y-%m') if hasattr(curr_date, 'strftime') else str(curr_date)[:7]
+            for curr_date in twr_series.index
+        ]
+        # Convert to percentage
+        twr_values = (twr_series * 100).astype(float).tolist()
+        cash_flow_dates = monthly_flows.index
         
         twr_data = {
             'dates': dates,
@@ -0,0 +1,53 @@
+"""
+One-shot migration of flat holdings snapshots into the partitioned Parquet store.
+
+Reads every holdings_snapshot_YYYYMMDD.xlsx/.csv/.parquet file in the configured
+historical_data.snapshots_directory and writes it to holdings_dataset/year=/month=.
+Afterwards set historical_data.storage_format to "parquet_dataset".
+
+Usage:
+    python src/scripts/convert_snapshots_to_parquet.py [--config config/settings.yaml] [--remove-source]
+"""
+
+import argparse
+import os
+import sys
+
+# Ensure project root is in path
+project_root = os.getcwd()
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.data_manager.readers import load_settings
+from src.data_manager import snapshot_store
+
+
+def convert_snapshots(config_path: str, remove_source: bool = False) -> int:
+    """Convert the configured snapshot directory; returns the number of snapshots written."""
+    settings = load_settings(config_path)
+    snapshots_dir = settings.get('historical_data', {}).get('snapshots_directory', 'data/historical_snapshots/')
+    if not os.path.isabs(snapshots_dir):
+        snapshots_dir = os.path.join(project_root, snapshots_dir)
+
+    if not snapshot_store.pyarrow_available():
+        print("❌ pyarrow is required for the Parquet snapshot store (pip install pyarrow).")
+        return 0
+
+    legacy_files = snapshot_store.find_legacy_snapshots(snapshots_dir)
+    print(f"\n=== CONVERTING {len(legacy_files)} SNAPSHOT FILES IN {snapshots_dir} ===\n")
+
+    store = snapshot_store.SnapshotStore(snapshots_dir)
+    converted = snapshot_store.convert_legacy_snapshots(snapshots_dir, store, remove_source=remove_source)
+
+    print(f"\n✅ DONE! Store now holds {len(store.available_dates())} snapshots ({converted} converted).")
+    if converted:
+        print('   Set historical_data.storage_format to "parquet_dataset" to read from the store.')
+    return converted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert flat holdings snapshots to the partitioned Parquet store")
+    parser.add_argument('--config', default='config/settings.yaml', help='Path to settings.yaml')
+    parser.add_argument('--remove-source', action='store_true', help='Delete each flat file after converting it')
+    args = parser.parse_args()
+    convert_snapshots(args.config, remove_source=args.remove_source)
@@ -38,7 +38,7 @@ def import_schwab_transactions():
     
     # 1. Initialize DataManager in Excel mode to read CSVs
     logger.info("Initializing DataManager to read Schwab CSVs...")
-    dm = DataManager(force_mode='excel')
+    dm = DataManager(force_mode='excel', lazy=True)
     transactions_df = dm.get_transactions()
     
     if transactions_df is None or transactions_df.empty:
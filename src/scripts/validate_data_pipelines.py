@@ -90,7 +90,7 @@ def load_automated_data() -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame
         logger.info("Processing CN Fund automated data...")
         try:
             fund_file = "data/funding_transactions.xlsx"
-            raw_holdings, raw_transactions = read_raw_fund_sheets(fund_file)
+            raw_holdings, raw_transactions = read_raw_fund_sheets(fund_file, load_settings())
             
             if raw_holdings is not None:
                 processed_holdings = process_raw_holdings(raw_holdings)
@@ -17,8 +17,8 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from data_manager.historical_manager import HistoricalDataManager
-from financial_analysis.analyzer import FinancialAnalyzer
-from financial_analysis.cost_basis import calculate_cost_basis_for_portfolio
+from src.financial_analysis.analyzer import FinancialAnalyzer
+from src.financial_analysis.cost_basis import calculate_cost_basis_for_portfolio
 from portfolio_lib.data_integration import PortfolioAnalysisManager
 
 class DataPipeline:
@@ -60,6 +60,12 @@ def create_app(config_object=None):
     # Initialize Stability Manager
     WebStabilityManager(app)
     
+    # Return per-request database sessions to the pool
+    @app.teardown_appcontext
+    def remove_db_session(exception=None):
+        from src.database.base import remove_scoped_session
+        remove_scoped_session()
+    
     # Initialize Babel for I18n
     from flask_babel import Babel
     from flask import request, session
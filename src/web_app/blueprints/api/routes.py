@@ -25,7 +25,7 @@ def list_assets():
 		from src.data_manager.manager import DataManager
 		
 		# Get assets from holdings
-		data_manager = DataManager()
+		data_manager = DataManager(lazy=True)
 		holdings = data_manager.get_holdings()
 		
 		# Get unique Asset_ID and Asset_Name pairs from holdings
@@ -69,7 +69,7 @@ def health_check():
     # Check database connectivity
     try:
         from src.data_manager.manager import DataManager
-        dm = DataManager()
+        dm = DataManager(lazy=True)
         # Simple check - verify config path is set
         if dm.config_path:
             health_status['database'] = 'connected'
@@ -79,6 +79,12 @@ def health_check():
         health_status['database'] = f'error: {str(e)[:50]}'
         health_status['status'] = 'degraded'
 
+    try:
+        from src.database.base import get_pool_stats
+        health_status['db_pool'] = get_pool_stats()
+    except Exception as e:
+        health_status['db_pool'] = f'error: {str(e)[:50]}'
+
     # Check if demo mode
     health_status['demo_mode'] = os.environ.get('DEMO_MODE', 'false').lower() == 'true'
 
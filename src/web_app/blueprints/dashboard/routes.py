@@ -32,7 +32,7 @@ def parity():
 		import pandas as pd
 		
 		# 1. Get Baseline (Excel Mode) - "Truth" from files
-		dm_excel = DataManager(force_mode='excel')
+		dm_excel = DataManager(force_mode='excel', lazy=True)
 		excel_holdings = dm_excel.get_holdings(latest_only=True)
 		
 		excel_total = 0
@@ -53,7 +53,7 @@ def parity():
 				excel_map[str(aid)] = float(val)
 
 		# 2. Get DB Snapshots (Database Mode)
-		dm_db = DataManager(force_mode='database')
+		dm_db = DataManager(force_mode='database', lazy=True)
 		db_holdings = dm_db.get_holdings(latest_only=True)
 		
 		db_total = 0